@@ -9,67 +9,324 @@ SRC_PATH = PROJECT_ROOT / "src"
 sys.path.insert(0, str(SRC_PATH))
 
 import argparse
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+import gzip
+from itertools import groupby
 import logging
+import os
 import shutil
+import subprocess
 import tarfile
+import tempfile
 
 from metrobikeatlas.config.loader import load_config
+from metrobikeatlas.ingestion.bronze import is_bronze_file_name
 from metrobikeatlas.utils.logging import configure_logging
 
 
 logger = logging.getLogger(__name__)
 
+# Below this many input bytes, thread start-up in pgzip costs more than it saves.
+_PARALLEL_GZIP_MIN_BYTES = 1 << 20
+# Tar stream block size and output file buffer for the pure-Python bundling path.
+_TAR_BUFSIZE = 1 << 20
+_OUT_BUFFERING = 4 << 20
+# While pruning, re-read real free disk space after this many deletions.
+_FREE_DISK_RESYNC_EVERY = 100
+
 
 def _parse_ts_from_name(name: str) -> datetime | None:
-    # Bronze files are named like: 20260119T095200Z.json
-    stem = Path(name).stem
+    # Bronze files are named like: 20260119T095200Z.json (or `.json.zst` when compressed)
+    # Fixed-width format, so slice instead of `strptime` (which re-parses the format every call).
+    stem = name.split(".", 1)[0]
+    if len(stem) != 16 or stem[8] != "T" or stem[15] != "Z":
+        return None
+    digits = stem[:8] + stem[9:15]
+    if not (digits.isascii() and digits.isdigit()):
+        return None
     try:
-        dt = datetime.strptime(stem, "%Y%m%dT%H%M%SZ")
-        return dt.replace(tzinfo=timezone.utc)
-    except Exception:
+        return datetime(
+            int(stem[0:4]),
+            int(stem[4:6]),
+            int(stem[6:8]),
+            int(stem[9:11]),
+            int(stem[11:13]),
+            int(stem[13:15]),
+            tzinfo=timezone.utc,
+        )
+    except ValueError:
         return None
 
 
+def _archive_with_tar_pigz(
+    *,
+    rel_names: list[str],
+    out_tar_gz: Path,
+    base_dir: Path,
+    compresslevel: int,
+    threads: int,
+) -> bool:
+    """
+    Bundle via `tar | pigz` when both tools are on PATH (member iteration and DEFLATE stay in C).
+
+    Returns False when the tools are unavailable or the pipeline fails, so callers can fall back
+    to the pure-Python path (e.g. on Windows).
+    """
+
+    tar_bin = shutil.which("tar")
+    pigz_bin = shutil.which("pigz")
+    if os.name != "posix" or not tar_bin or not pigz_bin:
+        return False
+
+    # NUL-separated list so names never need shell quoting and never hit ARG_MAX.
+    with tempfile.NamedTemporaryFile("wb", suffix=".lst", delete=False) as lst:
+        lst.write(b"".join(os.fsencode(name) + b"\0" for name in rel_names))
+    tar: subprocess.Popen[bytes] | None = None
+    pigz: subprocess.Popen[bytes] | None = None
+    try:
+        with out_tar_gz.open("wb") as out:
+            tar = subprocess.Popen(
+                [tar_bin, "-C", str(base_dir), "--null", "-T", lst.name, "-cf", "-"],
+                stdout=subprocess.PIPE,
+            )
+            pigz = subprocess.Popen(
+                [pigz_bin, f"-{int(compresslevel)}", "-p", str(max(int(threads), 1))],
+                stdin=tar.stdout,
+                stdout=out,
+            )
+            # Drop our copy of the pipe so tar sees SIGPIPE if pigz exits early.
+            if tar.stdout is not None:
+                tar.stdout.close()
+            pigz_rc = pigz.wait()
+            tar_rc = tar.wait()
+    except OSError as e:
+        logger.warning("tar|pigz failed to start (%s); falling back to Python tarfile", e)
+        out_tar_gz.unlink(missing_ok=True)
+        return False
+    finally:
+        # Always reap both children (e.g. tar already running when pigz fails to start).
+        if tar is not None and tar.stdout is not None:
+            tar.stdout.close()
+        for proc in (pigz, tar):
+            if proc is not None and proc.poll() is None:
+                proc.kill()
+                proc.wait()
+        os.unlink(lst.name)
+
+    if tar_rc != 0 or pigz_rc != 0:
+        logger.warning("tar|pigz failed (tar=%s pigz=%s); falling back to Python tarfile", tar_rc, pigz_rc)
+        out_tar_gz.unlink(missing_ok=True)
+        return False
+    return True
+
+
 def _archive_files(
     *,
     files: list[Path],
     out_tar_gz: Path,
     base_dir: Path,
     delete_after: bool,
+    compresslevel: int = 6,
+    threads: int = 1,
 ) -> int:
     if not files:
         return 0
     out_tar_gz.parent.mkdir(parents=True, exist_ok=True)
-    with tarfile.open(out_tar_gz, mode="w:gz") as tf:
+
+    rel_names: list[str] = []
+    for p in files:
+        try:
+            rel_names.append(str(p.relative_to(base_dir)))
+        except Exception:
+            break
+    # Write to a temp name and rename on success, so a crash never leaves a truncated bundle at
+    # `out_tar_gz` (sources are only unlinked once the bundle is complete on disk).
+    tmp_out = out_tar_gz.with_name(out_tar_gz.name + ".tmp")
+    try:
+        # `tar -C base_dir` needs every member under base_dir; otherwise use the Python path.
+        external_ok = len(rel_names) == len(files) and _archive_with_tar_pigz(
+            rel_names=rel_names,
+            out_tar_gz=tmp_out,
+            base_dir=base_dir,
+            compresslevel=compresslevel,
+            threads=threads,
+        )
+        archived = list(files) if external_ok else _archive_with_tarfile(
+            files=files,
+            out_tar_gz=tmp_out,
+            base_dir=base_dir,
+            compresslevel=compresslevel,
+            threads=threads,
+        )
+        os.replace(tmp_out, out_tar_gz)
+    except BaseException:
+        tmp_out.unlink(missing_ok=True)
+        raise
+    return _delete_files(archived) if delete_after else 0
+
+
+def _archive_with_tarfile(
+    *,
+    files: list[Path],
+    out_tar_gz: Path,
+    base_dir: Path,
+    compresslevel: int,
+    threads: int,
+) -> list[Path]:
+    """
+    Pure-Python bundling (pgzip when available for large bundles). Returns the members written.
+    """
+
+    total_bytes = 0
+    for p in files:
+        try:
+            total_bytes += int(p.stat().st_size)
+        except Exception:
+            continue
+
+    pgzip = None
+    if total_bytes >= _PARALLEL_GZIP_MIN_BYTES:
+        try:
+            import pgzip  # type: ignore
+        except ModuleNotFoundError:
+            # Optional dependency: fall back to single-threaded stdlib gzip.
+            pgzip = None
+
+    archived: list[Path] = []
+
+    def _add_all(tf: tarfile.TarFile) -> None:
         for p in files:
             try:
                 rel = p.relative_to(base_dir)
             except Exception:
                 rel = p.name
-            tf.add(str(p), arcname=str(rel))
-    if delete_after:
-        deleted = 0
-        for p in files:
+            # Build the header from one stat ourselves; `tf.add` would go through `gettarinfo`
+            # (extra lstat + uid/gid name lookups) for every small JSON member.
             try:
-                p.unlink()
-                deleted += 1
-            except Exception:
+                fp = open(p, "rb")
+            except FileNotFoundError:
+                # Removed concurrently (e.g. collector cleanup); nothing to archive or delete.
                 continue
-        return deleted
-    return 0
+            with fp:
+                st = os.fstat(fp.fileno())
+                ti = tarfile.TarInfo(name=str(rel))
+                ti.size = int(st.st_size)
+                ti.mtime = int(st.st_mtime)
+                ti.mode = 0o644
+                ti.type = tarfile.REGTYPE
+                tf.addfile(ti, fp)
+            archived.append(p)
+
+    # Large buffers on both layers: `w:gz` defaults to 10 KiB tar records over 8 KiB gzip writes,
+    # which means many small syscalls for bundles of thousands of small members.
+    if pgzip is not None:
+        # Parallel DEFLATE across cores; the tar stream itself is written uncompressed (`w|`).
+        with pgzip.open(
+            str(out_tar_gz),
+            "wb",
+            compresslevel=compresslevel,
+            blocksize=1 << 20,
+            thread=max(int(threads), 1),
+        ) as gz:
+            with tarfile.open(fileobj=gz, mode="w|", bufsize=_TAR_BUFSIZE) as tf:
+                _add_all(tf)
+    else:
+        with open(out_tar_gz, "wb", buffering=_OUT_BUFFERING) as raw:
+            with gzip.GzipFile(filename="", fileobj=raw, mode="wb", compresslevel=compresslevel) as gz:
+                with tarfile.open(fileobj=gz, mode="w|", bufsize=_TAR_BUFSIZE) as tf:
+                    _add_all(tf)
+    return archived
+
+
+def _delete_already_archived(*, files: list[Path], out_tar_gz: Path, base_dir: Path) -> int:
+    """
+    Unlink sources that an existing bundle already contains.
+
+    Files not found in the bundle (e.g. late arrivals for that day) are left in place.
+    """
 
-
-def _dir_size_bytes(root: Path) -> int:
-    if not root.exists():
+    try:
+        with tarfile.open(out_tar_gz, mode="r:gz") as tf:
+            members = set(tf.getnames())
+    except (OSError, tarfile.TarError) as e:
+        logger.warning("Cannot read existing archive %s (%s); leaving sources in place", out_tar_gz, e)
         return 0
-    total = 0
-    for p in root.rglob("*"):
+
+    captured: list[Path] = []
+    for p in files:
         try:
-            if p.is_file():
-                total += int(p.stat().st_size)
+            rel = str(p.relative_to(base_dir))
+        except Exception:
+            rel = p.name
+        if rel in members:
+            captured.append(p)
+    if len(captured) < len(files):
+        logger.warning(
+            "%s files for %s are not in the existing archive; left in place (use --force to rebuild)",
+            len(files) - len(captured),
+            out_tar_gz,
+        )
+    return _delete_files(captured)
+
+
+def _archive_files_worker(task: tuple[list[str], str, str, bool, int, int]) -> int:
+    # Process-pool entrypoint: primitive args only so the task pickles cheaply.
+    files, out_tar_gz, base_dir, delete_after, compresslevel, threads = task
+    return _archive_files(
+        files=[Path(f) for f in files],
+        out_tar_gz=Path(out_tar_gz),
+        base_dir=Path(base_dir),
+        delete_after=delete_after,
+        compresslevel=compresslevel,
+        threads=threads,
+    )
+
+
+def _delete_files(files: list[Path]) -> int:
+    deleted = 0
+    for p in files:
+        try:
+            p.unlink()
+            deleted += 1
         except Exception:
             continue
+    return deleted
+
+
+def _scan_dir_sizes(path: str) -> tuple[int, list[str]]:
+    # One directory level: sum regular-file sizes and return subdirectories to visit next.
+    total = 0
+    subdirs: list[str] = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += int(entry.stat(follow_symlinks=False).st_size)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return total, subdirs
+
+
+def _dir_size_bytes(root: Path, *, max_workers: int = 16) -> int:
+    if not root.exists():
+        return 0
+    # Breadth-first, one directory per task: stat latency overlaps on NAS/cloud-backed disks.
+    total = 0
+    pending = [str(root)]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending:
+            next_pending: list[str] = []
+            for size, subdirs in executor.map(_scan_dir_sizes, pending):
+                total += size
+                next_pending.extend(subdirs)
+            pending = next_pending
     return int(total)
 
 
@@ -81,6 +338,28 @@ def _disk_free_bytes(path: Path) -> int:
         return 0
 
 
+def _list_archives(archive_dir: Path) -> list[tuple[float, int, Path]]:
+    # (mtime, size, path) for every *.tar.gz; sizes come from the scandir entry, not a Path.stat.
+    archives: list[tuple[float, int, Path]] = []
+    stack = [str(archive_dir)]
+    while stack:
+        d = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    try:
+                        if e.is_dir(follow_symlinks=False):
+                            stack.append(e.path)
+                        elif e.name.endswith(".tar.gz") and e.is_file(follow_symlinks=False):
+                            st = e.stat(follow_symlinks=False)
+                            archives.append((float(st.st_mtime), int(st.st_size), Path(e.path)))
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return archives
+
+
 def _prune_archives(
     *,
     archive_dir: Path,
@@ -96,28 +375,32 @@ def _prune_archives(
         return 0
 
     deleted = 0
-    archives = []
-    for p in archive_dir.rglob("*.tar.gz"):
-        try:
-            st = p.stat()
-            archives.append((float(st.st_mtime), int(st.st_size), p))
-        except Exception:
-            continue
+    archives = _list_archives(archive_dir)
     archives.sort(key=lambda t: t[0])  # oldest first
 
+    # Walk the archive dir once, then account for each deletion locally (avoids O(N^2) re-walks).
+    current_total = _dir_size_bytes(archive_dir) if max_bytes > 0 else 0
+    # Same for free space: one statvfs up front, credit each unlink, and re-sync periodically
+    # to pick up concurrent writers (e.g. the collector).
+    current_free = _disk_free_bytes(archive_dir) if min_free > 0 else 0
+
     while archives:
         free_ok = True
         size_ok = True
         if min_free > 0:
-            free_ok = _disk_free_bytes(archive_dir) >= min_free
+            if deleted and deleted % _FREE_DISK_RESYNC_EVERY == 0:
+                current_free = _disk_free_bytes(archive_dir)
+            free_ok = current_free >= min_free
         if max_bytes > 0:
-            size_ok = _dir_size_bytes(archive_dir) <= max_bytes
+            size_ok = current_total <= max_bytes
         if free_ok and size_ok:
             break
 
-        _, _, p = archives.pop(0)
+        _, size, p = archives.pop(0)
         try:
             p.unlink()
+            current_total -= size
+            current_free += size
             deleted += 1
             logger.warning("Pruned archive due to limits: %s", p)
         except Exception:
@@ -137,6 +420,25 @@ def main() -> None:
         help="Comma-separated dataset roots under bronze-dir (e.g. tdx/bike/availability,tdx/bike/stations).",
     )
     p.add_argument("--delete-after-archive", action="store_true", help="Delete archived JSON files after bundling.")
+    p.add_argument(
+        "--compresslevel",
+        type=int,
+        default=6,
+        choices=range(1, 10),
+        metavar="{1..9}",
+        help="gzip compression level (6 is near-identical in size to 9 on Bronze JSON, at much lower CPU).",
+    )
+    p.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild day bundles that already exist (default: skip them).",
+    )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Processes used to build day bundles in parallel (0 = CPU count, 1 = sequential).",
+    )
     p.add_argument(
         "--min-free-disk-bytes",
         type=int,
@@ -157,7 +459,9 @@ def main() -> None:
     bronze_dir = Path(args.bronze_dir)
     archive_dir = Path(args.archive_dir)
 
-    older_than = datetime.now(timezone.utc) - timedelta(days=max(int(args.older_than_days), 0))
+    # Second resolution (like the file names) so the name comparison below matches `ts < older_than`.
+    older_than = (datetime.now(timezone.utc) - timedelta(days=max(int(args.older_than_days), 0))).replace(microsecond=0)
+    cutoff_name = older_than.strftime("%Y%m%dT%H%M%SZ")
     dataset_roots = [d.strip().strip("/") for d in str(args.datasets).split(",") if d.strip()]
     if not dataset_roots:
         raise ValueError("No datasets specified")
@@ -166,6 +470,9 @@ def main() -> None:
     total_deleted = 0
     total_archives = 0
     total_pruned = 0
+    total_skipped = 0
+    # (files, out_tar_gz) per day bundle; bundles are independent so they can be built in parallel.
+    bundles: list[tuple[list[Path], Path]] = []
 
     for root in dataset_roots:
         ds_dir = bronze_dir / root
@@ -178,33 +485,55 @@ def main() -> None:
         partitions = city_dirs if city_dirs else [ds_dir]
 
         for part_dir in partitions:
-            files = sorted(part_dir.glob("*.json"))
-            old_files: list[Path] = []
-            for f in files:
-                ts = _parse_ts_from_name(f.name)
-                if ts is None:
+            # scandir + suffix check: no fnmatch and no Path objects for files we end up skipping.
+            with os.scandir(part_dir) as it:
+                names = sorted(e.name for e in it if is_bronze_file_name(e.name) and e.is_file())
+            # Timestamped names sort in time order, so everything older than the cutoff is a prefix
+            # of `names`; only that prefix is parsed (to drop names that merely look like timestamps).
+            old_names = [n for n in names[: bisect_left(names, cutoff_name)] if _parse_ts_from_name(n) is not None]
+            total_candidates += len(old_names)
+
+            # Invariant across days of this partition.
+            out_dir = archive_dir / part_dir.relative_to(bronze_dir)
+            # Names are sorted and start with YYYYMMDD, so day buckets are contiguous runs.
+            for day_key, day_names in groupby(old_names, key=lambda n: n[:8]):
+                day = f"{day_key[:4]}-{day_key[4:6]}-{day_key[6:8]}"
+                group = [part_dir / n for n in day_names]
+                out = out_dir / f"{day}.tar.gz"
+                if out.exists() and not args.force:
+                    # Already bundled on a previous run: skip the (expensive) recompression.
+                    total_skipped += 1
+                    if args.delete_after_archive:
+                        total_deleted += _delete_already_archived(files=group, out_tar_gz=out, base_dir=bronze_dir)
                     continue
-                if ts < older_than:
-                    old_files.append(f)
-            if not old_files:
-                continue
-
-            total_candidates += len(old_files)
-            day_groups: dict[str, list[Path]] = {}
-            for f in old_files:
-                ts = _parse_ts_from_name(f.name)
-                if ts is None:
-                    continue
-                key = ts.strftime("%Y-%m-%d")
-                day_groups.setdefault(key, []).append(f)
-
-            for day, group in sorted(day_groups.items()):
-                rel_part = part_dir.relative_to(bronze_dir)
-                out = archive_dir / rel_part / f"{day}.tar.gz"
-                deleted = _archive_files(files=group, out_tar_gz=out, base_dir=bronze_dir, delete_after=bool(args.delete_after_archive))
-                total_archives += 1
-                total_deleted += deleted
-                logger.info("Archived %s files to %s (deleted=%s)", len(group), out, deleted)
+                bundles.append((group, out))
+
+    cpu = os.cpu_count() or 1
+    workers = int(args.workers) if int(args.workers) > 0 else cpu
+    workers = max(min(workers, len(bundles)), 1)
+    # Split the cores between pool workers so pigz/pgzip threads don't multiply to cpu**2.
+    threads = max(cpu // workers, 1)
+    tasks = [
+        (
+            [str(f) for f in group],
+            str(out),
+            str(bronze_dir),
+            bool(args.delete_after_archive),
+            int(args.compresslevel),
+            threads,
+        )
+        for group, out in bundles
+    ]
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_archive_files_worker, tasks))
+    else:
+        results = [_archive_files_worker(t) for t in tasks]
+
+    for (group, out), deleted in zip(bundles, results):
+        total_archives += 1
+        total_deleted += deleted
+        logger.info("Archived %s files to %s (deleted=%s)", len(group), out, deleted)
 
     total_pruned = _prune_archives(
         archive_dir=archive_dir,
@@ -213,9 +542,10 @@ def main() -> None:
     )
 
     logger.info(
-        "done: candidates=%s archives=%s deleted=%s pruned=%s (delete_after_archive=%s)",
+        "done: candidates=%s archives=%s skipped_existing=%s deleted=%s pruned=%s (delete_after_archive=%s)",
         total_candidates,
         total_archives,
+        total_skipped,
         total_deleted,
         int(total_pruned),
         bool(args.delete_after_archive),
@@ -10,8 +10,6 @@ sys.path.insert(0, str(SRC_PATH))
 
 import argparse
 import logging
-import json
-from datetime import datetime, timezone
 
 import pandas as pd
 
@@ -20,6 +18,8 @@ from metrobikeatlas.analytics.kmeans import kmeans_cluster
 from metrobikeatlas.analytics.linear_regression import fit_linear_regression
 from metrobikeatlas.config.loader import load_config
 from metrobikeatlas.utils.logging import configure_logging
+from metrobikeatlas.utils.run_meta import write_gold_run_meta
+from metrobikeatlas.utils.tables import TABLE_FORMATS, read_table, table_exists, write_table
 
 
 logger = logging.getLogger(__name__)
@@ -29,26 +29,40 @@ def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--target-metric", default="metro_flow_proxy_from_bike_rent")
     parser.add_argument("--out-dir", default="data/gold")
+    parser.add_argument(
+        "--format",
+        choices=TABLE_FORMATS,
+        default="both",
+        help="Gold table format: CSV, Parquet (next to the CSV path), or both.",
+    )
     args = parser.parse_args()
 
     config = load_config()
     configure_logging(config.logging)
 
-    if not config.features.station_features_path.exists():
+    if not table_exists(config.features.station_features_path):
         raise FileNotFoundError(f"Missing station features: {config.features.station_features_path}")
-    if not config.features.station_targets_path.exists():
+    if not table_exists(config.features.station_targets_path):
         raise FileNotFoundError(f"Missing station targets: {config.features.station_targets_path}")
 
-    features = pd.read_csv(config.features.station_features_path)
-    targets = pd.read_csv(config.features.station_targets_path)
+    features = read_table(config.features.station_features_path)
+    targets = read_table(config.features.station_targets_path)
+
+    # Project once up front: every analytics step below only uses the station id plus numeric
+    # feature columns, and only the target-metric rows (each step otherwise copies the full tables).
+    numeric_cols = [
+        c for c in features.columns if c not in {"station_id", "district"} and pd.api.types.is_numeric_dtype(features[c])
+    ]
+    features = features[["station_id"] + numeric_cols]
+    targets = targets.loc[targets["metric"] == args.target_metric, ["station_id", "metric", "value"]]
 
     out_dir = Path(args.out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
 
     corr = compute_feature_correlations(features, targets, target_metric=args.target_metric)
     corr_path = out_dir / "feature_correlations.csv"
-    corr.to_csv(corr_path, index=False)
-    logger.info("Wrote %s", corr_path)
+    for out in write_table(corr, corr_path, fmt=args.format):
+        logger.info("Wrote %s", out)
 
     reg = fit_linear_regression(features, targets, target_metric=args.target_metric)
     reg_df = pd.DataFrame(
@@ -58,8 +72,8 @@ def main() -> None:
     reg_df["r2"] = reg.r2
     reg_df["n"] = reg.n
     reg_path = out_dir / "regression_coefficients.csv"
-    reg_df.to_csv(reg_path, index=False)
-    logger.info("Wrote %s", reg_path)
+    for out in write_table(reg_df, reg_path, fmt=args.format):
+        logger.info("Wrote %s", out)
 
     kmeans = kmeans_cluster(
         features,
@@ -67,31 +81,23 @@ def main() -> None:
         standardize=config.analytics.clustering.standardize,
     )
     cluster_path = out_dir / "station_clusters.csv"
-    kmeans.labels.to_csv(cluster_path, index=False)
-    logger.info("Wrote %s", cluster_path)
+    for out in write_table(kmeans.labels, cluster_path, fmt=args.format):
+        logger.info("Wrote %s", out)
 
     # Reproducibility meta (ties analytics outputs back to Silver build id/hash + features meta).
     repo_root = Path(__file__).resolve().parents[1]
-    silver_meta_path = repo_root / "data" / "silver" / "_build_meta.json"
-    try:
-        silver_meta = json.loads(silver_meta_path.read_text(encoding="utf-8")) if silver_meta_path.exists() else None
-    except Exception:
-        silver_meta = None
-    run_meta = {
-        "type": "gold_run_meta",
-        "stage": "analytics",
-        "generated_at_utc": datetime.now(timezone.utc).isoformat(),
-        "silver_build_id": (silver_meta or {}).get("build_id") if isinstance(silver_meta, dict) else None,
-        "silver_inputs_hash": (silver_meta or {}).get("inputs_hash") if isinstance(silver_meta, dict) else None,
-        "inputs": {"target_metric": args.target_metric},
-        "artifacts": {
+    meta_path = write_gold_run_meta(
+        out_dir=out_dir,
+        stage="analytics",
+        silver_dir=repo_root / "data" / "silver",
+        inputs={"target_metric": args.target_metric},
+        artifacts={
             "feature_correlations": str(corr_path),
             "regression_coefficients": str(reg_path),
             "station_clusters": str(cluster_path),
         },
-    }
-    (out_dir / "_run_meta.json").write_text(json.dumps(run_meta, ensure_ascii=False, indent=2), encoding="utf-8")
-    logger.info("Wrote %s", out_dir / "_run_meta.json")
+    )
+    logger.info("Wrote %s", meta_path)
 
 
 if __name__ == "__main__":
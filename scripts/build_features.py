@@ -12,8 +12,6 @@ import argparse
 import logging
 
 import pandas as pd
-import json
-from datetime import datetime, timezone
 
 from metrobikeatlas.config.loader import load_config
 from metrobikeatlas.features.builder import (
@@ -22,6 +20,8 @@ from metrobikeatlas.features.builder import (
     load_station_district_map_csv,
 )
 from metrobikeatlas.utils.logging import configure_logging
+from metrobikeatlas.utils.run_meta import write_gold_run_meta
+from metrobikeatlas.utils.tables import TABLE_FORMATS, read_table, table_exists, write_table
 
 
 logger = logging.getLogger(__name__)
@@ -30,21 +30,37 @@ logger = logging.getLogger(__name__)
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--silver-dir", default="data/silver")
+    parser.add_argument(
+        "--format",
+        choices=TABLE_FORMATS,
+        default="both",
+        help="Gold table format: CSV, Parquet (next to the CSV path), or both.",
+    )
     args = parser.parse_args()
 
     config = load_config()
     configure_logging(config.logging)
 
+    # Silver tables may be CSV and/or Parquet (`build_silver.py --format`); `read_table` picks the fresher copy.
     silver_dir = Path(args.silver_dir)
-    metro = pd.read_csv(silver_dir / "metro_stations.csv")
-    bike = pd.read_csv(silver_dir / "bike_stations.csv")
-    links = pd.read_csv(silver_dir / "metro_bike_links.csv")
+    metro = read_table(silver_dir / "metro_stations.csv")
+    bike = read_table(silver_dir / "bike_stations.csv")
+    links = read_table(silver_dir / "metro_bike_links.csv")
 
     bike_ts_path = silver_dir / "bike_timeseries.csv"
-    bike_ts = pd.read_csv(bike_ts_path, parse_dates=["ts"]) if bike_ts_path.exists() else pd.DataFrame()
+    # The builder re-normalises `ts`/`station_id`, so these large reads can use the PyArrow engine.
+    bike_ts = (
+        read_table(bike_ts_path, parse_dates=["ts"], fast=True)
+        if table_exists(bike_ts_path)
+        else pd.DataFrame()
+    )
 
     metro_ts_path = silver_dir / "metro_timeseries.csv"
-    metro_ts = pd.read_csv(metro_ts_path, parse_dates=["ts"]) if metro_ts_path.exists() else None
+    metro_ts = (
+        read_table(metro_ts_path, parse_dates=["ts"], fast=True)
+        if table_exists(metro_ts_path)
+        else None
+    )
 
     poi = None
     if config.features.poi is not None and config.features.poi.path.exists():
@@ -69,36 +85,24 @@ def main() -> None:
         district_map=district_map,
     )
 
-    config.features.station_features_path.parent.mkdir(parents=True, exist_ok=True)
-    artifacts.station_features.to_csv(config.features.station_features_path, index=False)
-    logger.info("Wrote %s", config.features.station_features_path)
+    for out in write_table(artifacts.station_features, config.features.station_features_path, fmt=args.format):
+        logger.info("Wrote %s", out)
 
-    config.features.station_targets_path.parent.mkdir(parents=True, exist_ok=True)
-    artifacts.station_targets.to_csv(config.features.station_targets_path, index=False)
-    logger.info("Wrote %s", config.features.station_targets_path)
+    for out in write_table(artifacts.station_targets, config.features.station_targets_path, fmt=args.format):
+        logger.info("Wrote %s", out)
 
     # Reproducibility meta (ties Gold outputs back to Silver build id/hash).
-    try:
-        silver_meta_path = silver_dir / "_build_meta.json"
-        silver_meta = json.loads(silver_meta_path.read_text(encoding="utf-8")) if silver_meta_path.exists() else None
-    except Exception:
-        silver_meta = None
-    run_meta = {
-        "type": "gold_run_meta",
-        "stage": "features",
-        "generated_at_utc": datetime.now(timezone.utc).isoformat(),
-        "silver_build_id": (silver_meta or {}).get("build_id") if isinstance(silver_meta, dict) else None,
-        "silver_inputs_hash": (silver_meta or {}).get("inputs_hash") if isinstance(silver_meta, dict) else None,
-        "inputs": {"silver_dir": str(silver_dir)},
-        "artifacts": {
+    meta_path = write_gold_run_meta(
+        out_dir=config.features.station_features_path.parent,
+        stage="features",
+        silver_dir=silver_dir,
+        inputs={"silver_dir": str(silver_dir)},
+        artifacts={
             "station_features_path": str(config.features.station_features_path),
             "station_targets_path": str(config.features.station_targets_path),
         },
-    }
-    out_dir = config.features.station_features_path.parent
-    out_dir.mkdir(parents=True, exist_ok=True)
-    (out_dir / "_run_meta.json").write_text(json.dumps(run_meta, ensure_ascii=False, indent=2), encoding="utf-8")
-    logger.info("Wrote %s", out_dir / "_run_meta.json")
+    )
+    logger.info("Wrote %s", meta_path)
 
 
 if __name__ == "__main__":
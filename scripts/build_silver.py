@@ -4,7 +4,7 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 import json
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 import hashlib
 import uuid
 
@@ -14,11 +14,22 @@ sys.path.insert(0, str(SRC_PATH))
 
 # `argparse` provides a stable CLI interface for building Silver tables from Bronze (repeatable pipelines).
 import argparse
-# `asdict` converts dataclass records into plain dicts, which is convenient for building pandas DataFrames.
-from dataclasses import asdict
+# Independent Silver stages run in worker threads via `asyncio.to_thread`.
+import asyncio
+# Availability snapshots are independent files, so they are parsed on a process pool.
+from concurrent.futures import ProcessPoolExecutor
+import os
+# `partial` binds each stage's arguments before it is handed to a worker thread.
+from functools import partial
+# `heapq.nlargest` keeps only the newest N Bronze files without sorting the whole directory.
+import heapq
+# `math.isnan` maps float NaN cells to SQL NULL.
+import math
 # `Any` is used for raw JSON dict payloads coming from Bronze.
 from typing import Any
 
+# `numpy` formats the SQLite timestamp column in one vectorized pass.
+import numpy as np
 # `pandas` is used for tabular transformation and writing CSV outputs for the Silver layer.
 import pandas as pd
 import sqlite3
@@ -35,28 +46,77 @@ from metrobikeatlas.ingestion.external_inputs import (
     validate_external_weather_hourly_df,
 )
 # Bronze reader loads the wrapper JSON and returns a dict containing `retrieved_at`, `request`, and `payload`.
-from metrobikeatlas.ingestion.bronze import read_bronze_json
+from metrobikeatlas.ingestion.bronze import is_bronze_file_name, read_bronze_json
 # Parsing helpers normalize raw TDX station/availability JSON into stable dataclass schemas.
 from metrobikeatlas.ingestion.tdx_bike_client import TDXBikeClient
 from metrobikeatlas.ingestion.tdx_metro_client import TDXMetroClient
 # Spatial join builds a metro↔bike link table used by the API and feature engineering later.
 from metrobikeatlas.preprocessing.spatial_join import build_station_bike_links
 # Temporal alignment builds a simple "rent/return proxy" from availability deltas for MVP analysis.
-from metrobikeatlas.preprocessing.temporal_align import compute_rent_return_proxy
+from metrobikeatlas.preprocessing.temporal_align import (
+    PROXY_ENGINES,
+    compute_rent_return_proxy,
+    parse_utc_timestamps,
+)
 from metrobikeatlas.quality.contract import compute_schema_meta, write_json
+# Table writer: CSV (pyarrow's C++ writer when `MBA_FAST_IO=1`) and/or a zstd Parquet sibling.
+from metrobikeatlas.utils.tables import (
+    TABLE_FORMATS,
+    has_polars,
+    has_pyarrow,
+    parquet_sibling,
+    write_table,
+)
 
 
-def _artifact_status(path: Path) -> dict[str, object]:
+def _scan_dir_once(dir_path: Path) -> dict[str, os.stat_result]:
+    # One directory listing for all artifacts in `dir_path` (name -> stat); missing files are simply absent.
     try:
-        st = path.stat()
-        return {
+        with os.scandir(dir_path) as it:
+            return {entry.name: entry.stat() for entry in it if entry.is_file()}
+    except FileNotFoundError:
+        return {}
+
+
+def _artifact_status(
+    path: Path,
+    cache: dict[Path, dict[str, object]] | None = None,
+    *,
+    dir_stats: dict[Path, dict[str, os.stat_result]] | None = None,
+) -> dict[str, object]:
+    # `cache` holds statuses already taken in this run (refreshed right after each write), so repeated
+    # events and the final build meta do not stat the same artifacts again.
+    # `dir_stats` maps a scanned directory to its `_scan_dir_once` result; paths inside it are looked up
+    # there instead of being stat'ed one by one.
+    if cache is not None and path in cache:
+        return cache[path]
+    st: os.stat_result | None
+    if dir_stats is not None and path.parent in dir_stats:
+        st = dir_stats[path.parent].get(path.name)
+    else:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            st = None
+    if st is not None:
+        status: dict[str, object] = {
             "path": str(path),
             "exists": True,
             "mtime_utc": datetime.fromtimestamp(st.st_mtime, tz=timezone.utc).isoformat(),
             "size_bytes": int(st.st_size),
         }
-    except FileNotFoundError:
-        return {"path": str(path), "exists": False, "mtime_utc": None, "size_bytes": None}
+    else:
+        status = {"path": str(path), "exists": False, "mtime_utc": None, "size_bytes": None}
+    if cache is not None:
+        cache[path] = status
+    return status
+
+
+def _refresh_artifacts(cache: dict[Path, dict[str, object]], paths: list[Path]) -> None:
+    # Call right after writing `paths` so the cached status reflects the new files.
+    for p in paths:
+        cache.pop(Path(p), None)
+        _artifact_status(Path(p), cache)
 
 
 def _emit_event(
@@ -67,6 +127,7 @@ def _emit_event(
     message: str | None = None,
     artifacts: list[Path] | None = None,
     level: str = "info",
+    status_cache: dict[Path, dict[str, object]] | None = None,
 ) -> None:
     """
     Emit a structured, stable event line for operational observability.
@@ -86,57 +147,287 @@ def _emit_event(
     if message:
         payload["message"] = str(message)
     if artifacts:
-        payload["artifacts"] = [_artifact_status(Path(p)) for p in artifacts]
+        payload["artifacts"] = [_artifact_status(Path(p), status_cache) for p in artifacts]
     print("MBA_EVENT " + json.dumps(payload, ensure_ascii=False))
 
 
-def _latest_file(dir_path: Path) -> Path:
+def _inputs_hash(inputs: dict[str, object], *, legacy: bool = False) -> tuple[str, str]:
+    # Hash the canonical (sorted-key, compact) JSON bytes of the build inputs with blake3 when it is
+    # installed; `orjson` (optional) encodes without going through Python's JSON encoder.
+    # Without blake3, or with `legacy=True`, keep the historical sha256-over-`json.dumps` digest so
+    # hashes stay comparable with earlier builds. Returns `(hexdigest, algorithm)`.
+    if not legacy:
+        try:
+            import blake3  # type: ignore
+        except ModuleNotFoundError:
+            blake3 = None
+        if blake3 is not None:
+            try:
+                import orjson  # type: ignore
+
+                payload = orjson.dumps(inputs, option=orjson.OPT_SORT_KEYS)
+            except (ModuleNotFoundError, TypeError):
+                payload = json.dumps(
+                    inputs, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+                ).encode("utf-8")
+            return blake3.blake3(payload).hexdigest(), "blake3"
+    payload = json.dumps(inputs, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest(), "sha256"
+
+
+def _json_entries(dir_path: Path, newest: int = 0) -> list[os.DirEntry[str]]:
     # List Bronze files in lexicographic order; our Bronze naming uses UTC timestamps so sorting works.
-    files = sorted(dir_path.glob("*.json"))
+    # `scandir` avoids building a `Path` per file, and each entry caches its `stat()` result.
+    # `newest > 0` keeps only the last `newest` files: a bounded heap, O(N) instead of a full sort.
+    try:
+        with os.scandir(dir_path) as it:
+            entries = [e for e in it if is_bronze_file_name(e.name) and e.is_file()]
+    except FileNotFoundError:
+        return []
+    if 0 < newest < len(entries):
+        entries = heapq.nlargest(newest, entries, key=lambda e: e.name)
+    entries.sort(key=lambda e: e.name)
+    return entries
+
+
+def _latest_file(dir_path: Path) -> Path:
+    files = _json_entries(dir_path, newest=1)
     # Fail fast when Bronze is missing so users immediately know they must run the ingestion scripts first.
     if not files:
         raise FileNotFoundError(f"No Bronze files found in {dir_path}")
     # Return the newest file (latest timestamp) to represent the most recent station snapshot.
-    return files[-1]
+    return Path(files[-1].path)
 
 
-def main() -> None:
-    # Build a CLI parser so Silver can be rebuilt deterministically from a chosen Bronze directory.
-    parser = argparse.ArgumentParser()
-    # Bronze is the raw data lake root written by `scripts/extract_*` and `scripts/collect_*` scripts.
-    parser.add_argument("--bronze-dir", default="data/bronze")
-    # Silver directory is where we write normalized CSVs used by the API and later analytics.
-    parser.add_argument("--silver-dir", default="data/silver")
-    # Cap the number of availability files to avoid unbounded memory usage in long-running collections.
-    parser.add_argument("--max-availability-files", type=int, default=500)
-    parser.add_argument("--write-sqlite", action="store_true", help="Write `data/silver/metrobikeatlas.db` for scalable reads.")
-    # Optional external metro station fallback for cases where TDX metro endpoints are unavailable (404).
-    parser.add_argument("--external-metro-stations-csv", default="data/external/metro_stations.csv")
-    # Optional external datasets for policy/storytelling features.
-    parser.add_argument("--external-calendar-csv", default="data/external/calendar.csv")
-    parser.add_argument("--external-weather-hourly-csv", default="data/external/weather_hourly.csv")
-    parser.add_argument(
-        "--prefer-external-metro",
-        action="store_true",
-        help="Use external metro station CSV even if TDX metro Bronze exists.",
+# Column order of `bike_timeseries` before the rent/return proxy (matches `BikeAvailability` + city).
+_AVAILABILITY_COLUMNS = ("station_id", "ts", "available_bikes", "available_docks", "source", "city")
+
+
+def _parse_availability_file(path: str, city: str) -> dict[str, list[Any]]:
+    # Top-level (picklable) so `ProcessPoolExecutor` workers can parse one Bronze snapshot each.
+    # With msgspec installed, the file decodes straight into typed columns; otherwise (or if the
+    # file does not fit that layout) parse the generic JSON wrapper record by record.
+    decoded = TDXBikeClient.decode_availability_bronze(Path(path))
+    if decoded is not None:
+        station_ids, ts, available_bikes, available_docks = decoded
+    else:
+        bronze = read_bronze_json(Path(path))
+        # Each file is a wrapper with `payload` holding a list of station availability records.
+        payload = bronze["payload"]
+        # Build columns (not row dicts) so pandas does not have to transpose N dicts at the end.
+        station_ids = []
+        ts = []
+        available_bikes = []
+        available_docks = []
+        for item in payload:
+            # Normalize raw availability so timestamps and counts have stable types.
+            sid, t, bikes, docks = TDXBikeClient.parse_availability_fields(item)
+            station_ids.append(sid)
+            ts.append(t)
+            available_bikes.append(bikes)
+            available_docks.append(docks)
+    n = len(station_ids)
+    return {
+        "station_id": station_ids,
+        "ts": ts,
+        "available_bikes": available_bikes,
+        "available_docks": available_docks,
+        "source": ["tdx"] * n,
+        # Add city so multi-city collections remain distinguishable in a single DataFrame.
+        "city": [city] * n,
+    }
+
+
+# Epoch and unit for turning aware `datetime`s into integer UTC microseconds (exact, unlike floats).
+_UTC_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_US = timedelta(microseconds=1)
+
+
+def _availability_frame(cols: dict[str, list[Any]]) -> pd.DataFrame:
+    # Column lists → DataFrame for the no-pyarrow path. Inferring `ts` from a list of `datetime`
+    # objects is by far the slowest column, so the usual case (one fixed UTC offset) is built from
+    # integer epoch microseconds instead, with the same `datetime64[ns, tz]` dtype pandas infers.
+    # Mixed offsets stay a list, so pandas keeps them as an object column as before.
+    ts = cols["ts"]
+    tz = getattr(ts[0], "tzinfo", None) if ts else None
+    if isinstance(tz, timezone) and all(getattr(t, "tzinfo", None) == tz for t in ts):
+        micros = np.fromiter(
+            ((t - _UTC_EPOCH) // _ONE_US for t in ts), dtype=np.int64, count=len(ts)
+        )
+        utc = pd.DatetimeIndex(micros.view("datetime64[us]")).tz_localize("UTC")
+        cols = {**cols, "ts": utc.tz_convert(tz).as_unit("ns")}
+    return pd.DataFrame(cols, columns=list(_AVAILABILITY_COLUMNS))
+
+
+# Bike/dock counts and their deltas are small whole numbers: int16 holds them, and float32 holds
+# every whole number below 2**24 exactly (so the CSV text of a downcast column does not change).
+_INT16_MAX = int(np.iinfo(np.int16).max)
+_FLOAT32_EXACT_INT = 2**24
+
+
+def _downcast_counts(df: pd.DataFrame, columns: tuple[str, ...]) -> None:
+    # In place: integer columns that fit become int16; float columns holding only whole numbers (and
+    # NaN for missing counts) become float32. Any other column keeps its dtype, so no value changes.
+    for c in columns:
+        if c not in df.columns:
+            continue
+        s = df[c]
+        if isinstance(s.dtype, np.dtype) and s.dtype.kind in "iu":
+            v = s.to_numpy()
+            if v.size == 0 or (v.min() >= -_INT16_MAX and v.max() <= _INT16_MAX):
+                df[c] = s.astype(np.int16)
+        elif s.dtype == np.float64:
+            v = s.to_numpy()
+            v = v[~np.isnan(v)]
+            if ((np.abs(v) < _FLOAT32_EXACT_INT) & (v == np.round(v))).all():
+                df[c] = s.astype(np.float32)
+
+
+def _availability_arrow_table(cols: dict[str, list[Any]]) -> Any:
+    import pyarrow as pa  # type: ignore
+
+    # The first row's timestamp offset (e.g. `+08:00`) becomes the column tz; `main` casts later
+    # files to the first file's schema so every collected table has identical types.
+    ts_type = pa.array(cols["ts"][:1]).type
+    schema = pa.schema(
+        [
+            ("station_id", pa.string()),
+            ("ts", pa.timestamp("us", tz=ts_type.tz)),
+            ("available_bikes", pa.int64()),
+            ("available_docks", pa.int64()),
+            ("source", pa.string()),
+            ("city", pa.string()),
+        ]
     )
-    # Parse CLI arguments once at startup to keep control flow deterministic.
-    args = parser.parse_args()
+    return pa.Table.from_pydict({c: cols[c] for c in _AVAILABILITY_COLUMNS}, schema=schema)
 
-    build_id = uuid.uuid4().hex
-    started_at = datetime.now(timezone.utc)
-    _emit_event(build_id=build_id, stage="starting", progress_pct=0, message="build_silver started")
 
-    # Load typed config to obtain the city lists and spatial settings (buffer radius / nearest K).
-    config = load_config()
-    # Resolve Bronze/Silver directories from CLI args.
-    bronze_dir = Path(args.bronze_dir)
-    silver_dir = Path(args.silver_dir)
-    # Ensure the Silver output directory exists before writing CSVs.
-    silver_dir.mkdir(parents=True, exist_ok=True)
+def _parse_availability_table(path: str, city: str) -> Any:
+    # Arrow variant of `_parse_availability_file` (None for an empty snapshot), returned by pool
+    # workers: an Arrow table pickles as a few flat buffers, while lists of `datetime`/`str` objects
+    # cost far more to pickle in the worker and unpickle in the parent.
+    cols = _parse_availability_file(path, city)
+    return _availability_arrow_table(cols) if cols["station_id"] else None
+
+
+# Bumped whenever `_parse_availability_file` or the Arrow schema changes, so old cache entries miss.
+_AVAILABILITY_CACHE_VERSION = 1
+
+
+def _availability_cache_name(path: str, city: str, st: os.stat_result) -> str:
+    # One cache entry per (file, size, mtime, city): a rewritten snapshot gets a new name, and the
+    # old entry is pruned at the end of the build.
+    key = f"{_AVAILABILITY_CACHE_VERSION}|{city}|{path}|{st.st_size}|{st.st_mtime_ns}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest() + ".arrow"
+
+
+def _parse_availability_table_cached(path: str, city: str, cache_path: str) -> Any:
+    # `_parse_availability_table` behind a per-file Arrow IPC cache: an unchanged snapshot is read
+    # back as typed buffers instead of being decoded and parsed again.
+    import pyarrow as pa  # type: ignore
+
+    try:
+        with pa.OSFile(cache_path, "rb") as source:
+            return pa.ipc.open_file(source).read_all()
+    except (OSError, pa.ArrowInvalid):
+        pass
+    table = _parse_availability_table(path, city)
+    if table is not None:
+        # Write under a temporary name first so a crashed build never leaves a truncated entry.
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with pa.OSFile(tmp_path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp_path, cache_path)
+    return table
+
+
+def _iter_availability_files(
+    tasks: list[tuple[str, str]],
+    *,
+    workers: int,
+    arrow: bool = False,
+    cache_paths: list[str] | None = None,
+) -> Any:
+    # Yield parsed files in task order; with a pool, results stream back as workers finish them.
+    # `arrow=True` yields `_parse_availability_table` results instead of column dicts, read through
+    # the per-file cache when `cache_paths` (one per task) is given.
+    parse: Any = _parse_availability_table if arrow else _parse_availability_file
+    columns: list[Any] = [[path for path, _ in tasks], [city for _, city in tasks]]
+    if arrow and cache_paths is not None:
+        parse = _parse_availability_table_cached
+        columns.append(cache_paths)
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            yield from executor.map(parse, *columns, chunksize=8)
+    else:
+        for args in zip(*columns):
+            yield parse(*args)
+
+
+def _sqlite_column_type(s: pd.Series) -> str:
+    # Same affinities `DataFrame.to_sql` picks for these dtypes, so existing readers see the same schema.
+    if pd.api.types.is_bool_dtype(s) or pd.api.types.is_integer_dtype(s):
+        return "INTEGER"
+    if pd.api.types.is_float_dtype(s):
+        return "REAL"
+    return "TEXT"
+
+
+def _utc_timestamps(ts: pd.Series) -> pd.Series:
+    # Parsed availability already has a tz-aware dtype, so converting to UTC only swaps the tz metadata;
+    # a parse is needed only for object columns (e.g. mixed UTC offsets), once per distinct value.
+    if isinstance(ts.dtype, pd.DatetimeTZDtype):
+        return ts.dt.tz_convert("UTC")
+    return parse_utc_timestamps(ts)
+
+
+# Rows converted to Python objects per `executemany` call when loading SQLite.
+_SQLITE_BATCH_ROWS = 50_000
+
+
+def _write_bike_timeseries_sqlite(conn: sqlite3.Connection, df: pd.DataFrame) -> None:
+    # `df["ts"]` is already typed UTC (see `_utc_timestamps`); it is stored as UTC text
+    # (`2026-01-01T00:00:00+0000`) so lexical order is time order.
+    ts_utc = df["ts"]
+    keep = ts_utc.notna().to_numpy()
+    seconds = ts_utc.dt.tz_localize(None).to_numpy(dtype="datetime64[s]")
+    columns = [str(c) for c in df.columns]
+    arrays = {c: df[c].to_numpy() for c in columns if c != "ts"}
+
+    cols_sql = ", ".join(f'"{c}" {_sqlite_column_type(df[c]) if c != "ts" else "TEXT"}' for c in columns)
+    conn.execute(f'CREATE TABLE "bike_timeseries" ({cols_sql})')
+    placeholders = ", ".join("?" for _ in columns)
+    insert_sql = f"INSERT INTO bike_timeseries VALUES ({placeholders})"
+
+    # Load in row batches over numpy views of the frame, so only one batch of Python objects is alive
+    # at a time (instead of a second, row-by-row copy of the whole table).
+    for start in range(0, len(df), _SQLITE_BATCH_ROWS):
+        rows = slice(start, start + _SQLITE_BATCH_ROWS)
+        batch_keep = keep[rows]
+        values: list[list[Any]] = []
+        for c in columns:
+            if c == "ts":
+                ts_text = np.char.add(np.datetime_as_string(seconds[rows][batch_keep], unit="s"), "+0000")
+                values.append(ts_text.tolist())
+                continue
+            # `tolist()` yields Python scalars (sqlite3 rejects numpy types); NaN/None become NULL.
+            col = arrays[c][rows][batch_keep].tolist()
+            values.append(
+                [None if v is None or (isinstance(v, float) and math.isnan(v)) else v for v in col]
+            )
+        conn.executemany(insert_sql, zip(*values))
+
 
+def _metro_stations_stage(
+    args: argparse.Namespace,
+    config: Any,
+    bronze_dir: Path,
+    silver_dir: Path,
+    artifact_cache: dict[Path, dict[str, object]],
+) -> tuple[pd.DataFrame, list[Path], dict[str, Any]]:
     # Metro stations
     # Preferred source is TDX Bronze; fallback is `data/external/metro_stations.csv`.
+    # Returns the table, the written paths, and the source details recorded in the build meta.
     metro_df: pd.DataFrame
     metro_bronze_ok = False
     metro_source = "tdx_bronze"
@@ -145,7 +436,8 @@ def main() -> None:
     external_metro_row_count: int | None = None
     if not args.prefer_external_metro:
         try:
-            metro_rows: list[dict[str, Any]] = []
+            # Station tables are assembled as columns (one list per schema field) across cities.
+            metro_cols: dict[str, list[Any]] = {}
             # Iterate configured metro cities so the pipeline is config-driven and reproducible.
             for city in config.tdx.metro.cities:
                 city_dir = bronze_dir / "tdx" / "metro" / "stations" / f"city={city}"
@@ -164,10 +456,12 @@ def main() -> None:
                     metro_station_inputs.append({"city": city, "path": str(latest)})
                 bronze = read_bronze_json(latest)
                 payload = bronze["payload"]
-                for item in payload:
-                    metro_rows.append(asdict(TDXMetroClient.parse_station(item, city=city)))
+                columns = TDXMetroClient.parse_station_columns(payload, city=city)
+                for name, values in columns.items():
+                    metro_cols.setdefault(name, []).extend(values)
 
-            metro_df = pd.DataFrame(metro_rows)
+            # No parsed rows -> an empty, column-less frame, so the check below picks the CSV.
+            metro_df = pd.DataFrame(metro_cols) if metro_cols.get("station_id") else pd.DataFrame()
             metro_bronze_ok = {"station_id", "name", "lat", "lon", "city", "system"} <= set(metro_df.columns)
         except FileNotFoundError:
             metro_bronze_ok = False
@@ -192,14 +486,27 @@ def main() -> None:
     # Silver file path uses a stable name so downstream code can locate it without scanning directories.
     metro_out = silver_dir / "metro_stations.csv"
     # Write without index to keep the schema clean and portable across tools.
-    metro_df.to_csv(metro_out, index=False)
-    # Print output path so logs show what was produced.
-    print(f"Wrote {metro_out}")
-    _emit_event(build_id=build_id, stage="metro_stations", progress_pct=20, artifacts=[metro_out])
+    written = write_table(metro_df, metro_out, fmt=args.format)
+    _refresh_artifacts(artifact_cache, written)
+    source = {
+        "metro_source": metro_source,
+        "metro_station_inputs": metro_station_inputs,
+        "external_metro_path": external_metro_path,
+        "external_metro_row_count": external_metro_row_count,
+    }
+    return metro_df, written, source
+
 
+def _bike_stations_stage(
+    args: argparse.Namespace,
+    config: Any,
+    bronze_dir: Path,
+    silver_dir: Path,
+    artifact_cache: dict[Path, dict[str, object]],
+) -> tuple[pd.DataFrame, list[Path], list[dict[str, object]]]:
     # Bike stations (latest per city)
     # Same pattern as metro stations: read latest Bronze snapshot per city and normalize to `BikeStation`.
-    bike_rows: list[dict[str, Any]] = []
+    bike_cols: dict[str, list[Any]] = {}
     bike_station_inputs: list[dict[str, object]] = []
     for city in config.tdx.bike.cities:
         city_dir = bronze_dir / "tdx" / "bike" / "stations" / f"city={city}"
@@ -218,80 +525,330 @@ def main() -> None:
             bike_station_inputs.append({"city": city, "path": str(latest)})
         bronze = read_bronze_json(latest)
         payload = bronze["payload"]
-        for item in payload:
-            bike_rows.append(asdict(TDXBikeClient.parse_station(item, city=city)))
+        for name, values in TDXBikeClient.parse_station_columns(payload, city=city).items():
+            bike_cols.setdefault(name, []).extend(values)
 
     # Build a DataFrame for bike station metadata (used for map overlays and spatial joins).
-    bike_df = pd.DataFrame(bike_rows)
+    bike_df = pd.DataFrame(bike_cols) if bike_cols.get("station_id") else pd.DataFrame()
     # Write a stable Silver CSV name.
     bike_out = silver_dir / "bike_stations.csv"
-    bike_df.to_csv(bike_out, index=False)
-    print(f"Wrote {bike_out}")
-    _emit_event(build_id=build_id, stage="bike_stations", progress_pct=40, artifacts=[bike_out])
+    written = write_table(bike_df, bike_out, fmt=args.format)
+    _refresh_artifacts(artifact_cache, written)
+    return bike_df, written, bike_station_inputs
+
+
+def _external_tables_stage(
+    args: argparse.Namespace,
+    silver_dir: Path,
+    artifact_cache: dict[Path, dict[str, object]],
+) -> tuple[dict[str, object], list[Path]]:
+    # External datasets (optional) → Silver dims/facts. Returns the source meta per written table
+    # and the written paths.
+    external_sources: dict[str, object] = {}
+    written: list[Path] = []
+
+    cal_path = Path(args.external_calendar_csv)
+    if cal_path.exists():
+        cal_df = load_external_calendar_csv(cal_path)
+        issues = validate_external_calendar_df(cal_df)
+        errors = [i for i in issues if i.level == "error"]
+        if errors:
+            raise ValueError("Invalid external calendar CSV: " + "; ".join(i.message for i in errors))
+        cal_out = silver_dir / "calendar.csv"
+        cal_df.to_csv(cal_out, index=False)
+        _refresh_artifacts(artifact_cache, [cal_out])
+        written.append(cal_out)
+        try:
+            st = cal_path.stat()
+            external_sources["calendar_csv"] = {
+                "path": str(cal_path),
+                "exists": True,
+                "mtime_utc": datetime.fromtimestamp(st.st_mtime, tz=timezone.utc).isoformat(),
+                "size_bytes": int(st.st_size),
+                "row_count": int(len(cal_df)),
+            }
+        except Exception:
+            external_sources["calendar_csv"] = {"path": str(cal_path), "exists": True, "row_count": int(len(cal_df))}
+
+    w_path = Path(args.external_weather_hourly_csv)
+    if w_path.exists():
+        w_df = load_external_weather_hourly_csv(w_path)
+        issues = validate_external_weather_hourly_df(w_df)
+        errors = [i for i in issues if i.level == "error"]
+        if errors:
+            raise ValueError("Invalid external weather hourly CSV: " + "; ".join(i.message for i in errors))
+        w_out = silver_dir / "weather_hourly.csv"
+        w_df.to_csv(w_out, index=False)
+        _refresh_artifacts(artifact_cache, [w_out])
+        written.append(w_out)
+        try:
+            st = w_path.stat()
+            external_sources["weather_hourly_csv"] = {
+                "path": str(w_path),
+                "exists": True,
+                "mtime_utc": datetime.fromtimestamp(st.st_mtime, tz=timezone.utc).isoformat(),
+                "size_bytes": int(st.st_size),
+                "row_count": int(len(w_df)),
+            }
+        except Exception:
+            external_sources["weather_hourly_csv"] = {"path": str(w_path), "exists": True, "row_count": int(len(w_df))}
+
+    return external_sources, written
+
+
+async def _gather_in_threads(*stages: Any) -> list[Any]:
+    # Run blocking stage callables in worker threads; results come back in argument order.
+    return list(await asyncio.gather(*(asyncio.to_thread(stage) for stage in stages)))
+
+
+def main() -> None:
+    # Build a CLI parser so Silver can be rebuilt deterministically from a chosen Bronze directory.
+    parser = argparse.ArgumentParser()
+    # Bronze is the raw data lake root written by `scripts/extract_*` and `scripts/collect_*` scripts.
+    parser.add_argument("--bronze-dir", default="data/bronze")
+    # Silver directory is where we write normalized CSVs used by the API and later analytics.
+    parser.add_argument("--silver-dir", default="data/silver")
+    # Cap the number of availability files to avoid unbounded memory usage in long-running collections.
+    parser.add_argument("--max-availability-files", type=int, default=500)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Processes used to parse availability snapshots (0 = CPU count, 1 = sequential).",
+    )
+    parser.add_argument(
+        "--no-parse-cache",
+        action="store_true",
+        help="Re-parse every availability snapshot (ignore `<silver-dir>/.cache/availability`).",
+    )
+    # Polars (optional) runs the rent/return proxy sort + per-station diff multi-threaded, and
+    # writes the bike_timeseries CSVs (byte-identical to pandas' slow per-row `ts` formatting).
+    parser.add_argument(
+        "--engine",
+        choices=PROXY_ENGINES,
+        default="pandas",
+        help=(
+            "Engine for the rent/return proxy step and the bike_timeseries CSV writer "
+            "(`polars` needs the optional polars package)."
+        ),
+    )
+    # Parquet siblings skip text parsing on re-read; CSV stays available for tools that expect it.
+    parser.add_argument(
+        "--format",
+        choices=TABLE_FORMATS,
+        default="both",
+        help="Silver table format: CSV, Parquet (next to the CSV path), or both.",
+    )
+    parser.add_argument("--write-sqlite", action="store_true", help="Write `data/silver/metrobikeatlas.db` for scalable reads.")
+    # `inputs_hash` uses blake3 when installed; this pins the historical sha256 digest instead.
+    parser.add_argument(
+        "--legacy-hash",
+        action="store_true",
+        help="Compute `inputs_hash` as sha256 over `json.dumps` (the pre-blake3 digest).",
+    )
+    # Optional external metro station fallback for cases where TDX metro endpoints are unavailable (404).
+    parser.add_argument("--external-metro-stations-csv", default="data/external/metro_stations.csv")
+    # Optional external datasets for policy/storytelling features.
+    parser.add_argument("--external-calendar-csv", default="data/external/calendar.csv")
+    parser.add_argument("--external-weather-hourly-csv", default="data/external/weather_hourly.csv")
+    parser.add_argument(
+        "--prefer-external-metro",
+        action="store_true",
+        help="Use external metro station CSV even if TDX metro Bronze exists.",
+    )
+    # Parse CLI arguments once at startup to keep control flow deterministic.
+    args = parser.parse_args()
+
+    build_id = uuid.uuid4().hex
+    started_at = datetime.now(timezone.utc)
+    _emit_event(build_id=build_id, stage="starting", progress_pct=0, message="build_silver started")
+    artifact_cache: dict[Path, dict[str, object]] = {}
+
+    # Load typed config to obtain the city lists and spatial settings (buffer radius / nearest K).
+    config = load_config()
+    # Resolve Bronze/Silver directories from CLI args.
+    bronze_dir = Path(args.bronze_dir)
+    silver_dir = Path(args.silver_dir)
+    # Ensure the Silver output directory exists before writing CSVs.
+    silver_dir.mkdir(parents=True, exist_ok=True)
+
+    # Metro stations, bike stations and the external tables do not depend on each other: build them in
+    # threads so their Bronze/CSV reads and writes overlap. Stages return their written paths; the
+    # "Wrote" lines and events are printed afterwards in stage order, so logs never interleave.
+    metro_stage, bike_stage, external_stage = asyncio.run(
+        _gather_in_threads(
+            partial(_metro_stations_stage, args, config, bronze_dir, silver_dir, artifact_cache),
+            partial(_bike_stations_stage, args, config, bronze_dir, silver_dir, artifact_cache),
+            partial(_external_tables_stage, args, silver_dir, artifact_cache),
+        )
+    )
+    metro_df, written, metro_meta = metro_stage
+    metro_out = silver_dir / "metro_stations.csv"
+    metro_source = metro_meta["metro_source"]
+    metro_station_inputs = metro_meta["metro_station_inputs"]
+    external_metro_path = metro_meta["external_metro_path"]
+    external_metro_row_count = metro_meta["external_metro_row_count"]
+    # Print output paths so logs show what was produced.
+    for out in written:
+        print(f"Wrote {out}")
+    _emit_event(
+        build_id=build_id,
+        stage="metro_stations",
+        progress_pct=20,
+        artifacts=written,
+        status_cache=artifact_cache,
+    )
+
+    bike_df, written, bike_station_inputs = bike_stage
+    bike_out = silver_dir / "bike_stations.csv"
+    for out in written:
+        print(f"Wrote {out}")
+    _emit_event(
+        build_id=build_id,
+        stage="bike_stations",
+        progress_pct=40,
+        artifacts=written,
+        status_cache=artifact_cache,
+    )
+
+    external_sources, written = external_stage
+    for out in written:
+        print(f"Wrote {out}")
 
     # Bike availability snapshots (all files; capped)
     # Availability is time-varying, so we read multiple Bronze snapshot files to form a time series.
-    availability_rows: list[dict[str, Any]] = []
+    availability_cols: dict[str, list[Any]] = {c: [] for c in _AVAILABILITY_COLUMNS}
     availability_inputs: list[dict[str, object]] = []
+    availability_tasks: list[tuple[str, str]] = []
+    availability_cache_names: list[str] = []
     for city in config.tdx.bike.cities:
         city_dir = bronze_dir / "tdx" / "bike" / "availability" / f"city={city}"
         # Cap to the most recent N files so long-running collections don't blow up memory/time.
-        files = sorted(city_dir.glob("*.json"))[-args.max_availability_files :]
+        files = _json_entries(city_dir, newest=args.max_availability_files)
         if files:
-            latest = files[-1]
+            latest = files[-1].path
             try:
-                st = latest.stat()
+                st = files[-1].stat()
                 availability_inputs.append(
                     {
                         "city": city,
                         "file_count_used": int(len(files)),
-                        "latest_path": str(latest),
+                        "latest_path": latest,
                         "latest_mtime_utc": datetime.fromtimestamp(st.st_mtime, tz=timezone.utc).isoformat(),
                         "latest_size_bytes": int(st.st_size),
                     }
                 )
             except Exception:
                 availability_inputs.append(
-                    {"city": city, "file_count_used": int(len(files)), "latest_path": str(latest)}
+                    {"city": city, "file_count_used": int(len(files)), "latest_path": latest}
                 )
-        for f in files:
-            # Each file is a wrapper with `payload` holding a list of station availability records.
-            bronze = read_bronze_json(f)
-            payload = bronze["payload"]
-            for item in payload:
-                # Normalize raw availability into a typed dataclass so timestamps and counts have stable types.
-                record = TDXBikeClient.parse_availability(item)
-                # Add city so multi-city collections remain distinguishable in a single DataFrame.
-                availability_rows.append({**asdict(record), "city": city})
+        availability_tasks.extend((f.path, city) for f in files)
+        availability_cache_names.extend(
+            _availability_cache_name(f.path, city, f.stat()) for f in files
+        )
+
+    # Fan out one task per file; `map` keeps file order so the resulting rows match a sequential read.
+    workers = int(args.workers) if int(args.workers) > 0 else (os.cpu_count() or 1)
+    # With pyarrow, each parsed file is kept as an Arrow table (flat typed buffers, not Python
+    # objects) and all of them are concatenated once at the end; the concat only gathers chunks.
+    collect_arrow = has_pyarrow()
+    # Parsed snapshots are cached per file (Arrow IPC under `<silver>/.cache/availability`), so a
+    # rebuild after a few new snapshots only parses the new files.
+    cache_dir = silver_dir / ".cache" / "availability"
+    use_cache = collect_arrow and not args.no_parse_cache
+    cache_paths = None
+    if use_cache:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_paths = [str(cache_dir / name) for name in availability_cache_names]
+    availability_tables: list[Any] = []
+    availability_row_count = 0
+    parsed_files = _iter_availability_files(
+        availability_tasks, workers=workers, arrow=collect_arrow, cache_paths=cache_paths
+    )
+    for parsed in parsed_files:
+        if not collect_arrow:
+            availability_row_count += len(parsed["station_id"])
+            for name in _AVAILABILITY_COLUMNS:
+                availability_cols[name].extend(parsed[name])
+            continue
+        if parsed is None:
+            continue
+        availability_row_count += parsed.num_rows
+        if availability_tables and parsed.schema != availability_tables[0].schema:
+            # The first file fixes the `ts` tz (e.g. `+08:00`); the cast only swaps metadata.
+            parsed = parsed.cast(availability_tables[0].schema)
+        availability_tables.append(parsed)
+    has_availability = availability_row_count > 0
+    if use_cache:
+        # Drop entries for snapshots that changed or left the `--max-availability-files` window.
+        keep = set(availability_cache_names)
+        for name in _scan_dir_once(cache_dir):
+            if name not in keep:
+                (cache_dir / name).unlink(missing_ok=True)
 
     # Only write `bike_timeseries.csv` if we actually collected availability snapshots.
-    if availability_rows:
-        # Build a DataFrame to support temporal operations and CSV export.
-        availability_df = pd.DataFrame(availability_rows)
+    if has_availability:
+        # Build a DataFrame for temporal operations and CSV export (column lists → no transpose).
+        if collect_arrow:
+            import pyarrow as pa  # type: ignore
+
+            combined = pa.concat_tables(availability_tables)
+            availability_tables.clear()
+            # `self_destruct` frees each Arrow column once it is converted (lower peak memory).
+            availability_df = combined.to_pandas(self_destruct=True, split_blocks=True)
+            del combined
+        else:
+            availability_df = _availability_frame(availability_cols)
+            # Release the per-column Python lists; the DataFrame owns typed copies now.
+            availability_cols.clear()
+
+    if has_availability:
+        engine = str(args.engine)
+        if engine == "polars" and not has_polars():
+            print("polars is not installed; using pandas for the rent/return proxy and CSV output.")
+            engine = "pandas"
+        # Narrow the count columns first (less memory for the sort/diff and every write below).
+        _downcast_counts(availability_df, ("available_bikes", "available_docks"))
         # Compute a simple rent/return proxy from availability deltas (useful when true trip data is missing).
         availability_df = compute_rent_return_proxy(
             availability_df,
             station_id_col="station_id",
             ts_col="ts",
             available_bikes_col="available_bikes",
+            engine=engine,
         )
+        _downcast_counts(availability_df, ("rent_proxy", "return_proxy"))
         # Write the bike time series Silver table.
         ts_out = silver_dir / "bike_timeseries.csv"
-        availability_df.to_csv(ts_out, index=False)
-        print(f"Wrote {ts_out}")
-        _emit_event(build_id=build_id, stage="bike_timeseries", progress_pct=60, artifacts=[ts_out])
+        written = write_table(availability_df, ts_out, fmt=args.format, csv_engine=engine)
+        _refresh_artifacts(artifact_cache, written)
+        for out in written:
+            print(f"Wrote {out}")
+        _emit_event(
+            build_id=build_id,
+            stage="bike_timeseries",
+            progress_pct=60,
+            artifacts=written,
+            status_cache=artifact_cache,
+        )
+
+        # Convert `ts` to UTC exactly once; the daily parts and the SQLite store below both read this
+        # typed column. The monolithic table is already written, so replacing the column is safe.
+        availability_df["ts"] = _utc_timestamps(availability_df["ts"])
 
         # Optional: write daily partitioned files for long-run scaling (repository can read only needed days).
+        # Each day is `YYYY-MM-DD.csv` and/or `YYYY-MM-DD.parquet`, matching `--format`.
         try:
             parts_dir = silver_dir / "bike_timeseries_parts"
             parts_dir.mkdir(parents=True, exist_ok=True)
-            df = availability_df.copy()
-            df["ts"] = pd.to_datetime(df["ts"], utc=True, errors="coerce")
-            df = df.dropna(subset=["ts"])
-            df["day"] = df["ts"].dt.strftime("%Y-%m-%d")
-            for day, g in df.groupby("day"):
-                out = parts_dir / f"{day}.csv"
-                g.drop(columns=["day"]).to_csv(out, index=False)
+            # Bucket rows by UTC day with a vectorized floor (no full-table copy or per-row strftime);
+            # rows with unparseable timestamps have a NaT key and are dropped by the groupby.
+            ts_utc = availability_df["ts"]
+            for day, idx in ts_utc.groupby(ts_utc.dt.floor("D")).indices.items():
+                # Parts store `ts` in UTC; only this day's rows are taken (one copy, no `assign`).
+                g = availability_df.iloc[idx]
+                out = parts_dir / f"{day.strftime('%Y-%m-%d')}.csv"
+                write_table(g, out, fmt=args.format, csv_engine=engine)
         except Exception:
             # Best-effort: keep the primary monolithic CSV as the source of truth.
             pass
@@ -308,85 +865,52 @@ def main() -> None:
     # Metro↔bike links
     # Build a station-to-station link table so the API can aggregate nearby bike stations per metro station.
     links_df = build_station_bike_links(
-        # Use only the required columns to keep join logic focused and fast.
-        metro_df[["station_id", "lat", "lon"]],
-        bike_df[["station_id", "lat", "lon"]],
+        # Pass the frames as-is: the join only reads the id/lat/lon columns (as numpy arrays), so
+        # projecting them first would just copy both tables.
+        metro_df,
+        bike_df,
         # Spatial settings (buffer radius or nearest K) come from config for reproducibility.
         settings=config.spatial,
     )
     # Write links to a stable Silver CSV name so downstream code can locate it reliably.
     links_out = silver_dir / "metro_bike_links.csv"
-    links_df.to_csv(links_out, index=False)
-    print(f"Wrote {links_out}")
-    _emit_event(build_id=build_id, stage="links", progress_pct=90, artifacts=[links_out])
-
-    # External datasets (optional) → Silver dims/facts.
-    external_sources: dict[str, object] = {}
-
-    cal_path = Path(args.external_calendar_csv)
-    if cal_path.exists():
-        cal_df = load_external_calendar_csv(cal_path)
-        issues = validate_external_calendar_df(cal_df)
-        errors = [i for i in issues if i.level == "error"]
-        if errors:
-            raise ValueError("Invalid external calendar CSV: " + "; ".join(i.message for i in errors))
-        cal_out = silver_dir / "calendar.csv"
-        cal_df.to_csv(cal_out, index=False)
-        print(f"Wrote {cal_out}")
-        try:
-            st = cal_path.stat()
-            external_sources["calendar_csv"] = {
-                "path": str(cal_path),
-                "exists": True,
-                "mtime_utc": datetime.fromtimestamp(st.st_mtime, tz=timezone.utc).isoformat(),
-                "size_bytes": int(st.st_size),
-                "row_count": int(len(cal_df)),
-            }
-        except Exception:
-            external_sources["calendar_csv"] = {"path": str(cal_path), "exists": True, "row_count": int(len(cal_df))}
-
-    w_path = Path(args.external_weather_hourly_csv)
-    if w_path.exists():
-        w_df = load_external_weather_hourly_csv(w_path)
-        issues = validate_external_weather_hourly_df(w_df)
-        errors = [i for i in issues if i.level == "error"]
-        if errors:
-            raise ValueError("Invalid external weather hourly CSV: " + "; ".join(i.message for i in errors))
-        w_out = silver_dir / "weather_hourly.csv"
-        w_df.to_csv(w_out, index=False)
-        print(f"Wrote {w_out}")
-        try:
-            st = w_path.stat()
-            external_sources["weather_hourly_csv"] = {
-                "path": str(w_path),
-                "exists": True,
-                "mtime_utc": datetime.fromtimestamp(st.st_mtime, tz=timezone.utc).isoformat(),
-                "size_bytes": int(st.st_size),
-                "row_count": int(len(w_df)),
-            }
-        except Exception:
-            external_sources["weather_hourly_csv"] = {"path": str(w_path), "exists": True, "row_count": int(len(w_df))}
+    written = write_table(links_df, links_out, fmt=args.format)
+    _refresh_artifacts(artifact_cache, written)
+    for out in written:
+        print(f"Wrote {out}")
+    _emit_event(
+        build_id=build_id,
+        stage="links",
+        progress_pct=90,
+        artifacts=written,
+        status_cache=artifact_cache,
+    )
 
     if args.write_sqlite:
+        db_path = silver_dir / "metrobikeatlas.db"
+        # Build into a temp file and swap it in, so readers never see a half-written store.
+        db_tmp = db_path.with_suffix(".db.tmp")
         try:
-            db_path = silver_dir / "metrobikeatlas.db"
-            if db_path.exists():
-                db_path.unlink()
-            conn = sqlite3.connect(str(db_path))
+            db_tmp.unlink(missing_ok=True)
+            conn = sqlite3.connect(str(db_tmp))
             try:
+                # One-shot bulk load into a fresh file: no rollback journal or fsyncs needed.
+                # 32 KiB pages (set before the first write) mean fewer b-tree pages and splits.
+                conn.execute("PRAGMA page_size=32768")
+                conn.execute("PRAGMA journal_mode=OFF")
+                conn.execute("PRAGMA synchronous=OFF")
                 # Write only the heavy table for now (bike_timeseries). Others remain CSV.
-                if availability_rows:
-                    availability_df2 = availability_df.copy()
-                    availability_df2["ts"] = pd.to_datetime(availability_df2["ts"], utc=True, errors="coerce")
-                    availability_df2 = availability_df2.dropna(subset=["ts"])
-                    availability_df2["ts"] = availability_df2["ts"].dt.strftime("%Y-%m-%dT%H:%M:%S%z")
-                    availability_df2.to_sql("bike_timeseries", conn, if_exists="replace", index=False)
-                    conn.execute("CREATE INDEX IF NOT EXISTS idx_bike_ts_station_ts ON bike_timeseries(station_id, ts)")
-                    conn.commit()
+                if has_availability:
+                    with conn:
+                        _write_bike_timeseries_sqlite(conn, availability_df)
+                        conn.execute("CREATE INDEX IF NOT EXISTS idx_bike_ts_station_ts ON bike_timeseries(station_id, ts)")
             finally:
                 conn.close()
+            os.replace(db_tmp, db_path)
+            _refresh_artifacts(artifact_cache, [db_path])
             print(f"Wrote {db_path}")
         except Exception:
+            db_tmp.unlink(missing_ok=True)
             print("Failed to write SQLite store; continuing with CSV outputs.")
 
     external_csv_meta: dict[str, object] | None = None
@@ -411,6 +935,7 @@ def main() -> None:
             "silver_dir": str(args.silver_dir),
             "max_availability_files": int(args.max_availability_files),
             "write_sqlite": bool(args.write_sqlite),
+            "format": str(args.format),
             "external_metro_stations_csv": str(args.external_metro_stations_csv),
             "prefer_external_metro": bool(args.prefer_external_metro),
             "external_calendar_csv": str(args.external_calendar_csv),
@@ -425,9 +950,11 @@ def main() -> None:
             "bike_availability_summary_by_city": availability_inputs,
         },
     }
-    inputs_hash = hashlib.sha256(json.dumps(inputs, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+    inputs_hash, inputs_hash_algo = _inputs_hash(inputs, legacy=bool(args.legacy_hash))
 
     finished_at = datetime.now(timezone.utc)
+    # Every artifact lives directly in `silver_dir`: list it once instead of stat'ing each path.
+    silver_stats = {silver_dir: _scan_dir_once(silver_dir)}
     build_meta = {
         "type": "silver_build_meta",
         "build_id": build_id,
@@ -435,22 +962,29 @@ def main() -> None:
         "finished_at_utc": finished_at.isoformat(),
         "duration_s": float((finished_at - started_at).total_seconds()),
         "inputs_hash": inputs_hash,
+        "inputs_hash_algo": inputs_hash_algo,
         "inputs": inputs,
         "artifacts": [
-            _artifact_status(metro_out),
-            _artifact_status(bike_out),
-            _artifact_status(links_out),
-            _artifact_status(silver_dir / "bike_timeseries.csv"),
-            _artifact_status(silver_dir / "metro_timeseries.csv"),
-            _artifact_status(silver_dir / "calendar.csv"),
-            _artifact_status(silver_dir / "weather_hourly.csv"),
-            _artifact_status(silver_dir / "metrobikeatlas.db"),
-        ],
+            _artifact_status(metro_out, artifact_cache, dir_stats=silver_stats),
+            _artifact_status(bike_out, artifact_cache, dir_stats=silver_stats),
+            _artifact_status(links_out, artifact_cache, dir_stats=silver_stats),
+            _artifact_status(silver_dir / "bike_timeseries.csv", artifact_cache, dir_stats=silver_stats),
+            _artifact_status(silver_dir / "metro_timeseries.csv", artifact_cache, dir_stats=silver_stats),
+            _artifact_status(silver_dir / "calendar.csv", artifact_cache, dir_stats=silver_stats),
+            _artifact_status(silver_dir / "weather_hourly.csv", artifact_cache, dir_stats=silver_stats),
+            _artifact_status(silver_dir / "metrobikeatlas.db", artifact_cache, dir_stats=silver_stats),
+        ]
+        + (
+            [
+                _artifact_status(parquet_sibling(p), artifact_cache, dir_stats=silver_stats)
+                for p in (metro_out, bike_out, links_out, silver_dir / "bike_timeseries.csv")
+            ]
+            if args.format != "csv"
+            else []
+        ),
     }
     meta_out = silver_dir / "_build_meta.json"
-    tmp = meta_out.with_suffix(".json.tmp")
-    tmp.write_text(json.dumps(build_meta, ensure_ascii=False, indent=2), encoding="utf-8")
-    tmp.replace(meta_out)
+    write_json(meta_out, build_meta)
     print(f"Wrote {meta_out}")
 
     # Replayable schema contract for Silver tables.
@@ -464,6 +998,7 @@ def main() -> None:
         stage="done",
         progress_pct=100,
         message="build_silver completed",
+        status_cache=artifact_cache,
         artifacts=[
             metro_out,
             bike_out,
@@ -3,52 +3,83 @@ from __future__ import annotations
 import argparse
 import os
 from pathlib import Path
+import signal
 import subprocess
 import sys
 import time
 
 
-def _is_pid_running(pid: int) -> bool:
+def _lock_path(repo_root: Path) -> Path:
+    return repo_root / "logs" / "locks" / "build_silver.lock"
+
+
+def _open_lock(lock_file: Path) -> int:
+    # The lock is a kernel advisory lock on this descriptor, not the file's existence:
+    # it is released when the process exits (even on a crash), so there are no stale lock files.
+    lock_file.parent.mkdir(parents=True, exist_ok=True)
+    return os.open(str(lock_file), os.O_RDWR | os.O_CREAT, 0o644)
+
+
+def _lock(fd: int, *, blocking: bool) -> bool:
+    # True once `fd` holds the exclusive lock; False if another process holds it (non-blocking).
     try:
-        os.kill(pid, 0)
-    except ProcessLookupError:
+        if os.name == "nt":
+            import msvcrt
+
+            msvcrt.locking(fd, msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except (BlockingIOError, PermissionError):
         return False
-    except PermissionError:
-        return True
+    except OSError:
+        # `msvcrt.LK_LOCK` gives up after ~10 s of retries.
+        if os.name == "nt" and blocking:
+            return False
+        raise
     return True
 
 
-def _lock_path(repo_root: Path) -> Path:
-    return repo_root / "logs" / "locks" / "build_silver.lock"
+class _LockTimeout(Exception):
+    pass
 
 
-def _try_acquire(lock_file: Path) -> tuple[bool, int | None]:
-    lock_file.parent.mkdir(parents=True, exist_ok=True)
+def _lock_with_timeout(fd: int, wait_s: int) -> bool:
+    # Block in the kernel until the holder releases the lock (no polling), bounded by `wait_s`.
+    if os.name == "nt" or not hasattr(signal, "SIGALRM"):
+        deadline = time.monotonic() + wait_s
+        while not _lock(fd, blocking=True):
+            if time.monotonic() >= deadline:
+                return False
+        return True
+
+    def _on_alarm(signum: int, frame: object) -> None:
+        raise _LockTimeout()
+
+    previous = signal.signal(signal.SIGALRM, _on_alarm)
+    signal.alarm(wait_s)
     try:
-        fd = os.open(str(lock_file), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
-    except FileExistsError:
-        try:
-            existing = int(lock_file.read_text(encoding="utf-8").strip())
-        except Exception:
-            existing = None
-        if existing and not _is_pid_running(existing):
-            try:
-                lock_file.unlink()
-            except Exception:
-                return False, existing
-            return _try_acquire(lock_file)
-        return False, existing
-    else:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            f.write(str(os.getpid()))
-        return True, None
-
-
-def _release(lock_file: Path) -> None:
+        return _lock(fd, blocking=True)
+    except _LockTimeout:
+        return False
+    finally:
+        signal.alarm(0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _holder_pid(fd: int) -> int | None:
+    # The holder writes its pid into the lock file for diagnostics only.
     try:
-        lock_file.unlink()
-    except Exception:
-        pass
+        return int(os.pread(fd, 32, 0).decode("utf-8").strip())
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _write_pid(fd: int) -> None:
+    os.ftruncate(fd, 0)
+    os.lseek(fd, 0, os.SEEK_SET)
+    os.write(fd, str(os.getpid()).encode("utf-8"))
 
 
 def main() -> int:
@@ -59,28 +90,25 @@ def main() -> int:
 
     lock_file = _lock_path(repo_root)
     wait_s = max(int(args.wait_seconds), 0)
-    started = time.monotonic()
-
-    while True:
-        ok, existing_pid = _try_acquire(lock_file)
-        if ok:
-            break
-        if wait_s <= 0:
-            sys.stderr.write(f"build_silver locked by pid={existing_pid}\n")
-            return 3
-        if time.monotonic() - started > wait_s:
-            sys.stderr.write(f"build_silver lock timeout (pid={existing_pid})\n")
-            return 4
-        time.sleep(2.0)
-
-    # Run the real script under this lock, then release.
-    script = repo_root / "scripts" / "build_silver.py"
-    cmd = [sys.executable, str(script)] + rest
+
+    fd = _open_lock(lock_file)
     try:
+        if not _lock(fd, blocking=False):
+            if wait_s <= 0:
+                sys.stderr.write(f"build_silver locked by pid={_holder_pid(fd)}\n")
+                return 3
+            if not _lock_with_timeout(fd, wait_s):
+                sys.stderr.write(f"build_silver lock timeout (pid={_holder_pid(fd)})\n")
+                return 4
+        _write_pid(fd)
+
+        # Run the real script under this lock; closing `fd` releases it.
+        script = repo_root / "scripts" / "build_silver.py"
+        cmd = [sys.executable, str(script)] + rest
         proc = subprocess.run(cmd, cwd=str(repo_root))
         return int(proc.returncode)
     finally:
-        _release(lock_file)
+        os.close(fd)
 
 
 if __name__ == "__main__":
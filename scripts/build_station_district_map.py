@@ -16,10 +16,13 @@ import pandas as pd
 from metrobikeatlas.config.loader import load_config
 from metrobikeatlas.gis.boundaries import BoundaryIndex
 from metrobikeatlas.utils.logging import configure_logging
+from metrobikeatlas.utils.tables import read_table, table_columns
 
 
 logger = logging.getLogger(__name__)
 
+_METRO_COLUMNS = ["station_id", "lat", "lon"]
+
 
 def main() -> None:
     parser = argparse.ArgumentParser()
@@ -52,22 +55,21 @@ def main() -> None:
         )
 
     silver_dir = Path(args.silver_dir)
-    metro = pd.read_csv(silver_dir / "metro_stations.csv")
-    if not {"station_id", "lat", "lon"} <= set(metro.columns):
+    # Silver may be CSV and/or Parquet (`build_silver.py --format`); read the fresher one, and only
+    # the three columns used below (Parquet skips the other column chunks entirely).
+    metro_path = silver_dir / "metro_stations.csv"
+    if not set(_METRO_COLUMNS) <= set(table_columns(metro_path)):
         raise ValueError("metro_stations.csv must include station_id, lat, lon")
+    metro = read_table(metro_path, columns=_METRO_COLUMNS, dtype={"station_id": str})
 
     index = BoundaryIndex.from_geojson(boundaries_path, name_property=args.name_property)
 
-    rows = []
-    missing = 0
-    for _, row in metro.iterrows():
-        station_id = str(row["station_id"])
-        district = index.lookup(lat=float(row["lat"]), lon=float(row["lon"]))
-        if not district:
-            missing += 1
-        rows.append({"station_id": station_id, "district": district})
-
-    out_df = pd.DataFrame(rows)
+    # One vectorized point-in-polygon pass over all stations (same first-match order as `lookup`).
+    districts = index.lookup_batch(
+        lats=metro["lat"].to_numpy(dtype=float), lons=metro["lon"].to_numpy(dtype=float)
+    )
+    missing = int(pd.isna(districts).sum())
+    out_df = pd.DataFrame({"station_id": metro["station_id"].astype(str), "district": districts})
     out_path.parent.mkdir(parents=True, exist_ok=True)
     out_df.to_csv(out_path, index=False)
     logger.info("Wrote %s (missing=%s/%s)", out_path, missing, len(out_df))
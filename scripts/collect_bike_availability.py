@@ -10,10 +10,14 @@ sys.path.insert(0, str(SRC_PATH))
 
 # `argparse` provides a stable CLI interface for production-style scripts (no interactive prompts).
 import argparse
+# `asyncio` fans the per-city requests out to worker threads (cities are independent endpoints).
+import asyncio
 # We stamp each Bronze file with a timezone-aware UTC timestamp for traceability and reproducibility.
 from datetime import datetime, timezone
 # `os.getenv` enables per-run tuning (rate limiting) without changing code.
 import os
+# `Any` types the loaded config passed to the per-city worker.
+from typing import Any
 
 # Config is loaded at runtime so we can change endpoints/cities without changing code (production-minded).
 from metrobikeatlas.config.loader import load_config
@@ -35,6 +39,46 @@ def _env_float(name: str, default: float) -> float:
         return float(default)
 
 
+def _collect_city(tdx: TDXClient, config: Any, bronze_dir: Path, city: str) -> Path:
+    # Build the realtime availability endpoint path for this city.
+    path = config.tdx.bike.availability_path_template.format(city=city)
+    # Force JSON output for consistent downstream parsing.
+    params = {"$format": "JSON"}
+    # Capture retrieval time in UTC so we can align snapshots across cities and runs.
+    retrieved_at = datetime.now(timezone.utc)
+    # Fetch JSON payload (handles OData paging when needed, but usually returns a single list).
+    max_pages = int(os.getenv("TDX_MAX_PAGES", "100"))
+    payload = tdx.get_json_all(path, params=params, max_pages=max_pages)
+
+    # Persist the raw payload plus request metadata so we can build a time series later (Silver).
+    return write_bronze_json(
+        bronze_dir,
+        source="tdx",
+        domain="bike",
+        dataset="availability",
+        city=city,
+        retrieved_at=retrieved_at,
+        request={"path": path, "params": params},
+        payload=payload,
+    )
+
+
+async def _collect_cities(
+    tdx: TDXClient, config: Any, bronze_dir: Path, cities: list[str], *, concurrency: int
+) -> list[Path | BaseException]:
+    # At most `concurrency` cities are in flight; the client's throttle still spaces request starts
+    # by `TDX_MIN_REQUEST_INTERVAL_S`, so only network latency overlaps. Results keep city order.
+    sem = asyncio.Semaphore(max(concurrency, 1))
+
+    async def _one(city: str) -> Path:
+        async with sem:
+            return await asyncio.to_thread(_collect_city, tdx, config, bronze_dir, city)
+
+    # One failing city must not hide the files the other cities already wrote: collect every
+    # outcome (a written path or the city's exception) and let the caller report them all.
+    return list(await asyncio.gather(*(_one(city) for city in cities), return_exceptions=True))
+
+
 # Keep all side effects (config IO, network calls, filesystem writes) inside `main()` so the module is import-safe.
 def main() -> None:
     # Build a CLI parser so users can run this as a repeatable command or schedule it via cron.
@@ -43,6 +87,10 @@ def main() -> None:
     parser.add_argument("--config", default=None, help="Config JSON path.")
     # Bronze directory is a local data lake root; it is gitignored and treated as a runtime artifact.
     parser.add_argument("--bronze-dir", default="data/bronze")
+    # Cities fetched in parallel (the shared client still enforces the request interval).
+    parser.add_argument(
+        "--concurrency", type=int, default=int(os.getenv("TDX_CITY_CONCURRENCY", "4"))
+    )
     # Parse CLI arguments once at startup to keep control flow deterministic.
     args = parser.parse_args()
 
@@ -66,30 +114,25 @@ def main() -> None:
         min_request_interval_s=_env_float("TDX_MIN_REQUEST_INTERVAL_S", 0.2),
         request_jitter_s=_env_float("TDX_REQUEST_JITTER_S", 0.05),
     ) as tdx:
-        # Iterate configured bike cities; each snapshot is partitioned by city in Bronze.
-        for city in config.tdx.bike.cities:
-            # Build the realtime availability endpoint path for this city.
-            path = config.tdx.bike.availability_path_template.format(city=city)
-            # Force JSON output for consistent downstream parsing.
-            params = {"$format": "JSON"}
-            # Capture retrieval time in UTC so we can align snapshots across cities and runs.
-            retrieved_at = datetime.now(timezone.utc)
-            # Fetch JSON payload (handles OData paging when needed, but usually returns a single list).
-            payload = tdx.get_json_all(path, params=params, max_pages=int(os.getenv("TDX_MAX_PAGES", "100")))
-
-            # Persist the raw payload plus request metadata so we can build a time series later (Silver).
-            out = write_bronze_json(
-                bronze_dir,
-                source="tdx",
-                domain="bike",
-                dataset="availability",
-                city=city,
-                retrieved_at=retrieved_at,
-                request={"path": path, "params": params},
-                payload=payload,
-            )
+        # Fetch configured bike cities concurrently; each snapshot is partitioned by city in Bronze.
+        cities = list(config.tdx.bike.cities)
+        outs = asyncio.run(
+            _collect_cities(tdx, config, bronze_dir, cities, concurrency=args.concurrency)
+        )
+
+    failed: list[str] = []
+    for city, out in zip(cities, outs):
+        if isinstance(out, BaseException):
+            # Report the failure but keep going, so every written file is still listed below.
+            print(f"Failed {city}: {type(out).__name__}: {out}", file=sys.stderr)
+            failed.append(city)
+        else:
             # Print the output path so job logs show what was produced (useful for debugging pipelines).
             print(f"Wrote {out}")
+    # Exit non-zero so cron/schedulers notice a partial snapshot.
+    if failed:
+        names = ", ".join(failed)
+        raise SystemExit(f"Failed to collect {len(failed)}/{len(cities)} cities: {names}")
 
 
 if __name__ == "__main__":
@@ -10,21 +10,31 @@ sys.path.insert(0, str(SRC_PATH))
 
 # `argparse` provides a stable CLI interface for long-running ingestion jobs (cron/daemon friendly).
 import argparse
+# `asyncio` drives the polling loop and fans the per-city requests out to worker threads.
+import asyncio
 # `logging` is used for continuous progress reporting and error visibility in long-running loops.
 import logging
+# One dedicated thread performs every Bronze write, separate from the fetch threads.
+from concurrent.futures import ThreadPoolExecutor
+# `signal` turns SIGTERM (`docker stop`) and SIGINT (Ctrl+C) into a graceful stop.
+import signal
 # `random` is used for jitter to avoid synchronized polling across machines (thundering herd).
 import random
-# `time.sleep` is used for simple scheduling between polling iterations.
+# `time.monotonic` schedules polls and the stop deadline (it never jumps with the wall clock).
 import time
 # `os.getenv` enables per-run tuning (rate limiting) without changing code.
 import os
-# We use timezone-aware UTC timestamps for consistent stop conditions and file metadata.
-from datetime import datetime, timedelta, timezone
+# We use timezone-aware UTC timestamps for Bronze file metadata.
+from datetime import datetime, timezone
+# Typing helpers for the per-city request metadata passed to the worker.
+from typing import Any, Mapping
 
 # Config is loaded at runtime so we can change endpoints/cities without changing code (production-minded).
 from metrobikeatlas.config.loader import load_config
 # Bronze writer persists raw API payload + request metadata so we can rebuild Silver/Gold deterministically.
 from metrobikeatlas.ingestion.bronze import write_bronze_json
+# `TDXBikeClient` holds the availability parsing rules the payload shape check reuses.
+from metrobikeatlas.ingestion.tdx_bike_client import TDXBikeClient
 # `TDXClient` handles OAuth tokens and retries; `TDXCredentials` reads secrets from env (never from git).
 from metrobikeatlas.ingestion.tdx_base import TDXClient, TDXCredentials
 # Centralized logging configuration keeps script output consistent across local runs and production jobs.
@@ -56,6 +66,310 @@ def _parse_cities(value: str | None) -> list[str] | None:
     return [c for c in cities if c]
 
 
+# Force JSON output for consistent downstream parsing (shared by every request; never mutated).
+_JSON_PARAMS: Mapping[str, str] = {"$format": "JSON"}
+
+
+def _write_city(
+    bronze_dir: Path, city: str, request: Mapping[str, Any], retrieved_at: datetime, payload: Any
+) -> Path:
+    # Check the payload against the Silver parsing rules now, so TDX schema changes surface at
+    # fetch time; a suspect snapshot is still written (flagged) rather than failing the poll.
+    suspect = TDXBikeClient.availability_payload_issue(payload)
+    if suspect:
+        logger.warning("Suspect availability payload (city=%s): %s", city, suspect)
+    # Persist the raw payload plus request metadata to Bronze for traceability.
+    return write_bronze_json(
+        bronze_dir,
+        source="tdx",
+        domain="bike",
+        dataset="availability",
+        city=city,
+        retrieved_at=retrieved_at,
+        request=request,
+        payload=payload,
+        suspect=suspect,
+    )
+
+
+class _PollMetrics:
+    """
+    Prometheus metrics for the loop, served over HTTP for scraping (instead of parsing logs).
+    """
+
+    def __init__(self, port: int) -> None:
+        from prometheus_client import Counter, Gauge, Histogram, start_http_server  # type: ignore
+
+        # Exposed as `tdx_bike_fetch_total` (prometheus_client adds the `_total` suffix).
+        self._fetches = Counter(
+            "tdx_bike_fetch", "Availability snapshot fetches by city/result.", ["city", "result"]
+        )
+        self._seconds = Histogram(
+            "tdx_bike_fetch_seconds", "Fetch + Bronze write time per city snapshot.", ["city"]
+        )
+        self._backoff = Gauge(
+            "tdx_bike_backoff_seconds", "Current failure backoff cap (0 while polls succeed)."
+        )
+        start_http_server(port)
+
+    def observe_fetch(self, city: str, seconds: float, *, ok: bool) -> None:
+        self._fetches.labels(city, "ok" if ok else "error").inc()
+        self._seconds.labels(city).observe(seconds)
+
+    def set_backoff(self, seconds: float) -> None:
+        self._backoff.set(seconds)
+
+
+def _start_metrics(port: int) -> _PollMetrics | None:
+    # None when disabled (port 0) or when the optional `prometheus_client` package is missing.
+    if port <= 0:
+        return None
+    try:
+        metrics = _PollMetrics(port)
+    except ModuleNotFoundError:
+        logger.warning("prometheus_client is not installed; metrics endpoint disabled.")
+        return None
+    logger.info("Serving Prometheus metrics on :%d/metrics", port)
+    return metrics
+
+
+async def _collect_cities(
+    tdx: TDXClient,
+    bronze_dir: Path,
+    requests_by_city: Mapping[str, Mapping[str, Any]],
+    *,
+    retrieved_at: datetime,
+    max_pages: int,
+    concurrency: int,
+    writer: ThreadPoolExecutor,
+    metrics: _PollMetrics | None = None,
+) -> list[Any]:
+    # At most `concurrency` cities are in flight; the client's throttle still spaces request starts
+    # by `TDX_MIN_REQUEST_INTERVAL_S`, so only network latency overlaps. Results keep city order;
+    # a failed city yields its exception instead of a Bronze path.
+    sem = asyncio.Semaphore(max(concurrency, 1))
+    loop = asyncio.get_running_loop()
+
+    async def _one(city: str) -> Path:
+        request = requests_by_city[city]
+        started = time.monotonic()
+        try:
+            async with sem:
+                # Fetch JSON payload (follows OData paging when needed; usually a single list).
+                payload = await asyncio.to_thread(
+                    tdx.get_json_all, request["path"], params=request["params"], max_pages=max_pages
+                )
+            # The write goes to the single writer thread after the fetch slot is released, so a
+            # slow (fsync-bound) disk never holds back the next city's request. At most one
+            # payload per city is pending, which bounds the memory held for queued writes.
+            path = await loop.run_in_executor(
+                writer, _write_city, bronze_dir, city, request, retrieved_at, payload
+            )
+        except Exception:
+            if metrics is not None:
+                metrics.observe_fetch(city, time.monotonic() - started, ok=False)
+            raise
+        if metrics is not None:
+            metrics.observe_fetch(city, time.monotonic() - started, ok=True)
+        return path
+
+    tasks = (_one(city) for city in requests_by_city)
+    return list(await asyncio.gather(*tasks, return_exceptions=True))
+
+
+def _stop_on_signals(stop: asyncio.Event) -> dict[int, Any]:
+    # Set `stop` on SIGTERM/SIGINT and return the previous handlers (for `_restore_signals`).
+    # The handler only schedules the stop on the event loop: logging or touching asyncio objects
+    # directly from a signal handler is not safe.
+    loop = asyncio.get_running_loop()
+
+    def _on_stop(signum: int) -> None:
+        if not stop.is_set():
+            logger.info("Stopping: received %s.", signal.Signals(signum).name)
+        stop.set()
+
+    def _handler(signum: int, frame: object) -> None:
+        loop.call_soon_threadsafe(_on_stop, signum)
+
+    return {sig: signal.signal(sig, _handler) for sig in (signal.SIGTERM, signal.SIGINT)}
+
+
+def _restore_signals(previous: Mapping[int, Any]) -> None:
+    for sig, handler in previous.items():
+        signal.signal(sig, handler)
+
+
+async def _sleep_unless_stopped(stop: asyncio.Event, seconds: float) -> bool:
+    # Sleep up to `seconds`; True as soon as `stop` is set (so shutdown never waits out a backoff).
+    try:
+        await asyncio.wait_for(stop.wait(), timeout=seconds)
+    except asyncio.TimeoutError:
+        return False
+    return True
+
+
+async def _poll(
+    tdx: TDXClient,
+    bronze_dir: Path,
+    requests_by_city: Mapping[str, Mapping[str, Any]],
+    args: argparse.Namespace,
+    *,
+    stop_at: float | None,
+    interval_s: int,
+    jitter_s: float,
+    backoff_s: int,
+    metrics: _PollMetrics | None = None,
+) -> None:
+    # Set by SIGTERM/SIGINT; sleeps return early, and an in-flight poll finishes its Bronze writes.
+    stop = asyncio.Event()
+    previous_handlers = _stop_on_signals(stop)
+    try:
+        # Leaving the `with` waits for queued Bronze writes (a stop never drops a fetched snapshot).
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="bronze-writer") as writer:
+            await _poll_until_stopped(
+                tdx,
+                bronze_dir,
+                requests_by_city,
+                args,
+                stop=stop,
+                writer=writer,
+                stop_at=stop_at,
+                interval_s=interval_s,
+                jitter_s=jitter_s,
+                backoff_s=backoff_s,
+                metrics=metrics,
+            )
+    finally:
+        _restore_signals(previous_handlers)
+
+
+async def _poll_until_stopped(
+    tdx: TDXClient,
+    bronze_dir: Path,
+    requests_by_city: Mapping[str, Mapping[str, Any]],
+    args: argparse.Namespace,
+    *,
+    stop: asyncio.Event,
+    writer: ThreadPoolExecutor,
+    stop_at: float | None,
+    interval_s: int,
+    jitter_s: float,
+    backoff_s: int,
+    metrics: _PollMetrics | None,
+) -> None:
+    # Current backoff grows exponentially when failures persist.
+    current_backoff_s = backoff_s
+    # Loop counter is useful for deterministic stopping and for log context.
+    i = 0
+    # Polls are scheduled on a fixed grid `anchor + slot * interval_s`, so slow polls do not push
+    # every later poll back (no cumulative drift) and the mean poll rate stays `interval_s`.
+    anchor = time.monotonic()
+    # Grid slot of the most recently started poll.
+    slot = 0
+    while not stop.is_set():
+        # Stop when duration is reached (if configured).
+        if stop_at is not None and time.monotonic() >= stop_at:
+            logger.info("Stopping: duration reached.")
+            break
+        # Stop when max iterations is reached (if configured).
+        if args.max_iterations is not None and i >= int(args.max_iterations):
+            logger.info("Stopping: max iterations reached.")
+            break
+        # Increment loop counter at the start of each iteration.
+        i += 1
+
+        # `ok` counts successful city snapshots so we can decide whether to back off.
+        ok = 0
+        # Collect one snapshot per city per loop iteration, all cities in flight at once.
+        poll_started = time.monotonic()
+        # One retrieval time per poll, shared by every city: the files of a poll form one snapshot
+        # and carry the same `retrieved_at` (and file name), whatever order the cities finish in.
+        retrieved_at = datetime.now(timezone.utc)
+        results = await _collect_cities(
+            tdx,
+            bronze_dir,
+            requests_by_city,
+            retrieved_at=retrieved_at,
+            max_pages=int(os.getenv("TDX_MAX_PAGES", "100")),
+            concurrency=int(args.concurrency),
+            writer=writer,
+            metrics=metrics,
+        )
+        # `city:file name` per Bronze file written this poll, for the one-line summary below.
+        written: list[str] = []
+        # Results keep city order so logs stay stable; wall time is the slowest city either way.
+        for city, result in zip(requests_by_city, results):
+            if isinstance(result, Exception):
+                # Log full stack trace so operators can debug transient network/API failures.
+                logger.error(
+                    "Failed to fetch availability snapshot (city=%s)", city, exc_info=result
+                )
+                continue
+            # Mark this city as successful so the loop does not enter global backoff mode.
+            ok += 1
+            written.append(f"{city}:{result.name}")
+            # Full output paths are available at DEBUG level.
+            logger.debug("Wrote %s", result)
+        # One structured line per poll (instead of one per city) keeps INFO logs easy to parse.
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "iter=%d ok=%d/%d elapsed=%.2fs files=%s",
+                i,
+                ok,
+                len(requests_by_city),
+                time.monotonic() - poll_started,
+                ",".join(written),
+            )
+
+        # A stop requested during the poll takes effect once its Bronze files are written.
+        if stop.is_set():
+            break
+
+        # If all cities failed, sleep using exponential backoff to reduce pressure and avoid tight loops.
+        if ok == 0:
+            # Full jitter: a random fraction of the current backoff, so collectors that failed
+            # together (e.g. a TDX outage) retry spread out instead of in lockstep on recovery.
+            sleep_for = random.uniform(0, current_backoff_s)
+            if metrics is not None:
+                metrics.set_backoff(current_backoff_s)
+            logger.warning(
+                "No snapshots collected; backing off %.1fs (cap %ss).", sleep_for, current_backoff_s
+            )
+            if await _sleep_unless_stopped(stop, sleep_for):
+                break
+            current_backoff_s = min(current_backoff_s * 2, int(args.max_backoff_seconds))
+            continue
+
+        # Reset backoff after a successful loop so the next failure starts from the base backoff.
+        current_backoff_s = backoff_s
+        if metrics is not None:
+            metrics.set_backoff(0)
+        # The next poll fires at the next grid slot.
+        slot += 1
+        next_fire = anchor + slot * interval_s
+        now = time.monotonic()
+        # If this poll (or a backoff) ran past one or more slots, skip them rather than bursting
+        # to catch up; a warning on every poll means collection is saturated.
+        if next_fire < now:
+            missed = 0
+            while next_fire < now:
+                slot += 1
+                missed += 1
+                next_fire += interval_s
+            logger.warning("Poll overran the %ss interval; skipped %d slot(s).", interval_s, missed)
+        # Add optional jitter to spread requests across machines and reduce synchronized bursts;
+        # it is centred on zero and never accumulates, since the grid itself is not moved.
+        if jitter_s:
+            next_fire += random.uniform(-jitter_s / 2, jitter_s / 2)
+        # Never sleep a negative duration.
+        sleep_s = max(next_fire - now, 0.0)
+        # Sleep only if there is a positive duration; otherwise immediately start the next iteration.
+        if sleep_s > 0:
+            logger.info("Sleeping %.1fs", sleep_s)
+            if await _sleep_unless_stopped(stop, sleep_s):
+                break
+
+
 # Keep all side effects (config IO, network calls, filesystem writes) inside `main()` so the module is import-safe.
 def main() -> None:
     # Build a CLI parser for a long-running polling loop (useful for on-demand collection and cron jobs).
@@ -76,11 +390,26 @@ def main() -> None:
     # Max iterations provides a deterministic loop bound (useful for tests and quick experiments).
     parser.add_argument("--max-iterations", type=int, default=None, help="Stop after N loops.")
     # Jitter spreads requests over time to reduce bursty traffic (and avoid rate limiting).
-    parser.add_argument("--jitter-seconds", type=float, default=0.0, help="Add random jitter to sleep.")
+    parser.add_argument(
+        "--jitter-seconds", type=float, default=0.0, help="Spread each sleep by +/- N/2 seconds."
+    )
     # Backoff controls how long we sleep when all city requests fail in a loop iteration.
-    parser.add_argument("--backoff-seconds", type=int, default=10, help="Sleep on failure (exponential).")
+    parser.add_argument(
+        "--backoff-seconds", type=int, default=10, help="Failure backoff (exponential, jittered)."
+    )
     # Max backoff caps exponential growth so the job eventually retries again.
     parser.add_argument("--max-backoff-seconds", type=int, default=300, help="Max backoff on failure.")
+    # Cities fetched in parallel (the shared client still enforces the request interval).
+    parser.add_argument(
+        "--concurrency", type=int, default=int(os.getenv("TDX_CITY_CONCURRENCY", "4"))
+    )
+    # Prometheus endpoint port (0 disables it); needs the optional `prometheus_client` package.
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=int(os.getenv("PROM_PORT", "0")),
+        help="Serve Prometheus metrics on this port (default: $PROM_PORT, 0 = off).",
+    )
     # Parse CLI arguments once at startup to keep control flow deterministic.
     args = parser.parse_args()
 
@@ -100,21 +429,25 @@ def main() -> None:
     # Fail fast if no cities are configured, because an empty loop would hide misconfiguration.
     if not cities:
         raise ValueError("No bike cities configured or provided via --cities")
+    # Endpoint path and request metadata per city, built once: template and cities are fixed for
+    # the run. The same mapping is passed to the client and recorded in each Bronze file.
+    template = config.tdx.bike.availability_path_template
+    requests_by_city = {
+        city: {"path": template.format(city=city), "params": _JSON_PARAMS} for city in cities
+    }
 
     # Enforce sane minimums so we never sleep a negative interval or spin in a tight loop.
     interval_s = max(int(args.interval_seconds), 1)
     # Jitter is optional and must be non-negative.
     jitter_s = max(float(args.jitter_seconds), 0.0)
 
-    # `stop_at` provides an optional wall-clock stop time (UTC) for time-bounded runs.
-    stop_at = None
+    # `stop_at` is an optional `time.monotonic()` deadline for time-bounded runs.
+    stop_at: float | None = None
     if args.duration_seconds is not None:
-        stop_at = datetime.now(timezone.utc) + timedelta(seconds=int(args.duration_seconds))
+        stop_at = time.monotonic() + int(args.duration_seconds)
 
     # Backoff settings handle repeated failures (e.g., network outage, TDX downtime).
     backoff_s = max(int(args.backoff_seconds), 1)
-    # Current backoff grows exponentially when failures persist.
-    current_backoff_s = backoff_s
 
     # Use a context manager so HTTP connections are closed cleanly even if the loop is interrupted.
     with TDXClient(
@@ -125,80 +458,22 @@ def main() -> None:
         min_request_interval_s=_env_float("TDX_MIN_REQUEST_INTERVAL_S", 0.2),
         request_jitter_s=_env_float("TDX_REQUEST_JITTER_S", 0.05),
     ) as tdx:
-        # Loop counter is useful for deterministic stopping and for log context.
-        i = 0
-        while True:
-            # Stop when duration is reached (if configured).
-            if stop_at is not None and datetime.now(timezone.utc) >= stop_at:
-                logger.info("Stopping: duration reached.")
-                break
-            # Stop when max iterations is reached (if configured).
-            if args.max_iterations is not None and i >= int(args.max_iterations):
-                logger.info("Stopping: max iterations reached.")
-                break
-            # Increment loop counter at the start of each iteration.
-            i += 1
-
-            # Track start time so we can compute how long the work took and adjust sleep accordingly.
-            loop_started = datetime.now(timezone.utc)
-            # `ok` counts successful city snapshots so we can decide whether to back off.
-            ok = 0
-            # Collect one snapshot per city per loop iteration.
-            for city in cities:
-                try:
-                    # Build the realtime availability endpoint path for this city.
-                    path = config.tdx.bike.availability_path_template.format(city=city)
-                    # Force JSON output for consistent downstream parsing.
-                    params = {"$format": "JSON"}
-                    # Capture retrieval time in UTC so we can align snapshots across cities.
-                    retrieved_at = datetime.now(timezone.utc)
-                    # Fetch JSON payload (handles OData paging when needed, but usually returns a single list).
-                    payload = tdx.get_json_all(path, params=params, max_pages=int(os.getenv("TDX_MAX_PAGES", "100")))
-                    # Persist the raw payload plus request metadata to Bronze for traceability.
-                    out = write_bronze_json(
-                        bronze_dir,
-                        source="tdx",
-                        domain="bike",
-                        dataset="availability",
-                        city=city,
-                        retrieved_at=retrieved_at,
-                        request={"path": path, "params": params},
-                        payload=payload,
-                    )
-                    # Mark this city as successful so the loop does not enter global backoff mode.
-                    ok += 1
-                    # Log output path for debugging and for observing ingestion progress.
-                    logger.info("Wrote %s", out)
-                except Exception:
-                    # Log full stack trace so operators can debug transient network/API failures.
-                    logger.exception("Failed to fetch availability snapshot (city=%s)", city)
-
-            # If all cities failed, sleep using exponential backoff to reduce pressure and avoid tight loops.
-            if ok == 0:
-                logger.warning("No snapshots collected; backing off %ss.", current_backoff_s)
-                time.sleep(current_backoff_s)
-                current_backoff_s = min(current_backoff_s * 2, int(args.max_backoff_seconds))
-                continue
-
-            # Reset backoff after a successful loop so the next failure starts from the base backoff.
-            current_backoff_s = backoff_s
-            # Compute how long this iteration took so we can schedule the next poll close to `interval_s`.
-            elapsed_s = (datetime.now(timezone.utc) - loop_started).total_seconds()
-            # Sleep only the remaining time (never negative) so polling stays roughly periodic.
-            sleep_s = max(interval_s - elapsed_s, 0.0)
-            # Add optional jitter to spread requests across machines and reduce synchronized bursts.
-            if jitter_s:
-                sleep_s += random.random() * jitter_s
-            # Sleep only if there is a positive duration; otherwise immediately start the next iteration.
-            if sleep_s > 0:
-                logger.info("Sleeping %.1fs", sleep_s)
-                time.sleep(sleep_s)
+        # One event loop for the whole run: per-city fetches and sleeps between polls are awaited.
+        asyncio.run(
+            _poll(
+                tdx,
+                bronze_dir,
+                requests_by_city,
+                args,
+                stop_at=stop_at,
+                interval_s=interval_s,
+                jitter_s=jitter_s,
+                backoff_s=backoff_s,
+                metrics=_start_metrics(int(args.metrics_port)),
+            )
+        )
 
 
 if __name__ == "__main__":
-    # Wrap `main()` so Ctrl+C produces a clean log line rather than a noisy stack trace.
-    try:
-        main()
-    except KeyboardInterrupt:
-        # KeyboardInterrupt is expected during local runs; we log it as a normal stop event.
-        logger.info("Stopped by user (KeyboardInterrupt).")
+    # Ctrl+C / SIGTERM are handled inside the loop (`_stop_on_signals`), so they stop it cleanly.
+    main()
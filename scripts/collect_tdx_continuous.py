@@ -9,18 +9,28 @@ SRC_PATH = PROJECT_ROOT / "src"
 sys.path.insert(0, str(SRC_PATH))
 
 import argparse
+from bisect import insort
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 import logging
 import os
 import random
 import subprocess
 import time
+import hashlib
 import json
 import signal
 import shutil
+from fnmatch import fnmatch
+from typing import Iterator
 
 from metrobikeatlas.config.loader import load_config
-from metrobikeatlas.ingestion.bronze import write_bronze_json
+from metrobikeatlas.ingestion.bronze import (
+    is_bronze_file_name,
+    write_bronze_json,
+    write_bronze_json_pages,
+)
 from metrobikeatlas.ingestion.tdx_base import TDXClient, TDXCredentials, TDXRateLimitError
 from metrobikeatlas.utils.cache import JsonFileCache
 from metrobikeatlas.utils.logging import configure_logging
@@ -29,11 +39,45 @@ from metrobikeatlas.utils.logging import configure_logging
 logger = logging.getLogger(__name__)
 
 
-def _write_heartbeat(path: Path, payload: dict[str, object]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_suffix(".json.tmp")
-    tmp.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
-    tmp.replace(path)
+def _dump_json(payload: dict[str, object]) -> bytes:
+    # Compact UTF-8 JSON; `orjson` (optional) encodes these small dicts several times faster.
+    try:
+        import orjson  # type: ignore
+    except ModuleNotFoundError:
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    try:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _write_heartbeat_batch(
+    *items: tuple[Path, dict[str, object]], last_digests: dict[Path, bytes] | None = None
+) -> None:
+    """
+    Atomically replace each `(path, payload)` JSON file (heartbeat + metrics of one iteration).
+
+    All payloads are serialized (compact, machine-read) before any file is touched, then written
+    and renamed back-to-back, so the two files are swapped in as close together as possible.
+    With `last_digests`, a file whose payload is unchanged apart from `ts_utc` since its last write
+    is left as is. (The heartbeat's `loop_started_utc` changes every iteration, so it is always
+    rewritten and stays a liveness signal; a quiet backoff loop skips the metrics file.)
+    """
+
+    encoded = []
+    for path, payload in items:
+        if last_digests is not None:
+            stable = _dump_json({k: v for k, v in payload.items() if k != "ts_utc"})
+            digest = hashlib.blake2b(stable, digest_size=8).digest()
+            if last_digests.get(path) == digest and path.exists():
+                continue
+            last_digests[path] = digest
+        encoded.append((path, _dump_json(payload)))
+    for path, data in encoded:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
 
 
 def _parse_bool(value: str | None, *, default: bool) -> bool:
@@ -55,14 +99,24 @@ def _parse_cities(value: str | None) -> list[str] | None:
     return cities or None
 
 
-def _is_pid_running(pid: int) -> bool:
+def _is_pid_running(pid: int, start_time_ticks: object = None) -> bool:
+    # With `start_time_ticks` (from the lock), a PID recycled by another process is not running.
     try:
         os.kill(pid, 0)
     except ProcessLookupError:
         return False
     except PermissionError:
+        pass
+    if start_time_ticks is None:
+        return True
+    live_start = _pid_start_time_ticks(pid)
+    if live_start is None:
+        # No /proc (non-Linux): existence is all we can check.
+        return True
+    try:
+        return int(str(start_time_ticks)) == live_start
+    except (TypeError, ValueError):
         return True
-    return True
 
 
 def _pid_cmdline(pid: int) -> str | None:
@@ -82,12 +136,11 @@ def _pid_start_time_ticks(pid: int) -> int | None:
         stat = Path(f"/proc/{pid}/stat").read_text(encoding="utf-8", errors="replace")
     except Exception:
         return None
+    # Field 2 is `(comm)`, which may itself contain spaces or ")": count fields after its last ")".
     try:
-        parts = stat.split()
-        if len(parts) < 22:
-            return None
-        return int(parts[21])
-    except Exception:
+        parts = stat[stat.rindex(")") + 1 :].split()
+        return int(parts[19])
+    except (ValueError, IndexError):
         return None
 
 
@@ -145,20 +198,11 @@ def _acquire_lock(lock_path: Path) -> None:
             _write_lock(lock_path, os.getpid())
             return
 
-        if existing_pid and _is_pid_running(existing_pid):
+        if existing_pid and _is_pid_running(existing_pid, lock.get("start_time_ticks")):
             # In Docker, PID reuse across container restarts can cause false positives if a lock file is persisted.
             # Only treat it as "already running" if the PID is actually this collector script.
             if _pid_looks_like_this_collector(existing_pid):
-                stored_start = lock.get("start_time_ticks")
-                live_start = _pid_start_time_ticks(existing_pid)
-                if stored_start is not None and live_start is not None:
-                    try:
-                        if int(stored_start) == int(live_start):
-                            raise RuntimeError(f"Collector already running (lock pid={existing_pid})")
-                    except Exception:
-                        pass
-                else:
-                    raise RuntimeError(f"Collector already running (lock pid={existing_pid})")
+                raise RuntimeError(f"Collector already running (lock pid={existing_pid})")
     _write_lock(lock_path, os.getpid())
 
 
@@ -170,15 +214,91 @@ def _release_lock(lock_path: Path) -> None:
         pass
 
 
+def _is_bronze_match(name: str, pattern: str) -> bool:
+    # `*.json*` alone would also match in-flight/crashed `<ts>.json.tmp` writes (ours or another
+    # collector's); those must never be counted, kept as "latest", or deleted.
+    return is_bronze_file_name(name) and fnmatch(name, pattern)
+
+
+@dataclass
+class CityFileDeque:
+    """
+    Per-directory listing of Bronze files as `(mtime, path, size)`, oldest first, kept in memory.
+
+    Retention pops expired files off the front instead of re-listing the directory. A listing is
+    trusted only while the directory's mtime is the one recorded after our own writes/deletes;
+    if another process changed the directory, it is re-scanned.
+    """
+
+    entries: dict[tuple[Path, str], deque[tuple[float, Path, int]]] = field(default_factory=dict)
+    dir_mtime_ns: dict[Path, int] = field(default_factory=dict)
+
+    def files(self, root: Path, pattern: str) -> deque[tuple[float, Path, int]]:
+        key = (root, pattern)
+        files = self.entries.get(key)
+        try:
+            mtime_ns = root.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if files is None or mtime_ns is None or mtime_ns != self.dir_mtime_ns.get(root):
+            files = self.entries[key] = self._scan(root, pattern)
+            if mtime_ns is not None:
+                self.dir_mtime_ns[root] = mtime_ns
+        return files
+
+    def record(self, path: Path) -> None:
+        # After this collector writes `path`; directories not listed yet are scanned on first use.
+        root = path.parent
+        if root not in self.dir_mtime_ns:
+            return
+        try:
+            st = path.stat()
+        except OSError:
+            return
+        for (r, pattern), files in self.entries.items():
+            if r == root and _is_bronze_match(path.name, pattern):
+                insort(files, (st.st_mtime, path, int(st.st_size)))
+        self.touched(root)
+
+    def touched(self, root: Path) -> None:
+        try:
+            self.dir_mtime_ns[root] = root.stat().st_mtime_ns
+        except OSError:
+            self.dir_mtime_ns.pop(root, None)
+
+    @staticmethod
+    def _scan(root: Path, pattern: str) -> deque[tuple[float, Path, int]]:
+        files = []
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    if not _is_bronze_match(entry.name, pattern):
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    files.append((st.st_mtime, Path(entry.path), int(st.st_size)))
+        except OSError:
+            pass
+        files.sort()  # oldest -> newest
+        return deque(files)
+
+
 def _cleanup_old_files(
     *,
     root: Path,
     pattern: str,
     keep_last: int | None,
     keep_days: float | None,
+    tracker: BronzeSizeTracker | None = None,
+    city_files: CityFileDeque | None = None,
 ) -> int:
     """
-    Delete old Bronze files under `root` matching `pattern`.
+    Delete old Bronze files under `root` matching `pattern` (and take their bytes off `tracker`).
+
+    Files are listed from `city_files` when given (see `CityFileDeque`), else from the directory.
+    Only Bronze file names count (`is_bronze_file_name`): `.tmp` files are never kept or deleted.
     """
 
     if not root.exists():
@@ -187,52 +307,114 @@ def _cleanup_old_files(
     keep_td = None if keep_days is None else timedelta(days=max(float(keep_days), 0.0))
     now = datetime.now(timezone.utc)
 
-    files = []
-    for p in root.glob(pattern):
-        try:
-            st = p.stat()
-        except Exception:
-            continue
-        files.append((p, st.st_mtime))
-    files.sort(key=lambda x: x[1])  # oldest -> newest
+    if city_files is not None:
+        files = city_files.files(root, pattern)
+    else:
+        files = CityFileDeque._scan(root, pattern)
+    # Deletable files are a prefix of the oldest-first listing: beyond the newest N and older than
+    # the days window.
+    n_old = len(files) if keep_n is None else max(len(files) - keep_n, 0)
+    cutoff = None if keep_td is None else (now - keep_td).timestamp()
 
     deleted = 0
-    for idx, (p, mtime) in enumerate(files):
-        # Keep newest N
-        if keep_n is not None:
-            # newest N are the last keep_n entries
-            if idx >= max(len(files) - keep_n, 0):
-                continue
-        # Keep within days window
-        if keep_td is not None:
-            age = now - datetime.fromtimestamp(mtime, tz=timezone.utc)
-            if age <= keep_td:
-                continue
+    vanished = False
+    kept: list[tuple[float, Path, int]] = []
+    for _ in range(n_old):
+        mtime, p, size = files[0]
+        if cutoff is not None and mtime >= cutoff:
+            break
+        files.popleft()
         try:
             p.unlink()
-            deleted += 1
+        except FileNotFoundError:
+            vanished = True
+            continue
         except Exception:
+            kept.append((mtime, p, size))
             continue
+        deleted += 1
+        if tracker is not None:
+            tracker.discard(int(size))
+    files.extendleft(reversed(kept))
+    if city_files is not None:
+        if vanished:
+            # Someone else is deleting here too: re-list on the next cleanup.
+            city_files.dir_mtime_ns.pop(root, None)
+        elif deleted:
+            city_files.touched(root)
     return deleted
 
 
+def _iter_bronze_entries(root: str) -> Iterator[os.DirEntry[str]]:
+    """
+    Yield a `DirEntry` for each Bronze file under `root` (`is_bronze_file_name`; no `.tmp` files).
+
+    Walks with `os.scandir`, so no `Path` objects are built and `entry.stat()` reuses the directory
+    read where the OS allows. Unreadable or vanished directories are skipped.
+    """
+
+    try:
+        it = os.scandir(root)
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return
+    with it:
+        for entry in it:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_bronze_entries(entry.path)
+                elif is_bronze_file_name(entry.name):
+                    yield entry
+            except OSError:
+                continue
+
+
+@dataclass
+class BronzeSizeTracker:
+    """
+    Running total of Bronze file bytes, so the disk guard does not re-walk the tree every loop.
+
+    `rebuild()` does the full walk; this collector's writes and retention deletes adjust the total
+    in between. Files written or removed by other processes are picked up at the next rebuild.
+    """
+
+    bronze_dir: Path
+    total_bytes: int = 0
+    initialized: bool = False
+
+    def rebuild(self) -> int:
+        total = 0
+        for entry in _iter_bronze_entries(str(self.bronze_dir)):
+            try:
+                total += int(entry.stat().st_size)
+            except OSError:
+                continue
+        self.total_bytes = total
+        self.initialized = True
+        return total
+
+    def add(self, path: Path) -> None:
+        try:
+            self.total_bytes += int(path.stat().st_size)
+        except OSError:
+            pass
+
+    def discard(self, nbytes: int) -> None:
+        self.total_bytes = max(self.total_bytes - int(nbytes), 0)
+
+
 def _ensure_disk_space(
     *,
     repo_root: Path,
-    bronze_dir: Path,
+    tracker: BronzeSizeTracker,
     min_free_bytes: int | None,
     max_bronze_bytes: int | None,
 ) -> dict[str, object]:
     usage = shutil.disk_usage(str(repo_root))
-    bronze_size = 0
-    try:
-        for p in bronze_dir.rglob("*.json"):
-            try:
-                bronze_size += int(p.stat().st_size)
-            except Exception:
-                continue
-    except Exception:
-        bronze_size = bronze_size
+    rebuilt = not tracker.initialized
+    bronze_size = tracker.rebuild() if rebuilt else tracker.total_bytes
+    # Confirm an over-cap running total with a full walk before acting on it.
+    if max_bronze_bytes is not None and bronze_size > int(max_bronze_bytes) and not rebuilt:
+        bronze_size = tracker.rebuild()
 
     action = "none"
     if min_free_bytes is not None and usage.free < int(min_free_bytes):
@@ -262,6 +444,8 @@ def _collect_station_dataset(
     path_template: str,
     cache_namespace: str,
     max_pages: int,
+    tracker: BronzeSizeTracker | None = None,
+    city_files: CityFileDeque | None = None,
 ) -> int:
     wrote = 0
     for city in cities:
@@ -291,6 +475,10 @@ def _collect_station_dataset(
             request=request_meta,
             payload=payload,
         )
+        if tracker is not None:
+            tracker.add(out)
+        if city_files is not None:
+            city_files.record(out)
         wrote += 1
         logger.info("Wrote %s", out)
     return wrote
@@ -303,14 +491,16 @@ def _collect_bike_availability(
     cities: list[str],
     path_template: str,
     max_pages: int,
+    tracker: BronzeSizeTracker | None = None,
+    city_files: CityFileDeque | None = None,
 ) -> int:
     ok = 0
     for city in cities:
         path = path_template.format(city=city)
         params = {"$format": "JSON"}
         retrieved_at = datetime.now(timezone.utc)
-        payload = tdx.get_json_all(path, params=params, max_pages=max_pages)
-        out = write_bronze_json(
+        # Availability is the large, frequent payload: write each page as it arrives.
+        out = write_bronze_json_pages(
             bronze_dir,
             source="tdx",
             domain="bike",
@@ -318,8 +508,12 @@ def _collect_bike_availability(
             city=city,
             retrieved_at=retrieved_at,
             request={"path": path, "params": params},
-            payload=payload,
+            pages=tdx.iter_json_pages(path, params=params, max_pages=max_pages),
         )
+        if tracker is not None:
+            tracker.add(out)
+        if city_files is not None:
+            city_files.record(out)
         ok += 1
         logger.info("Wrote %s", out)
     return ok
@@ -355,7 +549,7 @@ def _latest_bike_availability_by_city(*, bronze_dir: Path, cities: list[str]) ->
     out: dict[str, str | None] = {}
     for city in cities:
         city_dir = bronze_dir / "tdx" / "bike" / "availability" / f"city={city}"
-        files = sorted(city_dir.glob("*.json"))
+        files = sorted(p for p in city_dir.glob("*.json*") if is_bronze_file_name(p.name))
         out[city] = str(files[-1]) if files else None
     return out
 
@@ -517,6 +711,8 @@ def main() -> None:
         ) from exc
     bronze_dir = Path(args.bronze_dir)
     bronze_dir.mkdir(parents=True, exist_ok=True)
+    bronze_tracker = BronzeSizeTracker(bronze_dir)
+    city_files = CityFileDeque()
     silver_dir = Path(args.silver_dir)
     silver_dir.mkdir(parents=True, exist_ok=True)
 
@@ -550,6 +746,7 @@ def main() -> None:
     logs_dir = repo_root / "logs"
     heartbeat_path = logs_dir / "collector_heartbeat.json"
     metrics_path = logs_dir / "collector_metrics.json"
+    status_digests: dict[Path, bytes] = {}
     lock_path = logs_dir / "collector.lock"
     external_metro_path = repo_root / "data" / "external" / "metro_stations.csv"
     skip_metro_stations = _parse_bool(
@@ -638,7 +835,7 @@ def main() -> None:
             # Disk safety snapshot (and opportunistic cleanup if needed).
             disk = _ensure_disk_space(
                 repo_root=repo_root,
-                bronze_dir=bronze_dir,
+                tracker=bronze_tracker,
                 min_free_bytes=args.min_free_disk_bytes,
                 max_bronze_bytes=args.max_bronze_bytes,
             )
@@ -652,45 +849,51 @@ def main() -> None:
                     avail_dir = bronze_dir / "tdx" / "bike" / "availability" / f"city={city}"
                     deleted += _cleanup_old_files(
                         root=avail_dir,
-                        pattern="*.json",
+                        pattern="*.json*",
                         keep_last=args.retain_availability_files_per_city,
                         keep_days=args.retain_availability_days,
+                        tracker=bronze_tracker,
+                        city_files=city_files,
                     )
                 last_cleanup_utc = now.isoformat()
                 # Re-check disk after cleanup.
                 disk2 = _ensure_disk_space(
                     repo_root=repo_root,
-                    bronze_dir=bronze_dir,
+                    tracker=bronze_tracker,
                     min_free_bytes=args.min_free_disk_bytes,
                     max_bronze_bytes=args.max_bronze_bytes,
                 )
-                _write_heartbeat(
-                    heartbeat_path,
-                    {
-                        "ts_utc": datetime.now(timezone.utc).isoformat(),
-                        "loop_started_utc": loop_started.isoformat(),
-                        "last_success_utc": last_success_utc,
-                        "last_error_utc": datetime.now(timezone.utc).isoformat(),
-                        "last_error": "disk emergency mode",
-                        "tdx_rate_limit_count": int(tdx_rate_limit_count),
-                        "ok_snapshots": 0,
-                        "backoff_s": float(max_backoff),
-                        "disk": disk2,
-                        "deleted_files": int(deleted),
-                        "datasets": dataset_metrics,
-                        "emergency_mode": True,
-                    },
-                )
-                _write_heartbeat(
-                    metrics_path,
-                    {
-                        "ts_utc": datetime.now(timezone.utc).isoformat(),
-                        "datasets": dataset_metrics,
-                        "disk": disk2,
-                        "backoff_s": float(max_backoff),
-                        "deleted_files": int(deleted),
-                        "emergency_mode": True,
-                    },
+                ts_iso = datetime.now(timezone.utc).isoformat()
+                _write_heartbeat_batch(
+                    (
+                        heartbeat_path,
+                        {
+                            "ts_utc": ts_iso,
+                            "loop_started_utc": loop_started.isoformat(),
+                            "last_success_utc": last_success_utc,
+                            "last_error_utc": ts_iso,
+                            "last_error": "disk emergency mode",
+                            "tdx_rate_limit_count": int(tdx_rate_limit_count),
+                            "ok_snapshots": 0,
+                            "backoff_s": float(max_backoff),
+                            "disk": disk2,
+                            "deleted_files": int(deleted),
+                            "datasets": dataset_metrics,
+                            "emergency_mode": True,
+                        },
+                    ),
+                    (
+                        metrics_path,
+                        {
+                            "ts_utc": ts_iso,
+                            "datasets": dataset_metrics,
+                            "disk": disk2,
+                            "backoff_s": float(max_backoff),
+                            "deleted_files": int(deleted),
+                            "emergency_mode": True,
+                        },
+                    ),
+                    last_digests=status_digests,
                 )
                 time.sleep(float(max_backoff))
                 continue
@@ -719,6 +922,8 @@ def main() -> None:
                                     path_template=config.tdx.metro.stations_path_template,
                                     cache_namespace="tdx:metro:stations",
                                     max_pages=int(args.max_pages),
+                                    tracker=bronze_tracker,
+                                    city_files=city_files,
                                 )
                                 _backoff_ok(st)
                                 dm = dataset_metrics["tdx:metro:stations"]
@@ -755,6 +960,8 @@ def main() -> None:
                                 path_template=config.tdx.bike.stations_path_template,
                                 cache_namespace="tdx:bike:stations",
                                 max_pages=int(args.max_pages),
+                                tracker=bronze_tracker,
+                                city_files=city_files,
                             )
                             _backoff_ok(st)
                             dm = dataset_metrics["tdx:bike:stations"]
@@ -784,6 +991,8 @@ def main() -> None:
                         cities=bike_cities,
                         path_template=config.tdx.bike.availability_path_template,
                         max_pages=int(args.max_pages),
+                        tracker=bronze_tracker,
+                        city_files=city_files,
                     )
                     _backoff_ok(st)
                     dm = dataset_metrics["tdx:bike:availability"]
@@ -795,11 +1004,11 @@ def main() -> None:
                 logger.exception("Availability collection failed.")
                 msg = str(exc)
                 last_error = msg[:500]
-                last_error_utc = datetime.now(timezone.utc).isoformat()
+                last_error_utc = post_io_iso = datetime.now(timezone.utc).isoformat()
                 tdx_rate_limit_count += 1
                 dm = dataset_metrics["tdx:bike:availability"]
                 dm["error"] = int(dm.get("error") or 0) + 1
-                dm["last_error_utc"] = datetime.now(timezone.utc).isoformat()
+                dm["last_error_utc"] = post_io_iso
                 _backoff_fail(backoff_states["tdx:bike:availability"], now, "rate_limited")
                 # Respect Retry-After when present (more conservative than exponential backoff).
                 if exc.retry_after_s is not None and exc.retry_after_s > 0:
@@ -811,12 +1020,12 @@ def main() -> None:
                 logger.exception("Availability collection failed.")
                 msg = str(exc)
                 last_error = msg[:500]
-                last_error_utc = datetime.now(timezone.utc).isoformat()
+                last_error_utc = post_io_iso = datetime.now(timezone.utc).isoformat()
                 if "429" in msg or "rate limit" in msg.lower() or "retry-after" in msg.lower():
                     tdx_rate_limit_count += 1
                 dm = dataset_metrics["tdx:bike:availability"]
                 dm["error"] = int(dm.get("error") or 0) + 1
-                dm["last_error_utc"] = datetime.now(timezone.utc).isoformat()
+                dm["last_error_utc"] = post_io_iso
                 _backoff_fail(backoff_states["tdx:bike:availability"], now, "error")
 
             # Retention cleanup (time-based and count-based), plus emergency cleanup when disk is low.
@@ -840,28 +1049,36 @@ def main() -> None:
                     avail_dir = bronze_dir / "tdx" / "bike" / "availability" / f"city={city}"
                     deleted += _cleanup_old_files(
                         root=avail_dir,
-                        pattern="*.json",
+                        pattern="*.json*",
                         keep_last=args.retain_availability_files_per_city,
                         keep_days=args.retain_availability_days,
+                        tracker=bronze_tracker,
+                        city_files=city_files,
                     )
                 # Stations are low-frequency; keep only a few recent snapshots.
                 for city in bike_cities:
                     st_dir = bronze_dir / "tdx" / "bike" / "stations" / f"city={city}"
                     deleted += _cleanup_old_files(
                         root=st_dir,
-                        pattern="*.json",
+                        pattern="*.json*",
                         keep_last=args.retain_stations_files_per_city,
                         keep_days=None,
+                        tracker=bronze_tracker,
+                        city_files=city_files,
                     )
                 for city in metro_cities:
                     st_dir = bronze_dir / "tdx" / "metro" / "stations" / f"city={city}"
                     deleted += _cleanup_old_files(
                         root=st_dir,
-                        pattern="*.json",
+                        pattern="*.json*",
                         keep_last=args.retain_stations_files_per_city,
                         keep_days=None,
+                        tracker=bronze_tracker,
+                        city_files=city_files,
                     )
                 last_cleanup_utc = now.isoformat()
+                # Re-walk on the next disk check to pick up files other writers added or removed.
+                bronze_tracker.initialized = False
                 if deleted:
                     logger.info("Retention cleanup deleted %s files", deleted)
 
@@ -869,33 +1086,37 @@ def main() -> None:
                 # Choose a conservative backoff: max of dataset backoffs.
                 current_backoff = max(float(backoff_base), float(backoff_states["tdx:bike:availability"].get("current_s") or backoff_base))
                 logger.warning("No snapshots collected; backing off %ss.", current_backoff)
-                _write_heartbeat(
-                    heartbeat_path,
-                    {
-                        "ts_utc": datetime.now(timezone.utc).isoformat(),
-                        "loop_started_utc": loop_started.isoformat(),
-                        "last_success_utc": last_success_utc,
-                        "last_error_utc": last_error_utc,
-                        "last_error": last_error,
-                        "tdx_rate_limit_count": int(tdx_rate_limit_count),
-                        "ok_snapshots": int(ok),
-                        "backoff_s": float(current_backoff),
-                        "disk": disk,
-                        "deleted_files": int(deleted),
-                        "datasets": dataset_metrics,
-                        "backoffs": backoff_states,
-                    },
-                )
-                _write_heartbeat(
-                    metrics_path,
-                    {
-                        "ts_utc": datetime.now(timezone.utc).isoformat(),
-                        "datasets": dataset_metrics,
-                        "disk": disk,
-                        "backoff_s": float(current_backoff),
-                        "deleted_files": int(deleted),
-                        "backoffs": backoff_states,
-                    },
+                ts_iso = datetime.now(timezone.utc).isoformat()
+                _write_heartbeat_batch(
+                    (
+                        heartbeat_path,
+                        {
+                            "ts_utc": ts_iso,
+                            "loop_started_utc": loop_started.isoformat(),
+                            "last_success_utc": last_success_utc,
+                            "last_error_utc": last_error_utc,
+                            "last_error": last_error,
+                            "tdx_rate_limit_count": int(tdx_rate_limit_count),
+                            "ok_snapshots": int(ok),
+                            "backoff_s": float(current_backoff),
+                            "disk": disk,
+                            "deleted_files": int(deleted),
+                            "datasets": dataset_metrics,
+                            "backoffs": backoff_states,
+                        },
+                    ),
+                    (
+                        metrics_path,
+                        {
+                            "ts_utc": ts_iso,
+                            "datasets": dataset_metrics,
+                            "disk": disk,
+                            "backoff_s": float(current_backoff),
+                            "deleted_files": int(deleted),
+                            "backoffs": backoff_states,
+                        },
+                    ),
+                    last_digests=status_digests,
                 )
                 time.sleep(current_backoff)
                 continue
@@ -903,10 +1124,11 @@ def main() -> None:
             last_error = None
             last_error_utc = None
 
-            if next_build_silver is not None and datetime.now(timezone.utc) >= next_build_silver:
+            silver_now = datetime.now(timezone.utc)
+            if next_build_silver is not None and silver_now >= next_build_silver:
                 try:
                     st = backoff_states["build_silver"]
-                    if _backoff_ready(st, datetime.now(timezone.utc)):
+                    if _backoff_ready(st, silver_now):
                         should, reason = _should_build_silver(
                             repo_root=repo_root,
                             bronze_dir=bronze_dir,
@@ -915,7 +1137,7 @@ def main() -> None:
                         )
                         if not should:
                             logger.info("Skipping build_silver: %s", reason)
-                            next_build_silver = datetime.now(timezone.utc) + timedelta(
+                            next_build_silver = silver_now + timedelta(
                                 seconds=int(args.build_silver_interval_seconds)
                             )
                             continue
@@ -933,52 +1155,61 @@ def main() -> None:
                         logger.warning("Skipping build_silver due to backoff until %s", st.get("next_allowed_utc"))
                 except Exception:
                     logger.exception("build_silver failed (will retry later).")
+                    failed_at = datetime.now(timezone.utc)
                     last_error = "build_silver failed"
-                    last_error_utc = datetime.now(timezone.utc).isoformat()
+                    last_error_utc = failed_at.isoformat()
                     dm = dataset_metrics["build_silver"]
                     dm["error"] = int(dm.get("error") or 0) + 1
-                    dm["last_error_utc"] = datetime.now(timezone.utc).isoformat()
-                    _backoff_fail(backoff_states["build_silver"], datetime.now(timezone.utc), "error")
+                    dm["last_error_utc"] = last_error_utc
+                    _backoff_fail(backoff_states["build_silver"], failed_at, "error")
                 next_build_silver = datetime.now(timezone.utc) + timedelta(
                     seconds=int(args.build_silver_interval_seconds)
                 )
 
-            _write_heartbeat(
-                heartbeat_path,
-                {
-                    "ts_utc": datetime.now(timezone.utc).isoformat(),
-                    "loop_started_utc": loop_started.isoformat(),
-                    "availability_interval_s": int(interval_s),
-                    "jitter_s": float(jitter_s),
-                    "stations_refresh_interval_hours": float(args.stations_refresh_interval_hours),
-                    "build_silver_interval_s": None
-                    if args.build_silver_interval_seconds is None
-                    else int(args.build_silver_interval_seconds),
-                    "last_success_utc": last_success_utc,
-                    "last_error_utc": last_error_utc,
-                    "last_error": last_error,
-                    "tdx_rate_limit_count": int(tdx_rate_limit_count),
-                    "ok_snapshots": int(ok),
-                    "backoff_s": float(backoff_base),
-                    "disk": disk,
-                    "deleted_files": int(deleted),
-                    "datasets": dataset_metrics,
-                    "backoffs": backoff_states,
-                },
-            )
-            _write_heartbeat(
-                metrics_path,
-                {
-                    "ts_utc": datetime.now(timezone.utc).isoformat(),
-                    "datasets": dataset_metrics,
-                    "disk": disk,
-                    "deleted_files": int(deleted),
-                    "backoff_s": float(backoff_base),
-                    "backoffs": backoff_states,
-                },
+            # One timestamp for both files and the sleep computation.
+            ts = datetime.now(timezone.utc)
+            ts_iso = ts.isoformat()
+            _write_heartbeat_batch(
+                (
+                    heartbeat_path,
+                    {
+                        "ts_utc": ts_iso,
+                        "loop_started_utc": loop_started.isoformat(),
+                        "availability_interval_s": int(interval_s),
+                        "jitter_s": float(jitter_s),
+                        "stations_refresh_interval_hours": float(
+                            args.stations_refresh_interval_hours
+                        ),
+                        "build_silver_interval_s": None
+                        if args.build_silver_interval_seconds is None
+                        else int(args.build_silver_interval_seconds),
+                        "last_success_utc": last_success_utc,
+                        "last_error_utc": last_error_utc,
+                        "last_error": last_error,
+                        "tdx_rate_limit_count": int(tdx_rate_limit_count),
+                        "ok_snapshots": int(ok),
+                        "backoff_s": float(backoff_base),
+                        "disk": disk,
+                        "deleted_files": int(deleted),
+                        "datasets": dataset_metrics,
+                        "backoffs": backoff_states,
+                    },
+                ),
+                (
+                    metrics_path,
+                    {
+                        "ts_utc": ts_iso,
+                        "datasets": dataset_metrics,
+                        "disk": disk,
+                        "deleted_files": int(deleted),
+                        "backoff_s": float(backoff_base),
+                        "backoffs": backoff_states,
+                    },
+                ),
+                last_digests=status_digests,
             )
 
-            elapsed = (datetime.now(timezone.utc) - loop_started).total_seconds()
+            elapsed = (ts - loop_started).total_seconds()
             sleep_s = max(interval_s - elapsed, 0.0)
             if jitter_s:
                 sleep_s += random.random() * jitter_s
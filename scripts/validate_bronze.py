@@ -10,10 +10,10 @@ sys.path.insert(0, str(SRC_PATH))
 
 import argparse
 from datetime import datetime, timezone
-import json
 import os
 import urllib.request
 
+from metrobikeatlas.ingestion.bronze import is_bronze_file_name, read_bronze_json
 from metrobikeatlas.quality.contract import write_json
 
 
@@ -48,13 +48,13 @@ def main() -> None:
         if not root.exists():
             add("warning", label, f"Missing dataset dir: {root}")
             continue
-        files = sorted(root.rglob("*.json"))
+        files = sorted(f for f in root.rglob("*.json*") if is_bronze_file_name(f.name))
         if not files:
             add("warning", label, "No JSON files found")
             continue
         latest = files[-1]
         try:
-            obj = json.loads(latest.read_text(encoding="utf-8"))
+            obj = read_bronze_json(latest)
         except Exception as e:
             add("error", label, f"Failed to parse latest file {latest}: {e}")
             continue
@@ -66,6 +66,8 @@ def main() -> None:
             add("warning", label, f"Payload is not a list in {latest}")
         if isinstance(payload, list) and not payload:
             add("warning", label, f"Empty payload in {latest}")
+        if obj.get("suspect"):
+            add("warning", label, f"Collector flagged {latest} as suspect: {obj['suspect']}")
 
     report = {
         "type": "dq_report",
@@ -225,7 +225,12 @@ def _dataset_status(label: str, dataset_dir: Path) -> DatasetStatusOut:
     latest: Path | None = None
     count = 0
     if dataset_dir.exists():
-        for p in dataset_dir.rglob("*.json"):
+        from metrobikeatlas.ingestion.bronze import is_bronze_file_name
+
+        # Count zstd-compressed Bronze files (`.json.zst`) as well as plain JSON.
+        for p in dataset_dir.rglob("*.json*"):
+            if not is_bronze_file_name(p.name):
+                continue
             count += 1
             if latest is None or p.name > latest.name:
                 latest = p
@@ -743,7 +748,7 @@ def _build_silver_plan(repo_root: Path) -> dict[str, object]:
     metro_source = "unknown"
     reason = ""
     try:
-        has_bronze = bool(list(bronze_metro_root.rglob("*.json"))[:1])
+        has_bronze = bool(list(bronze_metro_root.rglob("*.json*"))[:1])
     except Exception:
         has_bronze = False
     if has_bronze:
@@ -5,6 +5,7 @@ import json
 from pathlib import Path
 from typing import Any, Iterable, Optional
 
+import numpy as np
 
 LonLat = tuple[float, float]
 
@@ -48,6 +49,46 @@ def _point_in_ring(lon: float, lat: float, ring: list[LonLat]) -> bool:
     return inside
 
 
+# Upper bound on the (points x edges) crossing matrix built per chunk by `_points_in_ring`.
+_MAX_CROSSING_CELLS = 1_000_000
+
+
+def _bbox_contains_batch(
+    bbox: tuple[float, float, float, float], lons: np.ndarray, lats: np.ndarray
+) -> np.ndarray:
+    min_lon, min_lat, max_lon, max_lat = bbox
+    return (min_lon <= lons) & (lons <= max_lon) & (min_lat <= lats) & (lats <= max_lat)
+
+
+def _points_in_ring(lons: np.ndarray, lats: np.ndarray, ring: list[LonLat]) -> np.ndarray:
+    """
+    Vectorized `_point_in_ring`: ray casting for many points against one ring.
+
+    Each point's crossings are counted over all edges at once; an odd count means inside.
+    """
+
+    if len(ring) < 3 or lons.size == 0:
+        return np.zeros(lons.shape, dtype=bool)
+
+    edges = np.asarray(ring, dtype=float)
+    lon1, lat1 = edges[:, 0], edges[:, 1]
+    lon2, lat2 = np.roll(lon1, -1), np.roll(lat1, -1)
+    denom = lat2 - lat1
+    # Horizontal edges never cross the ray (same as the scalar `denom == 0` skip).
+    safe_denom = np.where(denom == 0, 1.0, denom)
+
+    inside = np.empty(lons.shape, dtype=bool)
+    step = max(1, _MAX_CROSSING_CELLS // len(ring))
+    for start in range(0, lons.size, step):
+        lon = lons[start : start + step, None]
+        lat = lats[start : start + step, None]
+        intersects = ((lat1 > lat) != (lat2 > lat)) & (denom != 0)
+        lon_at_lat = (lon2 - lon1) * (lat - lat1) / safe_denom + lon1
+        crossings = np.count_nonzero(intersects & (lon < lon_at_lat), axis=1)
+        inside[start : start + step] = crossings % 2 == 1
+    return inside
+
+
 @dataclass(frozen=True)
 class Polygon:
     exterior: list[LonLat]
@@ -74,6 +115,15 @@ class Polygon:
                 return False
         return True
 
+    def contains_batch(self, lons: np.ndarray, lats: np.ndarray) -> np.ndarray:
+        hit = _bbox_contains_batch(self.bbox, lons, lats)
+        idx = np.flatnonzero(hit)
+        hit[idx] = _points_in_ring(lons[idx], lats[idx], self.exterior)
+        for hole in self.holes:
+            idx = np.flatnonzero(hit)
+            hit[idx] = ~_points_in_ring(lons[idx], lats[idx], hole)
+        return hit
+
 
 @dataclass(frozen=True)
 class BoundaryFeature:
@@ -86,6 +136,14 @@ class BoundaryFeature:
             return False
         return any(p.contains(lon, lat) for p in self.polygons)
 
+    def contains_batch(self, lons: np.ndarray, lats: np.ndarray) -> np.ndarray:
+        hit = np.zeros(lons.shape, dtype=bool)
+        idx = np.flatnonzero(_bbox_contains_batch(self.bbox, lons, lats))
+        for polygon in self.polygons:
+            idx = idx[~hit[idx]]
+            hit[idx] = polygon.contains_batch(lons[idx], lats[idx])
+        return hit
+
 
 class BoundaryIndex:
     """
@@ -156,3 +214,21 @@ class BoundaryIndex:
                 return boundary.name
         return None
 
+    def lookup_batch(self, *, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """
+        Vectorized `lookup` for many points: an object array of district names (None = no match).
+
+        Boundaries are tested in the same order as `lookup`, so the first match wins for each point.
+        """
+
+        lats = np.asarray(lats, dtype=float)
+        lons = np.asarray(lons, dtype=float)
+        out = np.full(lats.shape, None, dtype=object)
+        idx = np.arange(lats.size)
+        for boundary in self._boundaries:
+            if idx.size == 0:
+                break
+            hit = boundary.contains_batch(lons[idx], lats[idx])
+            out[idx[hit]] = boundary.name
+            idx = idx[~hit]
+        return out
@@ -4,10 +4,97 @@ from __future__ import annotations
 from datetime import datetime, timezone
 # `json` is used to serialize the Bronze wrapper payload to a human-readable on-disk format.
 import json
+# `mmap` lets the optional orjson path parse Bronze files without reading them into a `bytes` copy.
+import mmap
+# `MBA_BRONZE_COMPRESSION` opts Bronze writes into zstd compression.
+import os
+# Compressors are reused per thread (the availability loop writes cities from worker threads).
+import threading
 # `Path` provides safe, cross-platform filesystem path operations (no manual string joins).
 from pathlib import Path
 # Typing helpers make the Bronze wrapper schema explicit while still allowing arbitrary raw payloads.
-from typing import Any, Mapping, Optional
+from typing import Any, Iterable, Iterator, Mapping, Optional, Union
+
+
+# Bronze file suffixes: plain JSON, or zstd-compressed JSON (`MBA_BRONZE_COMPRESSION=zstd`).
+BRONZE_SUFFIXES = (".json", ".json.zst")
+
+
+def is_bronze_file_name(name: str) -> bool:
+    # True for names `write_bronze_json` produces (either suffix); used by Bronze dir listings.
+    return name.endswith(BRONZE_SUFFIXES)
+
+
+def bronze_compression() -> Optional[str]:
+    """
+    `"zstd"` when `MBA_BRONZE_COMPRESSION=zstd` is set and `zstandard` is installed, else None.
+    """
+
+    if str(os.getenv("MBA_BRONZE_COMPRESSION", "")).strip().lower() != "zstd":
+        return None
+    try:
+        import zstandard  # type: ignore  # noqa: F401
+    except ModuleNotFoundError:
+        # Optional dependency: keep writing plain JSON rather than failing the collector.
+        return None
+    return "zstd"
+
+
+# zstd level for compressed Bronze writes: near-memcpy speed, several-fold smaller on TDX JSON.
+_ZSTD_LEVEL = 3
+
+_zstd_local = threading.local()
+
+
+def _zstd_compressor() -> Any:
+    # One long-lived `ZstdCompressor` per thread: building one allocates its compression context,
+    # and an instance must not be used by two threads at once.
+    cctx = getattr(_zstd_local, "cctx", None)
+    if cctx is None:
+        import zstandard  # type: ignore
+
+        cctx = _zstd_local.cctx = zstandard.ZstdCompressor(level=_ZSTD_LEVEL)
+    return cctx
+
+
+def _dumps_json(obj: Any) -> bytes:
+    # UTF-8 JSON bytes with non-ASCII text kept as-is (Chinese station names stay readable).
+    try:
+        # `orjson` is an optional speedup (~8x faster on availability payloads).
+        import orjson  # type: ignore
+    except ModuleNotFoundError:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    try:
+        # orjson writes compact separators; readers parse the same values. (It also writes NaN as
+        # null, but TDX payloads are parsed from standard JSON, which has no NaN.)
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        # e.g. integers beyond 64 bits, which stdlib `json` still serializes.
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _write_atomic(path: Path, chunks: Iterable[Union[bytes, memoryview]]) -> None:
+    # Write `chunks` to a temp name, fsync it, then rename over `path`: readers (Silver builds,
+    # archiving) never see a partial file, and a crash never leaves a truncated snapshot.
+    # If producing a chunk raises (e.g. a failed page fetch), the temp file is removed.
+    # The `.tmp` name is not a Bronze suffix, so listings skip it.
+    # The open/write/fsync/close/rename sequence costs ~0.3 ms per file (fsync dominates), paid once
+    # per city per poll on the writer thread, so batching these syscalls would not be noticeable.
+    tmp = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        try:
+            for data in chunks:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def write_bronze_json(
@@ -20,20 +107,27 @@ def write_bronze_json(
     retrieved_at: datetime,
     request: Optional[Mapping[str, Any]],
     payload: Any,
+    suspect: Optional[str] = None,
 ) -> Path:
     """
     Persist raw API payload to Bronze with minimal metadata for traceability.
-    """
 
-    # Convert retrieval time to a stable UTC timestamp string for file naming and easy sorting.
-    ts = retrieved_at.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-    # Partition the Bronze lake by source/domain/dataset and city so downstream reads can prune quickly.
-    out_dir = base_dir / source / domain / dataset / f"city={city}"
-    # Ensure the directory exists before writing the file (safe for first-run and cron jobs).
-    out_dir.mkdir(parents=True, exist_ok=True)
+    Writes `<ts>.json`, or `<ts>.json.zst` (zstd level 3) when `bronze_compression()` is enabled.
+    The file appears atomically (temp file + fsync + rename).
+    `suspect` records why the collector distrusts the payload (the wrapper's `suspect` key);
+    the payload is still written as-is.
+    """
 
-    # File name uses the UTC timestamp so newer files naturally sort after older files.
-    out_path = out_dir / f"{ts}.json"
+    compression = bronze_compression()
+    out_path = _bronze_out_path(
+        base_dir,
+        source=source,
+        domain=domain,
+        dataset=dataset,
+        city=city,
+        retrieved_at=retrieved_at,
+        compression=compression,
+    )
     # Wrap the raw payload with minimal metadata so future rebuilds can reproduce and audit the request.
     wrapper = {
         # Store ISO-8601 UTC time for machine parsing and human readability.
@@ -43,12 +137,151 @@ def write_bronze_json(
         # Store raw payload "as-is" to preserve the source of truth for later normalization steps.
         "payload": payload,
     }
-    # Serialize with `ensure_ascii=False` so Chinese station names remain readable (no \\u escapes).
-    out_path.write_text(json.dumps(wrapper, ensure_ascii=False), encoding="utf-8")
+    # Flag payloads that failed the collector's shape check, without dropping the raw data.
+    if suspect:
+        wrapper["suspect"] = suspect
+    # Serialize straight to UTF-8 bytes (no `str` intermediate); station names stay readable.
+    data = _dumps_json(wrapper)
+    if compression == "zstd":
+        # Availability payloads are repetitive JSON, so zstd shrinks them several-fold.
+        data = _zstd_compressor().compress(data)
+    # Publish atomically so a concurrent Silver build never parses a half-written snapshot.
+    _write_atomic(out_path, (data,))
     # Return the path so callers can log/print what was written (useful in pipelines).
     return out_path
 
 
+def write_bronze_json_pages(
+    base_dir: Path,
+    *,
+    source: str,
+    domain: str,
+    dataset: str,
+    city: str,
+    retrieved_at: datetime,
+    request: Optional[Mapping[str, Any]],
+    pages: Iterable[list[Any]],
+) -> Path:
+    """
+    Like `write_bronze_json`, but the payload arrives page by page (`TDXClient.iter_json_pages`).
+
+    Each page is encoded and written (or fed to the zstd stream) as it arrives, so neither the full
+    record list nor the full encoded file is held in memory. The file has the same wrapper layout
+    (no `suspect` key: that check needs the whole payload). If `pages` raises, nothing is published.
+    """
+
+    compression = bronze_compression()
+    out_path = _bronze_out_path(
+        base_dir,
+        source=source,
+        domain=domain,
+        dataset=dataset,
+        city=city,
+        retrieved_at=retrieved_at,
+        compression=compression,
+    )
+    head = {
+        "retrieved_at": retrieved_at.astimezone(timezone.utc).isoformat(),
+        "request": dict(request) if request else None,
+    }
+    chunks = _wrapper_chunks(head, pages)
+    if compression == "zstd":
+        chunks = _zstd_chunks(chunks)
+    _write_atomic(out_path, chunks)
+    return out_path
+
+
+def _bronze_out_path(
+    base_dir: Path,
+    *,
+    source: str,
+    domain: str,
+    dataset: str,
+    city: str,
+    retrieved_at: datetime,
+    compression: Optional[str],
+) -> Path:
+    # Convert retrieval time to a stable UTC timestamp string for file naming and easy sorting.
+    ts = retrieved_at.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    # Partition the Bronze lake by source/domain/dataset and city so downstream reads can prune.
+    out_dir = base_dir / source / domain / dataset / f"city={city}"
+    # Ensure the directory exists before writing the file (safe for first-run and cron jobs).
+    out_dir.mkdir(parents=True, exist_ok=True)
+    # File name uses the UTC timestamp so newer files naturally sort after older files.
+    return out_dir / (f"{ts}.json.zst" if compression == "zstd" else f"{ts}.json")
+
+
+def _wrapper_chunks(
+    head: Mapping[str, Any], pages: Iterable[list[Any]]
+) -> Iterator[Union[bytes, memoryview]]:
+    # `{...head, "payload": [<records of every page>]}` as JSON byte chunks.
+    # Each page is encoded as a list in one call; a view without its brackets is written (no copy).
+    yield _dumps_json(dict(head))[:-1] + b',"payload":['
+    first = True
+    for page in pages:
+        if not page:
+            continue
+        if not first:
+            yield b","
+        yield memoryview(_dumps_json(page))[1:-1]
+        first = False
+    yield b"]}"
+
+
+def _zstd_chunks(chunks: Iterable[Union[bytes, memoryview]]) -> Iterator[bytes]:
+    # One zstd frame fed chunk by chunk (no content size in the header; `_read_zstd` streams it).
+    cobj = _zstd_compressor().compressobj()
+    for chunk in chunks:
+        out = cobj.compress(chunk)
+        if out:
+            yield out
+    yield cobj.flush()
+
+
+def _read_zstd(path: Path) -> bytes:
+    try:
+        import zstandard  # type: ignore
+    except ModuleNotFoundError as e:
+        raise ModuleNotFoundError(f"`zstandard` is required to read {path}") from e
+    # Stream-decompress, so frames written without a content size are read too.
+    with path.open("rb") as f, zstandard.ZstdDecompressor().stream_reader(f) as reader:
+        return reader.read()
+
+
+def read_bronze_bytes(path: Path) -> bytes:
+    # Raw JSON bytes of a Bronze file, decompressing `.json.zst` files.
+    path = Path(path)
+    if path.name.endswith(".zst"):
+        return _read_zstd(path)
+    return path.read_bytes()
+
+
 def read_bronze_json(path: Path) -> dict[str, Any]:
     # Read the Bronze wrapper back into memory; downstream code can access `["payload"]` for raw records.
-    return json.loads(path.read_text(encoding="utf-8"))
+    try:
+        # `orjson` is an optional speedup (C parser, reads bytes directly without a str decode pass).
+        import orjson  # type: ignore
+    except ModuleNotFoundError:
+        if path.name.endswith(".zst"):
+            return json.loads(_read_zstd(path).decode("utf-8"))
+        return json.loads(path.read_text(encoding="utf-8"))
+    if path.name.endswith(".zst"):
+        data = _read_zstd(path)
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data.decode("utf-8"))
+    with path.open("rb") as f:
+        try:
+            # Map the file read-only and parse straight from the mapping: no intermediate `bytes` copy,
+            # and the kernel pages the file in as the parser reads it.
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped; stdlib `json` reports them as usual.
+            return json.loads(f.read().decode("utf-8"))
+        with mm, memoryview(mm) as view:
+            try:
+                return orjson.loads(view)
+            except orjson.JSONDecodeError:
+                # Stdlib `json` accepts a few non-standard tokens (e.g. NaN) that orjson rejects.
+                return json.loads(view.tobytes().decode("utf-8"))
@@ -4,16 +4,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 # We use timezone-aware `datetime` values (always UTC) so expiry comparisons are unambiguous.
 from datetime import datetime, timedelta, timezone
-# `json.dumps` is used only for safe, truncated debug output in error messages.
+# `json` formats truncated debug output in errors and parses bodies orjson rejects.
 import json
 # `logging` is used to report rate limiting and paging behavior without leaking secrets.
 import logging
 # `random` is used for small jitter in client-side throttling (avoid synchronized bursts).
 import random
+# `threading` guards the throttle and token cache when one client is shared by worker threads.
+import threading
 # `time` provides monotonic clocks and sleeping for client-side throttling.
 import time
 # Typing helpers keep our interfaces explicit while we still operate on JSON dicts in the MVP.
-from typing import Any, Mapping, MutableMapping, Optional
+from typing import Any, Iterator, Mapping, MutableMapping, Optional
 
 # `requests` performs HTTP calls; we wrap it to centralize retries, auth, and error handling.
 import requests
@@ -57,6 +59,9 @@ class _RateLimiter:
     This is complementary to urllib3's Retry/backoff:
     - Retry/backoff handles transient errors (429/5xx) after they happen.
     - This throttle reduces the chance we hit rate limits in the first place (especially during paging).
+
+    Thread-safe: each caller reserves the next start slot under a lock and sleeps outside it,
+    so concurrent requests are spaced by `min_interval_s` without serializing their latency.
     """
 
     def __init__(
@@ -72,17 +77,24 @@ class _RateLimiter:
         self._now = now_fn
         self._sleep = sleep_fn
         self._next_allowed_at = 0.0
+        self._lock = threading.Lock()
 
     def wait(self) -> None:
         if self._min_interval_s <= 0:
             return
-        now = float(self._now())
-        remaining = self._next_allowed_at - now
-        if remaining > 0:
-            jitter = random.random() * self._jitter_s if self._jitter_s else 0.0
-            self._sleep(remaining + jitter)
+        with self._lock:
             now = float(self._now())
-        self._next_allowed_at = now + self._min_interval_s
+            start = now
+            if self._next_allowed_at > now:
+                jitter = random.random() * self._jitter_s if self._jitter_s else 0.0
+                start = self._next_allowed_at + jitter
+            self._next_allowed_at = start + self._min_interval_s
+        if start > now:
+            self._sleep(start - now)
+
+
+# Read size when streaming a response body into the reusable per-thread buffer.
+_BODY_CHUNK_BYTES = 64 * 1024
 
 
 # `TDXCredentials` holds the client id/secret for the OAuth client-credentials flow.
@@ -143,6 +155,7 @@ class TDXClient:
         min_request_interval_s: float = 0.0,
         request_jitter_s: float = 0.0,
         user_agent: str = "metrobikeatlas/0.1.0",
+        pool_maxsize: int = 32,
     ) -> None:
         # Normalize `base_url` so later path joins are consistent (avoid double slashes).
         self._base_url = base_url.rstrip("/")
@@ -154,6 +167,11 @@ class TDXClient:
         self._timeout_s = timeout_s
         # Token starts empty; it will be fetched lazily on the first request.
         self._token: Optional[_Token] = None
+        # Serializes token refresh so concurrent requests fetch at most one new token.
+        self._token_lock = threading.Lock()
+        # Per-thread `bytearray` that response bodies are streamed into and parsed from, reused
+        # across requests so each poll does not allocate (and join) a fresh payload-sized `bytes`.
+        self._body_buffers = threading.local()
 
         # Client-side throttle reduces the chance we hit rate limits during paging/bursty runs.
         self._rate_limiter = _RateLimiter(
@@ -191,9 +209,15 @@ class TDXClient:
             retry.backoff_max = 60  # type: ignore[attr-defined]
         except Exception:
             pass
-        # Mount the retry policy for both HTTPS and HTTP in case environments differ.
-        self._session.mount("https://", HTTPAdapter(max_retries=retry))
-        self._session.mount("http://", HTTPAdapter(max_retries=retry))
+        # One adapter (and connection pool) for both schemes, in case environments differ.
+        # `pool_maxsize` keeps up to that many warm keep-alive connections per host: requests'
+        # default of 10 makes threads beyond that open a new TCP/TLS connection and discard it.
+        # This stays HTTP/1.1 (one connection per in-flight request): a collector polls a handful
+        # of cities per interval, and an HTTP/2 client would have to re-implement the
+        # status/Retry-After policy above, which urllib3 applies here.
+        adapter = HTTPAdapter(pool_maxsize=max(int(pool_maxsize), 1), max_retries=retry)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
     def _now_utc(self) -> datetime:
         # Always use UTC to avoid timezone bugs (DST, local machine settings, etc.).
@@ -227,14 +251,23 @@ class TDXClient:
         # Return a token object so we can cache it on the client instance.
         return _Token(access_token=access_token, expires_at=expires_at)
 
-    def _get_token(self) -> str:
-        # Compute "now" once to keep comparisons consistent (and avoid calling the clock multiple times).
-        now = self._now_utc()
-        # Refresh token lazily when missing or expired; this keeps startup fast and avoids unused token calls.
-        if self._token is None or self._token.is_expired(now):
-            self._token = self._fetch_token()
-        # Return the bearer token string for Authorization headers.
-        return self._token.access_token
+    def _get_token(self, *, stale: Optional[str] = None) -> str:
+        # `stale` is a token the server rejected; it is replaced unless another thread already did.
+        # Fast path without the lock: the cached token is still valid (the common case on every
+        # request); the check is repeated under the lock so racing threads share one refresh.
+        token = self._token
+        if token is not None and token.access_token != stale:
+            if not token.is_expired(self._now_utc()):
+                return token.access_token
+        with self._token_lock:
+            # Compute "now" once to keep comparisons consistent (one clock call).
+            now = self._now_utc()
+            # Refresh lazily when missing, expired, or rejected (no unused token calls at startup).
+            token = self._token
+            if token is None or token.is_expired(now) or token.access_token == stale:
+                self._token = self._fetch_token()
+            # Return the bearer token string for Authorization headers.
+            return self._token.access_token
 
     def _build_url(self, path: str) -> str:
         # Support absolute URLs (used for `@odata.nextLink` paging).
@@ -257,24 +290,30 @@ class TDXClient:
         # Build the full URL early so we can include it in error messages.
         url = self._build_url(path)
         # Start from required headers: Authorization (bearer token) and Accept (JSON response expected).
+        token = self._get_token()
         req_headers: MutableMapping[str, str] = {
-            "Authorization": f"Bearer {self._get_token()}",
+            "Authorization": f"Bearer {token}",
             "Accept": "application/json",
         }
         # Merge optional headers so callers can pass TDX-specific knobs without modifying this client.
         if headers:
             req_headers.update(headers)
 
-        # Perform the GET request; retry/backoff is handled by the mounted adapter.
-        resp = self._session.get(url, params=params, headers=req_headers, timeout=self._timeout_s)
+        # Perform the GET request; retry/backoff is handled by the mounted adapter. The body is
+        # streamed (read by `_json_body`, or by `resp.text` on errors).
+        resp = self._session.get(
+            url, params=params, headers=req_headers, timeout=self._timeout_s, stream=True
+        )
         # 401 often means an expired/revoked token; we clear token and retry once with a fresh one.
         if resp.status_code == 401:
-            # Reset cached token so `_get_token()` will fetch a new one.
-            self._token = None
-            # Rebuild Authorization header with the new token.
-            req_headers["Authorization"] = f"Bearer {self._get_token()}"
+            # Release the connection back to the pool before retrying.
+            resp.close()
+            # Rebuild Authorization with a fresh token (fetched once even if threads race here).
+            req_headers["Authorization"] = f"Bearer {self._get_token(stale=token)}"
             # Retry the exact same request once; if it still fails, we surface an error to the caller.
-            resp = self._session.get(url, params=params, headers=req_headers, timeout=self._timeout_s)
+            resp = self._session.get(
+                url, params=params, headers=req_headers, timeout=self._timeout_s, stream=True
+            )
 
         # Treat any 4xx/5xx as an error; callers can handle retries outside if needed.
         if resp.status_code >= 400:
@@ -294,7 +333,33 @@ class TDXClient:
                 f"TDX request failed ({resp.status_code}) url={url} params={params} body={resp.text[:500]}"
             )
         # Return parsed JSON; downstream code will map dicts into typed schema objects (Silver layer).
-        return resp.json()
+        return self._json_body(resp)
+
+    def _json_body(self, resp: requests.Response) -> Any:
+        # Parse a JSON response body.
+        try:
+            # `orjson` is an optional speedup: a C parser that reads bytes (no str decode pass).
+            import orjson  # type: ignore
+        except ModuleNotFoundError:
+            return resp.json()
+        buf = getattr(self._body_buffers, "buf", None)
+        if buf is None:
+            buf = self._body_buffers.buf = bytearray()
+        # Copy the (decompressed) body into the buffer; slice assignment grows it when needed.
+        n = 0
+        for chunk in resp.iter_content(chunk_size=_BODY_CHUNK_BYTES):
+            end = n + len(chunk)
+            buf[n:end] = chunk
+            n = end
+        # The view must be released before the buffer can be resized by the next request.
+        with memoryview(buf)[:n] as body:
+            try:
+                return orjson.loads(body)
+            except orjson.JSONDecodeError:
+                # Non-UTF-8 bodies, or non-standard tokens (e.g. NaN): decode like `resp.json()`.
+                guessed = requests.utils.guess_json_utf(bytes(body[:4]))
+                encoding = resp.encoding or guessed or "utf-8"
+                return json.loads(str(body, encoding, errors="replace"))
 
     def get_json_all(
         self,
@@ -314,14 +379,35 @@ class TDXClient:
         This keeps Bronze payloads stable as a list, which simplifies Silver building.
         """
 
+        out: list[Any] = []
+        pages = self.iter_json_pages(path, params=params, headers=headers, max_pages=max_pages)
+        for records in pages:
+            out.extend(records)
+        return out
+
+    def iter_json_pages(
+        self,
+        path: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        max_pages: int = 100,
+    ) -> Iterator[list[Any]]:
+        """
+        Yield the record list of each page `get_json_all` would fetch, as it is fetched.
+
+        Lets a writer stream records to disk (`write_bronze_json_pages`) page by page.
+        The next page is requested only when the caller asks for it.
+        """
+
         if max_pages < 1:
             raise ValueError("max_pages must be >= 1")
 
-        out: list[Any] = []
         next_path: Optional[str] = path
         next_params: Optional[Mapping[str, Any]] = params
 
         page = 0
+        n_records = 0
         while next_path is not None:
             page += 1
             if page > max_pages:
@@ -331,12 +417,14 @@ class TDXClient:
             next_params = None  # nextLink already includes query params
 
             if isinstance(data, list):
-                out.extend(data)
+                n_records += len(data)
+                yield data
                 break
             if isinstance(data, Mapping):
                 value = data.get("value")
                 if isinstance(value, list):
-                    out.extend(value)
+                    n_records += len(value)
+                    yield value
                 else:
                     raise TDXRequestError(f"Unexpected TDX response shape for path={path}: {json.dumps(data)[:200]}")
 
@@ -350,8 +438,7 @@ class TDXClient:
             raise TDXRequestError(f"Unexpected TDX response type for path={path}: {type(data).__name__}")
 
         if page > 1:
-            logger.info("Fetched %s pages (%s records) for %s", page, len(out), path)
-        return out
+            logger.info("Fetched %s pages (%s records) for %s", page, n_records, path)
 
     def close(self) -> None:
         # Close network resources; important for long-running scripts to avoid open connections.
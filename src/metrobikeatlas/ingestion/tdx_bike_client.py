@@ -2,13 +2,21 @@ from __future__ import annotations
 
 # `logging` is used to record ingestion issues without hiding them behind silent failures.
 import logging
+# `fields` lists the station schema columns for the column-batch parser.
+from dataclasses import fields
 # We parse availability timestamps into timezone-aware `datetime` values for safe temporal alignment later.
 from datetime import datetime
+# The optional msgspec decoder is built once per process, on first use.
+from functools import lru_cache
+# Bronze availability files are read as bytes for the msgspec fast path.
+from pathlib import Path
 # Typing helpers keep our parsing rules explicit while we still consume raw JSON dicts from TDX.
-from typing import Any, Mapping, Optional
+from typing import Any, Iterable, Mapping, Optional
 
 # Typed settings tell this client which station/availability endpoints to call for each city.
 from metrobikeatlas.config.models import TDXBikeSettings, TDXSettings
+# Raw Bronze bytes (decompressed when the file is `.json.zst`) for the typed msgspec decoder.
+from metrobikeatlas.ingestion.bronze import read_bronze_bytes
 # `TDXClient` handles OAuth tokens, retries, and HTTP details so this module stays focused on bike semantics.
 from metrobikeatlas.ingestion.tdx_base import TDXClient
 # Schemas define our normalized station metadata and availability records (used in Silver and API outputs).
@@ -21,6 +29,35 @@ from metrobikeatlas.utils.cache import JsonFileCache
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _availability_bronze_decoder() -> Any:
+    # Typed decoder for a Bronze availability wrapper (`{"payload": [...]}`); None without msgspec.
+    # Field names are the raw TDX keys read by `parse_availability_fields`; other keys are ignored.
+    try:
+        import msgspec  # type: ignore
+    except ModuleNotFoundError:
+        return None
+    item = msgspec.defstruct(
+        "AvailabilityRecord",
+        [
+            ("StationUID", Optional[str], None),
+            ("StationId", Optional[str], None),
+            ("StationID", Optional[str], None),
+            ("UID", Optional[str], None),
+            ("UpdateTime", Optional[datetime], None),
+            ("SrcUpdateTime", Optional[datetime], None),
+            ("UpdateTimestamp", Optional[datetime], None),
+            ("AvailableRentBikes", Optional[int], None),
+            ("AvailableBikes", Optional[int], None),
+            ("AvailableReturnBikes", Optional[int], None),
+            ("AvailableDocks", Optional[int], None),
+        ],
+        gc=False,
+    )
+    wrapper = msgspec.defstruct("AvailabilityBronze", [("payload", list[item])], gc=False)
+    return msgspec.json.Decoder(wrapper), (msgspec.DecodeError, msgspec.ValidationError)
+
+
 # `TDXBikeClient` wraps `TDXClient` with bike-specific endpoints and normalization rules.
 # Design goal: make Silver-building code consume stable dataclasses (BikeStation/BikeAvailability) even
 # though the upstream TDX JSON fields vary across operators and cities.
@@ -148,8 +185,93 @@ class TDXBikeClient:
             capacity=capacity_value,
         )
 
+    @staticmethod
+    def parse_station_columns(
+        payload: Iterable[Mapping[str, Any]], *, city: str
+    ) -> dict[str, list[Any]]:
+        # Parse a whole payload into `{column: values}` in `BikeStation` field order, ready for
+        # `pd.DataFrame(...)`; skips the per-record `asdict` copy and the list-of-dicts transpose.
+        names = [f.name for f in fields(BikeStation)]
+        columns: dict[str, list[Any]] = {name: [] for name in names}
+        for item in payload:
+            record = TDXBikeClient.parse_station(item, city=city)
+            for name in names:
+                columns[name].append(getattr(record, name))
+        return columns
+
     @staticmethod
     def parse_availability(item: Mapping[str, Any]) -> BikeAvailability:
+        station_id, ts, available_bikes, available_docks = TDXBikeClient.parse_availability_fields(item)
+        # Return a typed dataclass so temporal alignment and proxy calculations can rely on stable columns.
+        return BikeAvailability(
+            station_id=station_id,
+            ts=ts,
+            available_bikes=available_bikes,
+            available_docks=available_docks,
+            source="tdx",
+        )
+
+    @staticmethod
+    def decode_availability_bronze(
+        path: Path,
+    ) -> Optional[tuple[list[str], list[datetime], list[int], list[Optional[int]]]]:
+        """
+        Decode a Bronze availability file straight into `(station_ids, ts, bikes, docks)` columns.
+
+        Uses msgspec (optional) so JSON decoding, timestamp parsing and int typing share one C pass.
+        Returns None when msgspec is not installed, or when the file does not fit the typed layout
+        (e.g. string counts, non-RFC3339 times, a record without id/time); callers then fall back to
+        `read_bronze_json` + `parse_availability_fields`, which also raise the usual errors.
+        """
+
+        decoder = _availability_bronze_decoder()
+        if decoder is None:
+            return None
+        decode, decode_errors = decoder
+        try:
+            records = decode.decode(read_bronze_bytes(Path(path))).payload
+        except decode_errors:
+            return None
+        station_ids: list[str] = []
+        ts: list[datetime] = []
+        available_bikes: list[int] = []
+        available_docks: list[Optional[int]] = []
+        for r in records:
+            # Same key precedence (and falsy handling) as `parse_availability_fields`.
+            station_id = r.StationUID or r.StationId or r.StationID or r.UID
+            t = r.UpdateTime or r.SrcUpdateTime or r.UpdateTimestamp
+            if not station_id or t is None:
+                return None
+            station_ids.append(station_id)
+            ts.append(t)
+            available_bikes.append(r.AvailableRentBikes or r.AvailableBikes or 0)
+            available_docks.append(r.AvailableReturnBikes or r.AvailableDocks)
+        return station_ids, ts, available_bikes, available_docks
+
+    @staticmethod
+    def availability_payload_issue(payload: Any) -> Optional[str]:
+        """
+        The first reason Silver would reject this availability payload, or None if it parses.
+
+        Applies the `parse_availability_fields` rules, so a collector can flag a suspect snapshot
+        (e.g. after a silent TDX schema change) when it is fetched, not at the next Silver build.
+        """
+
+        if not isinstance(payload, list):
+            return f"payload is {type(payload).__name__}, expected a list of records"
+        for i, item in enumerate(payload):
+            if not isinstance(item, Mapping):
+                return f"record {i} is {type(item).__name__}, expected an object"
+            try:
+                TDXBikeClient.parse_availability_fields(item)
+            except (TypeError, ValueError) as e:
+                return f"record {i}: {str(e)[:200]}"
+        return None
+
+    @staticmethod
+    def parse_availability_fields(item: Mapping[str, Any]) -> tuple[str, datetime, int, Optional[int]]:
+        # `(station_id, ts, available_bikes, available_docks)`: the shared core of the two parsers above,
+        # also used directly by Silver builds that assemble columns instead of row objects.
         # Availability records also contain a station id; we normalize to the same field used in stations.
         station_id = (
             item.get("StationUID")
@@ -174,11 +296,9 @@ class TDXBikeClient:
         # Available docks may be missing depending on provider; keep None to represent "unknown".
         available_docks = item.get("AvailableReturnBikes") or item.get("AvailableDocks")
 
-        # Return a typed dataclass so temporal alignment and proxy calculations can rely on stable columns.
-        return BikeAvailability(
-            station_id=str(station_id),
-            ts=ts,
-            available_bikes=int(available_bikes),
-            available_docks=None if available_docks is None else int(available_docks),
-            source="tdx",
+        return (
+            str(station_id),
+            ts,
+            int(available_bikes),
+            None if available_docks is None else int(available_docks),
         )
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 # `logging` is used to emit operational signals (e.g., missing optional endpoints) without crashing the pipeline.
 import logging
+# `fields` lists the station schema columns for the column-batch parser.
+from dataclasses import fields
 # Typing helpers keep parsing functions explicit while we still consume raw JSON dicts from TDX.
-from typing import Any, Mapping, Optional
+from typing import Any, Iterable, Mapping, Optional
 
 # Typed settings tell this client which TDX paths to call and which cities to iterate over.
 from metrobikeatlas.config.models import TDXMetroSettings, TDXSettings
@@ -154,3 +156,17 @@ class TDXMetroClient:
             city=city,
             system=str(operator),
         )
+
+    @staticmethod
+    def parse_station_columns(
+        payload: Iterable[Mapping[str, Any]], *, city: str
+    ) -> dict[str, list[Any]]:
+        # Parse a whole payload into `{column: values}` in `MetroStation` field order, ready for
+        # `pd.DataFrame(...)`; skips the per-record `asdict` copy and the list-of-dicts transpose.
+        names = [f.name for f in fields(MetroStation)]
+        columns: dict[str, list[Any]] = {name: [] for name in names}
+        for item in payload:
+            record = TDXMetroClient.parse_station(item, city=city)
+            for name in names:
+                columns[name].append(getattr(record, name))
+        return columns
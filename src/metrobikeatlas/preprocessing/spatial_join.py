@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import asdict
+from dataclasses import fields
+import math
 from typing import Iterable
 
+import numpy as np
 import pandas as pd
 
 from metrobikeatlas.config.models import SpatialSettings
@@ -10,6 +12,34 @@ from metrobikeatlas.schemas.core import StationBikeLink
 from metrobikeatlas.utils.geo import haversine_m
 
 
+# Same radius as `haversine_m`; used to turn a buffer radius into a latitude band.
+_EARTH_RADIUS_M = 6371000.0
+
+# Upper bound on metro x bike candidate pairs measured in one vectorized call (bounded memory).
+_MAX_PAIRS_PER_CHUNK = 2_000_000
+
+
+def _unit_vectors(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    # Points on the unit sphere, `(n, 3)`: the dot product of two rows is the cosine of their
+    # central angle, so a candidate pair costs a multiply-add instead of haversine's trig calls.
+    phi = np.radians(lat)
+    lam = np.radians(lon)
+    return np.column_stack([np.cos(phi) * np.cos(lam), np.cos(phi) * np.sin(lam), np.sin(phi)])
+
+
+def _metro_chunks(pairs_per_metro: np.ndarray) -> Iterable[tuple[int, int]]:
+    # `(start, stop)` slices of metro stations with at most `_MAX_PAIRS_PER_CHUNK` candidate pairs
+    # each (a single station with more pairs still gets its own chunk).
+    ends = np.cumsum(pairs_per_metro)
+    start = 0
+    while start < len(ends):
+        base = int(ends[start - 1]) if start else 0
+        stop = int(np.searchsorted(ends, base + _MAX_PAIRS_PER_CHUNK, side="right"))
+        stop = max(stop, start + 1)
+        yield start, stop
+        start = stop
+
+
 def build_station_bike_links(
     metro_stations: pd.DataFrame,
     bike_stations: pd.DataFrame,
@@ -25,34 +55,87 @@ def build_station_bike_links(
     - buffer: all bike stations within `radius_m`
     - nearest: k nearest bike stations
 
-    MVP note: this uses a simple haversine loop (no spatial index). Optimize later if needed.
+    Only the id/lat/lon columns are read (as numpy arrays), so callers can pass full station
+    tables without projecting them first. Bike stations are indexed by latitude once, and all
+    metro stations are queried in batches: a buffer join only measures the latitude band that can
+    lie within `radius_m` (great-circle distance is never shorter than the latitude difference),
+    and nearest measures a metro x bike distance matrix. Selected pairs are re-measured with
+    `haversine_m`, so distances and ordering match a full pairwise scan.
     """
 
-    links: list[StationBikeLink] = []
-    for _, metro in metro_stations.iterrows():
-        metro_id = str(metro[metro_id_col])
-        metro_lat = float(metro[lat_col])
-        metro_lon = float(metro[lon_col])
-
-        distances: list[tuple[str, float]] = []
-        for _, bike in bike_stations.iterrows():
-            bike_id = str(bike[bike_id_col])
-            d = haversine_m(metro_lat, metro_lon, float(bike[lat_col]), float(bike[lon_col]))
-            distances.append((bike_id, d))
-
-        if settings.join_method == "buffer":
-            selected = [(bid, d) for bid, d in distances if d <= settings.radius_m]
-        else:
-            selected = sorted(distances, key=lambda x: x[1])[: max(settings.nearest_k, 1)]
-
-        for bike_id, d in selected:
-            links.append(
-                StationBikeLink(
-                    metro_station_id=metro_id, bike_station_id=bike_id, distance_m=float(d)
-                )
-            )
-
-    return pd.DataFrame([asdict(link) for link in links])
+    bike_ids = [str(v) for v in bike_stations[bike_id_col].tolist()]
+    bike_lat = bike_stations[lat_col].to_numpy(dtype=float)
+    bike_lon = bike_stations[lon_col].to_numpy(dtype=float)
+    metro_ids = [str(v) for v in metro_stations[metro_id_col].tolist()]
+    metro_lat = metro_stations[lat_col].to_numpy(dtype=float)
+    metro_lon = metro_stations[lon_col].to_numpy(dtype=float)
+    # Slack (meters) so the vectorized prefilter never drops a pair the exact check would keep.
+    slack_m = 1.0
+    bike_xyz = _unit_vectors(bike_lat, bike_lon)
+    metro_xyz = _unit_vectors(metro_lat, metro_lon)
+
+    # Python floats for the exact re-measure (scalar `math` calls are slow on numpy scalars).
+    metro_ll = list(zip(metro_lat.tolist(), metro_lon.tolist()))
+    bike_ll = list(zip(bike_lat.tolist(), bike_lon.tolist()))
+
+    def exact(m: int, b: int) -> float:
+        return haversine_m(*metro_ll[m], *bike_ll[b])
+
+    # Link columns in `StationBikeLink` field order, filled directly (no per-link `asdict`).
+    link_metro: list[str] = []
+    link_bike: list[str] = []
+    link_dist: list[float] = []
+    if settings.join_method == "buffer":
+        by_lat = np.argsort(bike_lat, kind="stable")
+        sorted_lat = bike_lat[by_lat]
+        dlat = math.degrees((settings.radius_m + slack_m) / _EARTH_RADIUS_M)
+        lo = np.searchsorted(sorted_lat, metro_lat - dlat, side="left")
+        hi = np.searchsorted(sorted_lat, metro_lat + dlat, side="right")
+        counts = hi - lo
+        min_cos = math.cos((settings.radius_m + slack_m) / _EARTH_RADIUS_M)
+        for start, stop in _metro_chunks(counts):
+            # Expand each metro station's latitude band into (metro, bike) candidate pairs.
+            n = counts[start:stop]
+            metro_pos = np.repeat(np.arange(start, stop), n)
+            within = np.arange(int(n.sum())) - np.repeat(np.cumsum(n) - n, n)
+            bike_pos = by_lat[np.repeat(lo[start:stop], n) + within]
+            cos_angle = np.einsum("ij,ij->i", metro_xyz[metro_pos], bike_xyz[bike_pos])
+            keep = cos_angle >= min_cos
+            metro_pos, bike_pos = metro_pos[keep], bike_pos[keep]
+            # Metro input order, then the input order of bike stations among the matches.
+            order = np.lexsort((bike_pos, metro_pos))
+            for m, b in zip(metro_pos[order].tolist(), bike_pos[order].tolist()):
+                d = exact(m, b)
+                if d <= settings.radius_m:
+                    link_metro.append(metro_ids[m])
+                    link_bike.append(bike_ids[b])
+                    link_dist.append(d)
+    else:
+        k = max(settings.nearest_k, 1)
+        n = len(bike_ids)
+        for start, stop in _metro_chunks(np.full(len(metro_ids), n)):
+            # Missing coordinates (NaN) rank as the farthest stations.
+            cos_angle = np.nan_to_num(metro_xyz[start:stop] @ bike_xyz.T, nan=-np.inf)
+            if n > k:
+                # The k-th nearest bike station has the k-th largest cosine; keep everything within
+                # `slack_m` of its distance.
+                kth = np.partition(cos_angle, n - k, axis=1)[:, n - k]
+                angle = np.arccos(np.clip(kth, -1.0, 1.0)) + slack_m / _EARTH_RADIUS_M
+                near = cos_angle >= np.cos(np.minimum(angle, math.pi))[:, None]
+                # Fewer than k stations with coordinates: no links, as with a NaN k-th distance.
+                near &= np.isfinite(kth)[:, None]
+            else:
+                near = np.ones(cos_angle.shape, dtype=bool)
+            for m, row in zip(range(start, stop), near):
+                # Sorting (distance, index) equals a stable sort by distance over the input order.
+                ranked = sorted((exact(m, b), b) for b in np.flatnonzero(row).tolist())
+                for d, b in ranked[:k]:
+                    link_metro.append(metro_ids[m])
+                    link_bike.append(bike_ids[b])
+                    link_dist.append(d)
+
+    names = [f.name for f in fields(StationBikeLink)]
+    return pd.DataFrame(dict(zip(names, (link_metro, link_bike, link_dist))), columns=names)
 
 
 def filter_links_for_station(
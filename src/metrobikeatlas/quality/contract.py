@@ -167,8 +167,25 @@ def validate_silver_extended(silver_dir: Path, *, strict: bool = False) -> list[
 
 
 def write_json(path: Path, payload: dict[str, object]) -> None:
+    """
+    Atomically write `payload` as indented UTF-8 JSON (temp file + rename).
+
+    Uses `orjson` (optional C encoder, writes bytes directly) when installed; payloads it cannot
+    encode (e.g. non-str keys, numpy scalars) go through stdlib `json`. orjson writes NaN as null.
+    """
+
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(".json.tmp")
-    tmp.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    data: bytes | None = None
+    try:
+        import orjson  # type: ignore
+
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    except (ModuleNotFoundError, TypeError):
+        data = None
+    if data is not None:
+        tmp.write_bytes(data)
+    else:
+        tmp.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
     tmp.replace(path)
 
@@ -11,6 +11,7 @@ from metrobikeatlas.analytics.similarity import find_similar_stations
 from metrobikeatlas.config.models import AppConfig
 from metrobikeatlas.preprocessing.temporal_align import align_timeseries, compute_rent_return_proxy
 from metrobikeatlas.utils.geo import haversine_m
+from metrobikeatlas.utils.tables import read_table, table_exists
 
 
 SpatialJoinMethod = Literal["buffer", "nearest"]
@@ -52,7 +53,7 @@ class LocalRepository:
         else:
             # In lazy mode, allow either partitioned files or the monolithic CSV.
             bike_ts_csv = self._silver_dir / "bike_timeseries.csv"
-            if not self._bike_ts_parts_dir.exists() and not bike_ts_csv.exists():
+            if not self._bike_ts_parts_dir.exists() and not table_exists(bike_ts_csv):
                 raise FileNotFoundError(f"Missing required file: {bike_ts_csv}")
             self._bike_ts = None
         self._metro_ts = self._read_optional_csv("metro_timeseries.csv", parse_dates=["ts"])
@@ -74,7 +75,7 @@ class LocalRepository:
         """
         Read bike time series in a scalable way for long-running deployments.
 
-        If `data/silver/bike_timeseries_parts/YYYY-MM-DD.csv` exists, we read only the most recent days.
+        If `data/silver/bike_timeseries_parts/YYYY-MM-DD.{csv,parquet}` exists, we read only the most recent days.
         Otherwise we fall back to reading the full `bike_timeseries.csv`.
         """
 
@@ -82,7 +83,7 @@ class LocalRepository:
             return self._read_bike_ts_sqlite(bike_ids=bike_ids, window_days=window_days)
 
         if self._bike_ts_parts_dir.exists():
-            files = sorted(self._bike_ts_parts_dir.glob("*.csv"))
+            files = self._bike_ts_part_paths()
             if not files:
                 return pd.DataFrame(columns=["station_id", "ts"])
             if window_days is not None:
@@ -92,7 +93,7 @@ class LocalRepository:
             frames = []
             for f in use:
                 try:
-                    df = pd.read_csv(f, parse_dates=["ts"])
+                    df = read_table(f, parse_dates=["ts"])
                 except Exception:
                     continue
                 if "station_id" in df.columns:
@@ -682,11 +683,11 @@ class LocalRepository:
         if self._lazy_bike_ts:
             # Prefer partitioned files: read a small suffix of files to get a recent index.
             if self._bike_ts_parts_dir.exists():
-                files = sorted(self._bike_ts_parts_dir.glob("*.csv"))[-7:]  # last week
+                files = self._bike_ts_part_paths()[-7:]  # last week
                 stamps = []
                 for f in files:
                     try:
-                        df = pd.read_csv(f, usecols=["ts"])
+                        df = read_table(f, columns=["ts"])
                     except Exception:
                         continue
                     t = pd.to_datetime(df["ts"], utc=True, errors="coerce")
@@ -729,8 +730,8 @@ class LocalRepository:
             if self._bike_ts_parts_dir.exists():
                 day = target.strftime("%Y-%m-%d")
                 f = self._bike_ts_parts_dir / f"{day}.csv"
-                if f.exists():
-                    df = pd.read_csv(f, parse_dates=["ts"])
+                if table_exists(f):
+                    df = read_table(f, parse_dates=["ts"])
                 else:
                     return []
             elif self._use_sqlite:
@@ -790,9 +791,9 @@ class LocalRepository:
             if self._bike_ts_parts_dir.exists():
                 day = target.strftime("%Y-%m-%d")
                 f = self._bike_ts_parts_dir / f"{day}.csv"
-                if not f.exists():
+                if not table_exists(f):
                     return []
-                df = pd.read_csv(f, parse_dates=["ts"])
+                df = read_table(f, parse_dates=["ts"])
             elif self._use_sqlite:
                 metric_key = str(metric).strip().lower()
                 metric_col = {
@@ -877,20 +878,28 @@ class LocalRepository:
             for _, row in grouped.iterrows()
         ]
 
+    def _bike_ts_part_paths(self) -> list[Path]:
+        # Day partitions may be CSV, Parquet, or both (`build_silver.py --format`); one CSV-named path per day.
+        days = {p.stem for p in self._bike_ts_parts_dir.glob("*.csv")}
+        days.update(p.stem for p in self._bike_ts_parts_dir.glob("*.parquet"))
+        return [self._bike_ts_parts_dir / f"{day}.csv" for day in sorted(days)]
+
     def _read_required_csv(self, filename: str, **kwargs) -> pd.DataFrame:
+        # Silver tables may also have a Parquet sibling (see `scripts/build_silver.py --format`).
         path = self._silver_dir / filename
-        if not path.exists():
+        if not table_exists(path):
             raise FileNotFoundError(f"Missing required Silver file: {path}")
-        return pd.read_csv(path, **kwargs)
+        return read_table(path, **kwargs)
 
     def _read_optional_csv(self, filename: str, **kwargs) -> pd.DataFrame | None:
         path = self._silver_dir / filename
-        if not path.exists():
+        if not table_exists(path):
             return None
-        return pd.read_csv(path, **kwargs)
+        return read_table(path, **kwargs)
 
     @staticmethod
     def _read_optional_path(path: Path) -> pd.DataFrame | None:
-        if not path.exists():
+        # Gold tables may be written as CSV, Parquet, or both (see `scripts/build_features.py`).
+        if not table_exists(path):
             return None
-        return pd.read_csv(path)
+        return read_table(path)
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MetroStation:
     station_id: str
     name: str
@@ -16,7 +16,7 @@ class MetroStation:
     name_en: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BikeStation:
     station_id: str
     name: str
@@ -27,7 +27,7 @@ class BikeStation:
     capacity: Optional[int] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BikeAvailability:
     station_id: str
     ts: datetime
@@ -36,14 +36,14 @@ class BikeAvailability:
     source: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StationBikeLink:
     metro_station_id: str
     bike_station_id: str
     distance_m: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TimeSeriesPoint:
     ts: datetime
     value: float
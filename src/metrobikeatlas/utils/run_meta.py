@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import json
+from pathlib import Path
+from typing import Any, Mapping
+
+
+def write_gold_run_meta(
+    *,
+    out_dir: Path,
+    stage: str,
+    silver_dir: Path,
+    inputs: Mapping[str, Any],
+    artifacts: Mapping[str, Any],
+) -> Path:
+    """
+    Write `<out_dir>/_run_meta.json` tying a Gold stage back to the Silver build id/hash.
+
+    Shared by `scripts/build_features.py` and `scripts/build_analytics.py`.
+    """
+
+    silver_meta_path = Path(silver_dir) / "_build_meta.json"
+    try:
+        silver_meta = json.loads(silver_meta_path.read_text(encoding="utf-8")) if silver_meta_path.exists() else None
+    except Exception:
+        silver_meta = None
+    if not isinstance(silver_meta, dict):
+        silver_meta = {}
+
+    run_meta = {
+        "type": "gold_run_meta",
+        "stage": stage,
+        "generated_at_utc": datetime.now(timezone.utc).isoformat(),
+        "silver_build_id": silver_meta.get("build_id"),
+        "silver_inputs_hash": silver_meta.get("inputs_hash"),
+        "inputs": dict(inputs),
+        "artifacts": dict(artifacts),
+    }
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    out_path = out_dir / "_run_meta.json"
+    out_path.write_text(json.dumps(run_meta, ensure_ascii=False, indent=2), encoding="utf-8")
+    return out_path
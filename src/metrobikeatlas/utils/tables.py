@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any, Iterator, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+def has_pyarrow() -> bool:
+    try:
+        import pyarrow  # type: ignore  # noqa: F401
+    except ModuleNotFoundError:
+        return False
+    return True
+
+
+def has_polars() -> bool:
+    try:
+        import polars  # type: ignore  # noqa: F401
+    except ModuleNotFoundError:
+        return False
+    return True
+
+
+def read_csv_fast(path: Path, *, parse_dates: Optional[Sequence[str]] = None, **kwargs: Any) -> pd.DataFrame:
+    """
+    Read a CSV with pandas' PyArrow engine (multithreaded tokenizer) when pyarrow is installed.
+
+    Falls back to the default C parser otherwise, so pyarrow stays an optional dependency.
+    Only pass keyword args that both engines support (e.g. `usecols`, `dtype`).
+    The PyArrow engine infers types differently (ISO strings become UTC timestamps, `date`
+    columns become `datetime.date`, empty text cells become None), so use it only for reads
+    whose columns the caller normalises anyway.
+    """
+
+    dates = list(parse_dates) if parse_dates else None
+    if has_pyarrow():
+        return pd.read_csv(path, engine="pyarrow", parse_dates=dates, **kwargs)
+    return pd.read_csv(path, parse_dates=dates, **kwargs)
+
+
+def fast_io_enabled() -> bool:
+    """
+    True when `MBA_FAST_IO` is set to a truthy value (opt-in for the pyarrow CSV writer).
+    """
+
+    return str(os.getenv("MBA_FAST_IO", "")).strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _arrow_table(df: pd.DataFrame) -> Any:
+    # None when Arrow cannot convert the frame (e.g. mixed-type object columns).
+    import pyarrow as pa  # type: ignore
+
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+
+
+# Rows per batch in pyarrow's CSV writer. Larger batches were measured slower on bike_timeseries
+# (600k rows: 1.5 s at 1024, 1.6 s at 8192, 2.2 s at 65536); most of the time is spent rendering
+# tz-aware `ts` values, which batching does not change.
+_ARROW_CSV_BATCH_ROWS = 1024
+
+# CSV writers accepted by `write_csv` / `write_table` (`polars` needs the optional polars package).
+CSV_ENGINES = ("pandas", "polars")
+
+# `DataFrame.to_csv` writes floats with `repr`, which uses exponent notation outside this range.
+_PLAIN_FLOAT_MIN = 1e-4
+_PLAIN_FLOAT_MAX = 1e16
+
+
+def _polars_csv_compatible(df: pd.DataFrame) -> bool:
+    # True when Polars' writer produces exactly the bytes of `df.to_csv(index=False)`: string-named
+    # integer columns, float32/64 without exponent-notation values, whole-second tz-aware
+    # timestamps and non-empty `str` object columns (Polars quotes empty strings; pandas does not).
+    for name, s in df.items():
+        if not isinstance(name, str):
+            return False
+        dtype = s.dtype
+        if isinstance(dtype, np.dtype) and dtype.kind in "iu":
+            continue
+        if dtype in (np.float32, np.float64):
+            v = np.abs(s.to_numpy())
+            v = v[~np.isnan(v) & (v != 0)]
+            if ((v < _PLAIN_FLOAT_MIN) | (v >= _PLAIN_FLOAT_MAX)).any():
+                return False
+            continue
+        if isinstance(dtype, pd.DatetimeTZDtype):
+            ts = s.dropna()
+            if not ts.equals(ts.dt.floor("s")):
+                return False
+            continue
+        if pd.api.types.is_object_dtype(dtype):
+            if pd.api.types.infer_dtype(s, skipna=True) not in {"string", "empty"}:
+                return False
+            if (s == "").any():
+                return False
+            continue
+        return False
+    return True
+
+
+def _write_csv_polars(df: pd.DataFrame, path: Path) -> bool:
+    # False when the frame needs the pandas writer (see `_polars_csv_compatible`).
+    if not (has_polars() and has_pyarrow() and _polars_csv_compatible(df)):
+        return False
+    import polars as pl  # type: ignore
+
+    try:
+        frame = pl.from_pandas(df)
+    except (pl.exceptions.PolarsError, ValueError, TypeError):
+        # e.g. a fixed UTC offset Polars cannot map to a time zone.
+        return False
+    frame.write_csv(path, datetime_format="%Y-%m-%d %H:%M:%S%:z", line_terminator=os.linesep)
+    return True
+
+
+def write_csv(df: pd.DataFrame, path: Path, *, table: Any = None, engine: str = "pandas") -> Path:
+    """
+    Write `df` as CSV (no index), using pyarrow's C++ writer when `MBA_FAST_IO` is on.
+
+    The Arrow writer quotes string cells and renders timestamps as `YYYY-MM-DD HH:MM:SS.fffffffff+HHMM`;
+    both round-trip through `pd.read_csv(..., parse_dates=[...])`. Frames Arrow cannot convert
+    (e.g. mixed-type object columns) fall back to `DataFrame.to_csv`.
+    `table` may pass an Arrow table already converted from `df`, so it is not converted twice.
+    `engine="polars"` writes with Polars' multi-threaded writer instead, but only for frames whose
+    output is byte-identical to `DataFrame.to_csv`; other frames (or no polars) use pandas.
+    """
+
+    if engine not in CSV_ENGINES:
+        raise ValueError(f"Unsupported CSV engine: {engine} (expected one of {CSV_ENGINES})")
+    path = Path(path)
+    if engine == "polars" and _write_csv_polars(df, path):
+        return path
+    if fast_io_enabled() and has_pyarrow():
+        import pyarrow.csv as pa_csv  # type: ignore
+
+        if table is None:
+            table = _arrow_table(df)
+        if table is not None:
+            options = pa_csv.WriteOptions(include_header=True, batch_size=_ARROW_CSV_BATCH_ROWS)
+            pa_csv.write_csv(table, str(path), write_options=options)
+            return path
+    df.to_csv(path, index=False)
+    return path
+
+
+# Output formats accepted by `write_table` (and exposed as `--format` on the Gold builders).
+TABLE_FORMATS = ("csv", "parquet", "both")
+
+# Parquet codec for `write_table`: zstd level 3 is ~15% smaller than Snappy at the same read speed.
+# pyarrow dictionary-encodes string columns (station_id, city, ...) by default.
+PARQUET_COMPRESSION = "zstd"
+PARQUET_COMPRESSION_LEVEL = 3
+
+
+def parquet_sibling(path: Path) -> Path:
+    return Path(path).with_suffix(".parquet")
+
+
+def table_exists(path: Path) -> bool:
+    """
+    True if either the CSV at `path` or its Parquet sibling exists.
+    """
+
+    path = Path(path)
+    return path.exists() or parquet_sibling(path).exists()
+
+
+def write_table(
+    df: pd.DataFrame, path: Path, *, fmt: str = "both", csv_engine: str = "pandas"
+) -> list[Path]:
+    """
+    Write `df` as CSV at `path`, as zstd Parquet next to it (`.parquet`), or both.
+
+    Parquet needs pyarrow; without it we fall back to CSV so pipelines keep running.
+    When Parquet is written, `df` is converted to Arrow once and both files are written from that table.
+    `csv_engine` is passed to `write_csv`. Returns the written paths.
+    """
+
+    if fmt not in TABLE_FORMATS:
+        raise ValueError(f"Unsupported table format: {fmt} (expected one of {TABLE_FORMATS})")
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    want_parquet = fmt in {"parquet", "both"} and has_pyarrow()
+    want_csv = fmt in {"csv", "both"} or not want_parquet
+
+    table = _arrow_table(df) if want_parquet else None
+    written: list[Path] = []
+    if want_csv:
+        written.append(write_csv(df, path, table=table, engine=csv_engine))
+    if want_parquet:
+        pq_path = parquet_sibling(path)
+        if table is not None:
+            import pyarrow.parquet as pq  # type: ignore
+
+            pq.write_table(
+                table,
+                str(pq_path),
+                compression=PARQUET_COMPRESSION,
+                compression_level=PARQUET_COMPRESSION_LEVEL,
+            )
+        else:
+            # Let pandas raise its usual conversion error.
+            df.to_parquet(
+                pq_path,
+                compression=PARQUET_COMPRESSION,
+                compression_level=PARQUET_COMPRESSION_LEVEL,
+                index=False,
+            )
+        written.append(pq_path)
+    return written
+
+
+def fresh_parquet(path: Path) -> Optional[Path]:
+    """
+    The Parquet sibling `read_table(path)` would read, or None when it would read the CSV.
+    """
+
+    pq_path = parquet_sibling(path)
+    if pq_path.exists() and has_pyarrow():
+        if not path.exists() or pq_path.stat().st_mtime >= path.stat().st_mtime:
+            return pq_path
+    return None
+
+
+def table_columns(path: Path) -> list[str]:
+    """
+    Column names of the table `read_table(path)` would read, without loading any rows.
+
+    Lets callers project only the columns that are actually present.
+    """
+
+    path = Path(path)
+    pq_path = fresh_parquet(path)
+    if pq_path is not None:
+        import pyarrow.parquet as pq  # type: ignore
+
+        return list(pq.read_schema(str(pq_path)).names)
+    return pd.read_csv(path, nrows=0).columns.tolist()
+
+
+def read_table(
+    path: Path, *, columns: Optional[Sequence[str]] = None, fast: bool = False, **kwargs: Any
+) -> pd.DataFrame:
+    """
+    Read a table written by `write_table`, preferring the Parquet sibling when it is usable.
+
+    The Parquet copy is used only if pyarrow is installed and it is not older than the CSV
+    (so a later CSV-only rebuild is never shadowed by a stale Parquet file).
+    `columns` limits the columns read from either format; other `kwargs` go to the CSV reader only.
+    CSVs are parsed with the default C parser unless `fast=True` opts into `read_csv_fast`.
+    """
+
+    path = Path(path)
+    pq_path = fresh_parquet(path)
+    if pq_path is not None:
+        return pd.read_parquet(pq_path, columns=list(columns) if columns else None)
+    if columns:
+        kwargs["usecols"] = list(columns)
+    if fast:
+        return read_csv_fast(path, **kwargs)
+    return pd.read_csv(path, **kwargs)
+
+
+def iter_table_batches(
+    path: Path,
+    *,
+    batch_rows: int,
+    columns: Optional[Sequence[str]] = None,
+    **kwargs: Any,
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream the table `read_table(path)` would read as frames of at most `batch_rows` rows.
+
+    Parquet is read by row batch (`ParquetFile.iter_batches`); CSV through pandas' chunked C parser.
+    `columns` projects either format; other `kwargs` go to the CSV reader only.
+    """
+
+    path = Path(path)
+    pq_path = fresh_parquet(path)
+    if pq_path is not None:
+        import pyarrow.parquet as pq  # type: ignore
+
+        cols = list(columns) if columns else None
+        for batch in pq.ParquetFile(str(pq_path)).iter_batches(batch_size=batch_rows, columns=cols):
+            yield batch.to_pandas()
+        return
+    if columns:
+        kwargs["usecols"] = list(columns)
+    yield from pd.read_csv(path, chunksize=batch_rows, **kwargs)
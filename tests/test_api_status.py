@@ -121,3 +121,17 @@ def test_replay_endpoint_works(monkeypatch) -> None:
     payload = resp.json()
     assert payload["station_id"] == station_id
     assert "meta" in payload
+
+
+def test_dataset_status_counts_compressed_bronze_files(tmp_path) -> None:
+    from metrobikeatlas.api.routes import _dataset_status
+
+    city_dir = tmp_path / "city=Taipei"
+    city_dir.mkdir()
+    for name in ("20260101T000000Z.json", "20260101T000500Z.json.zst", "notes.txt"):
+        (city_dir / name).write_bytes(b"{}")
+
+    status = _dataset_status("tdx:bike:availability", tmp_path)
+    assert status.file_count == 2
+    assert status.latest_file is not None
+    assert status.latest_file.path.endswith("20260101T000500Z.json.zst")
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+import json
+import math
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from metrobikeatlas.ingestion.bronze import (
+    is_bronze_file_name,
+    read_bronze_bytes,
+    read_bronze_json,
+    write_bronze_json,
+    write_bronze_json_pages,
+)
+from metrobikeatlas.ingestion.tdx_bike_client import TDXBikeClient
+from metrobikeatlas.ingestion.tdx_metro_client import TDXMetroClient
+
+
+def test_read_bronze_json_round_trips_wrapper(tmp_path: Path) -> None:
+    path = write_bronze_json(
+        tmp_path,
+        source="tdx",
+        domain="bike",
+        dataset="availability",
+        city="Taipei",
+        retrieved_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        request={"path": "Bike/Availability/City/Taipei"},
+        payload=[{"StationUID": "TPE1", "StationName": {"Zh_tw": "市府站"}}],
+    )
+
+    bronze = read_bronze_json(path)
+    assert bronze["retrieved_at"] == "2026-01-01T00:00:00+00:00"
+    assert bronze["payload"][0]["StationName"]["Zh_tw"] == "市府站"
+
+
+def test_write_bronze_json_zstd_round_trips(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("zstandard")
+    monkeypatch.setenv("MBA_BRONZE_COMPRESSION", "zstd")
+    payload = [{"StationUID": "TPE1", "StationName": {"Zh_tw": "市府站"}}] * 50
+    path = write_bronze_json(
+        tmp_path,
+        source="tdx",
+        domain="bike",
+        dataset="availability",
+        city="Taipei",
+        retrieved_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        request=None,
+        payload=payload,
+    )
+
+    assert path.name == "20260101T000000Z.json.zst"
+    assert is_bronze_file_name(path.name)
+    assert path.stat().st_size < len(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+    assert read_bronze_json(path)["payload"] == payload
+    assert json.loads(read_bronze_bytes(path))["payload"] == payload
+
+
+def test_write_bronze_json_orjson_matches_stdlib_output(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import sys
+
+    pytest.importorskip("orjson")
+    monkeypatch.delenv("MBA_BRONZE_COMPRESSION", raising=False)
+    payload = [{"StationUID": "TPE1", "StationName": {"Zh_tw": "市府站"}, "Lat": 25.04}]
+
+    def write(base_dir: Path) -> Path:
+        return write_bronze_json(
+            base_dir,
+            source="tdx",
+            domain="bike",
+            dataset="availability",
+            city="Taipei",
+            retrieved_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            request=None,
+            payload=payload,
+        )
+
+    fast = write(tmp_path / "orjson")
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    slow = write(tmp_path / "json")
+
+    assert "市府站" in fast.read_text(encoding="utf-8")
+    assert json.loads(fast.read_bytes()) == json.loads(slow.read_bytes())
+    assert read_bronze_json(fast)["payload"] == payload
+
+
+def test_write_bronze_json_leaves_no_partial_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import os
+
+    monkeypatch.delenv("MBA_BRONZE_COMPRESSION", raising=False)
+    kwargs = dict(
+        source="tdx",
+        domain="bike",
+        dataset="availability",
+        city="Taipei",
+        retrieved_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        request=None,
+    )
+    path = write_bronze_json(tmp_path, payload=[{"StationUID": "TPE1"}], **kwargs)
+    assert [p.name for p in path.parent.iterdir()] == [path.name]
+
+    def fail_fsync(fd: int) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "fsync", fail_fsync)
+    with pytest.raises(OSError):
+        write_bronze_json(tmp_path, payload=[{"StationUID": "TPE2"}], **kwargs)
+    assert [p.name for p in path.parent.iterdir()] == [path.name]
+    assert read_bronze_json(path)["payload"] == [{"StationUID": "TPE1"}]
+
+
+def _paged_availability() -> tuple[list[list[dict[str, object]]], dict[str, object]]:
+    pages = [
+        [{"StationUID": "TPE1", "StationName": {"Zh_tw": "市府站"}}],
+        [],
+        [{"StationUID": "TPE2"}],
+    ]
+    kwargs = dict(
+        source="tdx",
+        domain="bike",
+        dataset="availability",
+        city="Taipei",
+        retrieved_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        request={"path": "Bike/Availability/City/Taipei"},
+    )
+    return pages, kwargs
+
+
+def test_write_bronze_json_pages_matches_single_write(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("MBA_BRONZE_COMPRESSION", raising=False)
+    pages, kwargs = _paged_availability()
+    payload = [r for page in pages for r in page]
+    whole = write_bronze_json(tmp_path / "whole", payload=payload, **kwargs)
+    paged = write_bronze_json_pages(tmp_path / "paged", pages=iter(pages), **kwargs)
+    assert paged.name == whole.name
+    assert read_bronze_json(paged) == read_bronze_json(whole)
+
+    def failing_pages():  # type: ignore[no-untyped-def]
+        yield pages[0]
+        raise RuntimeError("page 2 failed")
+
+    with pytest.raises(RuntimeError):
+        write_bronze_json_pages(tmp_path / "failed", pages=failing_pages(), **kwargs)
+    assert [p for p in (tmp_path / "failed").rglob("*") if p.is_file()] == []
+
+
+def test_write_bronze_json_pages_zstd_round_trips(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("zstandard")
+    monkeypatch.setenv("MBA_BRONZE_COMPRESSION", "zstd")
+    pages, kwargs = _paged_availability()
+    path = write_bronze_json_pages(tmp_path, pages=iter(pages), **kwargs)
+    assert path.name == "20260101T000000Z.json.zst"
+    assert read_bronze_json(path)["payload"] == [r for page in pages for r in page]
+
+
+def test_read_bronze_json_accepts_nan_tokens(tmp_path: Path) -> None:
+    path = tmp_path / "20260101T000000Z.json"
+    raw = '{"retrieved_at": null, "request": null, "payload": [{"v": NaN}]}'
+    path.write_text(raw, encoding="utf-8")
+
+    assert math.isnan(read_bronze_json(path)["payload"][0]["v"])
+
+
+def test_read_bronze_json_reports_empty_file(tmp_path: Path) -> None:
+    path = tmp_path / "20260101T000000Z.json"
+    path.write_bytes(b"")
+
+    with pytest.raises(json.JSONDecodeError):
+        read_bronze_json(path)
+
+
+def _write_availability(tmp_path: Path, payload: list[dict[str, object]]) -> Path:
+    return write_bronze_json(
+        tmp_path,
+        source="tdx",
+        domain="bike",
+        dataset="availability",
+        city="Taipei",
+        retrieved_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        request=None,
+        payload=payload,
+    )
+
+
+def test_decode_availability_bronze_matches_generic_parser(tmp_path: Path) -> None:
+    pytest.importorskip("msgspec")
+    payload = [
+        {"StationUID": "TPE1", "UpdateTime": "2026-01-01T08:00:00+08:00", "AvailableRentBikes": 3},
+        {
+            "StationID": "TPE2",
+            "SrcUpdateTime": "2026-01-01T00:00:00Z",
+            "AvailableBikes": 0,
+            "AvailableReturnBikes": 0,
+        },
+        {"UID": "TPE3", "UpdateTime": "2026-01-01T08:00:00+08:00", "AvailableDocks": 4},
+    ]
+    path = _write_availability(tmp_path, payload)
+
+    decoded = TDXBikeClient.decode_availability_bronze(path)
+    assert decoded is not None
+    expected = [TDXBikeClient.parse_availability_fields(item) for item in payload]
+    assert list(zip(*decoded)) == expected
+
+
+def test_decode_availability_bronze_declines_untyped_payload(tmp_path: Path) -> None:
+    pytest.importorskip("msgspec")
+    item = {"StationUID": "TPE1", "UpdateTime": "2026-01-01T08:00:00Z", "AvailableRentBikes": "3"}
+    path = _write_availability(tmp_path, [item])
+
+    assert TDXBikeClient.decode_availability_bronze(path) is None
+
+
+def test_parse_station_columns_match_dataclass_rows() -> None:
+    bike_payload = [
+        {
+            "StationUID": "TPE1",
+            "StationName": {"Zh_tw": "市府站"},
+            "StationPosition": {"PositionLat": 25.0, "PositionLon": 121.5},
+        },
+        {"StationID": "TPE2", "Position": {"Lat": 25.1, "Lon": 121.6}, "BikesCapacity": 20},
+    ]
+    metro_payload = [
+        {
+            "StationUID": "TRTC-BL12",
+            "StationName": {"Zh_tw": "台北車站", "En": "Taipei Main"},
+            "StationPosition": {"PositionLat": 25.04, "PositionLon": 121.52},
+        },
+    ]
+
+    for client, payload in ((TDXBikeClient, bike_payload), (TDXMetroClient, metro_payload)):
+        rows = [asdict(client.parse_station(item, city="Taipei")) for item in payload]
+        expected = pd.DataFrame(rows)
+        out = pd.DataFrame(client.parse_station_columns(payload, city="Taipei"))
+        pd.testing.assert_frame_equal(out, expected)
+
+
+def test_availability_payload_issue_flags_what_silver_rejects(tmp_path: Path) -> None:
+    good = {"StationUID": "TPE1", "UpdateTime": "2026-01-01T08:00:00+08:00", "AvailableBikes": 3}
+    assert TDXBikeClient.availability_payload_issue([good]) is None
+    assert "list" in TDXBikeClient.availability_payload_issue({"value": [good]})
+    assert TDXBikeClient.availability_payload_issue([good, {"StationUID": "TPE2"}]).startswith(
+        "record 1:"
+    )
+
+    path = write_bronze_json(
+        tmp_path,
+        source="tdx",
+        domain="bike",
+        dataset="availability",
+        city="Taipei",
+        retrieved_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        request=None,
+        payload=[{"StationUID": "TPE2"}],
+        suspect="record 0: Missing update time",
+    )
+    bronze = read_bronze_json(path)
+    assert bronze["suspect"] == "record 0: Missing update time"
+    assert bronze["payload"] == [{"StationUID": "TPE2"}]
@@ -3,6 +3,8 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+import numpy as np
+
 from metrobikeatlas.gis.boundaries import BoundaryIndex
 
 
@@ -35,3 +37,34 @@ def test_boundary_lookup_point_in_polygon(tmp_path: Path) -> None:
     assert idx.lookup(lat=0.5, lon=0.5) == "A"
     assert idx.lookup(lat=2.0, lon=2.0) is None
 
+
+
+def test_boundary_lookup_batch_matches_lookup(tmp_path: Path) -> None:
+    square = [[0.0, 0.0], [2.0, 0.0], [2.0, 2.0], [0.0, 2.0], [0.0, 0.0]]
+    hole = [[0.5, 0.5], [1.0, 0.5], [1.0, 1.0], [0.5, 1.0], [0.5, 0.5]]
+    triangle = [[2.0, 0.0], [4.0, 0.0], [3.0, 2.0], [2.0, 0.0]]
+    geojson = {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "properties": {"district": "A"},
+                "geometry": {"type": "Polygon", "coordinates": [square, hole]},
+            },
+            {
+                "type": "Feature",
+                "properties": {"district": "B"},
+                "geometry": {"type": "MultiPolygon", "coordinates": [[triangle], [hole]]},
+            },
+        ],
+    }
+    path = tmp_path / "boundaries.geojson"
+    path.write_text(json.dumps(geojson), encoding="utf-8")
+    idx = BoundaryIndex.from_geojson(path)
+
+    rng = np.random.default_rng(0)
+    lons = np.concatenate([rng.uniform(-1.0, 5.0, 500), [0.75, 3.0, float("nan")]])
+    lats = np.concatenate([rng.uniform(-1.0, 3.0, 500), [0.75, 1.0, 1.0]])
+    out = idx.lookup_batch(lats=lats, lons=lons)
+    assert out.tolist() == [idx.lookup(lat=y, lon=x) for x, y in zip(lons, lats)]
+    assert out[-3:].tolist() == ["B", "B", None]
@@ -3,6 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 
 import pandas as pd
+import pytest
 
 from metrobikeatlas.config.models import (
     AccessibilitySettings,
@@ -148,3 +149,31 @@ def test_station_timeseries_prefers_metro_series_when_available(tmp_path: Path)
     assert metro["is_proxy"] is False
     assert metro["metric"] == "metro_ridership"
     assert metro["points"][0]["value"] == 1234.0
+
+
+def test_station_timeseries_reads_parquet_only_silver(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("pyarrow")
+    monkeypatch.setenv("METROBIKEATLAS_LAZY_BIKE_TS", "1")
+    config = _test_config()
+    _write_required_silver(tmp_path)
+
+    # Mirror `build_silver.py --format parquet`: Parquet tables plus Parquet day parts, no CSVs.
+    for name in ("metro_stations", "bike_stations", "metro_bike_links", "bike_timeseries"):
+        csv_path = tmp_path / f"{name}.csv"
+        df = pd.read_csv(csv_path, parse_dates=["ts"] if name == "bike_timeseries" else None)
+        df.to_parquet(csv_path.with_suffix(".parquet"), index=False)
+        csv_path.unlink()
+    parts_dir = tmp_path / "bike_timeseries_parts"
+    parts_dir.mkdir()
+    pd.read_parquet(tmp_path / "bike_timeseries.parquet").to_parquet(parts_dir / "2026-01-01.parquet", index=False)
+
+    repo = LocalRepository(config, silver_dir=tmp_path)
+    ts = repo.station_timeseries("M1")
+
+    bike = next(s for s in ts["series"] if s["metric"].startswith("bike"))
+    assert bike["points"][0]["value"] == 13.5
+    assert [i["ts"].isoformat() for i in repo.metro_bike_availability_index()] == [
+        "2026-01-01T00:10:00+00:00",
+        "2026-01-01T00:20:00+00:00",
+        "2026-01-01T00:30:00+00:00",
+    ]
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import pandas as pd
 import pytest
 
+from metrobikeatlas.quality.contract import write_json
 from metrobikeatlas.quality.silver import validate_silver_dir
 
 
@@ -41,3 +43,11 @@ def test_validate_silver_missing_required_file_raises(tmp_path: Path) -> None:
     with pytest.raises(ValueError):
         validate_silver_dir(tmp_path, strict=True)
 
+
+def test_write_json_matches_stdlib_layout(tmp_path: Path) -> None:
+    payload = {"name": "市府站", "artifacts": [{"size_bytes": 1, "mtime_utc": None}], "empty": []}
+    out = tmp_path / "_build_meta.json"
+    write_json(out, payload)
+
+    assert out.read_text(encoding="utf-8") == json.dumps(payload, ensure_ascii=False, indent=2)
+    assert not out.with_suffix(".json.tmp").exists()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from metrobikeatlas.config.models import SpatialSettings
+from metrobikeatlas.preprocessing import spatial_join
+from metrobikeatlas.preprocessing.spatial_join import build_station_bike_links
+from metrobikeatlas.utils.geo import haversine_m
+
+
+def _stations() -> tuple[pd.DataFrame, pd.DataFrame]:
+    metro = pd.DataFrame(
+        [
+            {"station_id": "M1", "lat": 25.0330, "lon": 121.5654},
+            {"station_id": "M2", "lat": 25.0478, "lon": 121.5170},
+        ]
+    )
+    bike = pd.DataFrame(
+        [
+            {"station_id": "B1", "lat": 25.0335, "lon": 121.5650},
+            {"station_id": "B2", "lat": 25.0480, "lon": 121.5175},
+            {"station_id": "B3", "lat": 25.0360, "lon": 121.5680},
+            {"station_id": "B4", "lat": 25.1000, "lon": 121.6000},
+            {"station_id": "B5", "lat": 25.0335, "lon": 121.5650},
+        ]
+    )
+    return metro, bike
+
+
+def test_buffer_join_matches_pairwise_scan() -> None:
+    metro, bike = _stations()
+    settings = SpatialSettings(join_method="buffer", radius_m=500, nearest_k=3)
+    links = build_station_bike_links(metro, bike, settings=settings)
+
+    expected = [
+        (m.station_id, b.station_id, haversine_m(m.lat, m.lon, b.lat, b.lon))
+        for m in metro.itertuples()
+        for b in bike.itertuples()
+        if haversine_m(m.lat, m.lon, b.lat, b.lon) <= 500
+    ]
+    assert list(links.itertuples(index=False, name=None)) == expected
+
+
+def test_nearest_join_keeps_input_order_on_ties() -> None:
+    metro, bike = _stations()
+    settings = SpatialSettings(join_method="nearest", radius_m=0, nearest_k=2)
+    links = build_station_bike_links(metro, bike, settings=settings)
+
+    m1 = links[links["metro_station_id"] == "M1"]
+    # B1 and B5 share coordinates; the earlier input row wins the tie.
+    assert m1["bike_station_id"].tolist() == ["B1", "B5"]
+    assert links.groupby("metro_station_id").size().tolist() == [2, 2]
+
+
+def test_batched_queries_match_pairwise_scan_across_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Tiny chunks force several batches; a bike station without coordinates is never linked.
+    monkeypatch.setattr(spatial_join, "_MAX_PAIRS_PER_CHUNK", 3)
+    metro, bike = _stations()
+    bike.loc[len(bike)] = {"station_id": "B6", "lat": float("nan"), "lon": 121.5650}
+
+    for settings in (
+        SpatialSettings(join_method="buffer", radius_m=800, nearest_k=3),
+        SpatialSettings(join_method="nearest", radius_m=0, nearest_k=3),
+    ):
+        links = build_station_bike_links(metro, bike, settings=settings)
+        expected = []
+        for m in metro.itertuples():
+            dists = [
+                (haversine_m(m.lat, m.lon, b.lat, b.lon), i, b.station_id)
+                for i, b in enumerate(bike.itertuples())
+                if b.lat == b.lat
+            ]
+            if settings.join_method == "buffer":
+                chosen = [(sid, d) for d, _, sid in dists if d <= settings.radius_m]
+            else:
+                chosen = [(sid, d) for d, _, sid in sorted(dists)[: settings.nearest_k]]
+            expected += [(m.station_id, sid, d) for sid, d in chosen]
+        assert list(links.itertuples(index=False, name=None)) == expected
+
+
+def test_no_links_keeps_link_columns() -> None:
+    metro, bike = _stations()
+    settings = SpatialSettings(join_method="buffer", radius_m=1, nearest_k=3)
+    links = build_station_bike_links(metro, bike.iloc[[3]], settings=settings)
+    assert links.empty
+    assert links.columns.tolist() == ["metro_station_id", "bike_station_id", "distance_m"]
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from metrobikeatlas.utils import tables
+from metrobikeatlas.utils.tables import read_csv_fast, read_table, table_exists, write_csv, write_table
+
+
+def _write_ts_csv(path: Path) -> None:
+    pd.DataFrame(
+        [
+            {"station_id": "B1", "ts": "2026-01-01T00:00:00+00:00", "available_bikes": 3},
+            {"station_id": "B2", "ts": "2026-01-01T01:00:00+00:00", "available_bikes": 5},
+        ]
+    ).to_csv(path, index=False)
+
+
+def test_read_csv_fast_falls_back_without_pyarrow(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "bike_timeseries.csv"
+    _write_ts_csv(path)
+    monkeypatch.setattr(tables, "has_pyarrow", lambda: False)
+
+    df = read_csv_fast(path, parse_dates=["ts"])
+    assert df["station_id"].tolist() == ["B1", "B2"]
+    assert pd.api.types.is_datetime64_any_dtype(df["ts"])
+    assert df["available_bikes"].tolist() == [3, 5]
+
+
+def test_read_csv_fast_uses_pyarrow_engine_when_available(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "bike_timeseries.csv"
+    _write_ts_csv(path)
+
+    df = read_csv_fast(path, parse_dates=["ts"])
+    assert df["station_id"].tolist() == ["B1", "B2"]
+    assert pd.api.types.is_datetime64_any_dtype(df["ts"])
+
+
+def test_read_table_csv_matches_c_engine_with_and_without_pyarrow(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "bike_timeseries.csv"
+    path.write_text(
+        "station_id,ts,date,available_bikes,name\n"
+        "B1,2026-01-01T08:00:00+08:00,2026-01-01,3,Taipei Main\n"
+        "B2,2026-01-01T09:00:00+08:00,2026-01-01,,\n",
+        encoding="utf-8",
+    )
+    expected = pd.read_csv(path, engine="c")
+
+    with_pyarrow = read_table(path)
+    monkeypatch.setattr(tables, "has_pyarrow", lambda: False)
+    without_pyarrow = read_table(path)
+
+    pd.testing.assert_frame_equal(with_pyarrow, expected)
+    pd.testing.assert_frame_equal(without_pyarrow, expected)
+    # Unparsed ISO timestamps and dates stay as the original text; empty cells are NaN.
+    assert with_pyarrow["ts"].tolist()[0] == "2026-01-01T08:00:00+08:00"
+    assert with_pyarrow["date"].tolist()[0] == "2026-01-01"
+    assert pd.isna(with_pyarrow["name"][1]) and with_pyarrow["name"][1] is not None
+
+
+def test_write_table_both_round_trips_via_parquet(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"station_id": ["M1", "M2"], "cluster": [0, 1]})
+    path = tmp_path / "station_clusters.csv"
+
+    written = write_table(df, path, fmt="both")
+    assert written == [path, path.with_suffix(".parquet")]
+    assert table_exists(path)
+
+    out = read_table(path)
+    pd.testing.assert_frame_equal(out, df)
+
+
+def test_read_table_ignores_stale_parquet(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "station_clusters.csv"
+    write_table(pd.DataFrame({"station_id": ["OLD"], "cluster": [9]}), path, fmt="parquet")
+    assert not path.exists()
+
+    pq_path = path.with_suffix(".parquet")
+    write_table(pd.DataFrame({"station_id": ["NEW"], "cluster": [1]}), path, fmt="csv")
+    os.utime(pq_path, (path.stat().st_mtime - 10, path.stat().st_mtime - 10))
+
+    assert read_table(path)["station_id"].tolist() == ["NEW"]
+
+
+def test_write_table_falls_back_to_csv_without_pyarrow(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tables, "has_pyarrow", lambda: False)
+    path = tmp_path / "feature_correlations.csv"
+
+    written = write_table(pd.DataFrame({"feature": ["a"], "correlation": [0.5]}), path, fmt="parquet")
+    assert written == [path]
+    assert table_exists(path)
+    assert read_table(path)["feature"].tolist() == ["a"]
+
+
+def test_write_csv_defaults_to_pandas_output(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("MBA_FAST_IO", raising=False)
+    df = pd.DataFrame({"station_id": ["B1"], "available_bikes": [3]})
+    path = write_csv(df, tmp_path / "bike_stations.csv")
+    assert path.read_text(encoding="utf-8") == df.to_csv(index=False)
+
+
+def test_write_csv_fast_io_round_trips(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("pyarrow")
+    monkeypatch.setenv("MBA_FAST_IO", "1")
+    df = pd.DataFrame(
+        {
+            "station_id": ["B1", "B2"],
+            "ts": pd.to_datetime(["2026-01-01T08:00:00+08:00", "2026-01-01T09:00:00+08:00"]),
+            "available_docks": [None, 4.0],
+        }
+    )
+    path = write_csv(df, tmp_path / "bike_timeseries.csv")
+
+    out = pd.read_csv(path, parse_dates=["ts"])
+    assert out["station_id"].tolist() == ["B1", "B2"]
+    assert out["ts"].tolist() == df["ts"].tolist()
+    assert pd.isna(out["available_docks"][0]) and out["available_docks"][1] == 4.0
+
+
+def test_read_table_columns_apply_to_both_formats(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "bike_timeseries.csv"
+    _write_ts_csv(path)
+    assert read_table(path, columns=["ts"]).columns.tolist() == ["ts"]
+
+    write_table(pd.read_csv(path), path, fmt="parquet")
+    assert read_table(path, columns=["ts"]).columns.tolist() == ["ts"]
+
+
+def test_write_table_both_converts_to_arrow_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("pyarrow")
+    monkeypatch.setenv("MBA_FAST_IO", "1")
+    calls: list[int] = []
+    real = tables._arrow_table
+    monkeypatch.setattr(tables, "_arrow_table", lambda df: calls.append(1) or real(df))
+    df = pd.DataFrame({"station_id": ["B1", "B2"], "available_bikes": [3, 5]})
+    path = tmp_path / "bike_timeseries.csv"
+
+    write_table(df, path, fmt="both")
+    assert calls == [1]
+    pd.testing.assert_frame_equal(pd.read_parquet(path.with_suffix(".parquet")), df)
+    assert pd.read_csv(path)["station_id"].tolist() == ["B1", "B2"]
+
+
+def test_table_columns_follow_read_table_choice(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "bike_timeseries.csv"
+    _write_ts_csv(path)
+    assert tables.table_columns(path) == ["station_id", "ts", "available_bikes"]
+
+    write_table(pd.DataFrame({"station_id": ["B1"], "city": ["Taipei"]}), path, fmt="parquet")
+    assert tables.table_columns(path) == ["station_id", "city"]
+
+
+def test_iter_table_batches_streams_both_formats(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "bike_timeseries.csv"
+    df = pd.DataFrame({"station_id": [f"B{i}" for i in range(5)], "available_bikes": range(5)})
+    write_table(df, path, fmt="csv")
+    batches = list(tables.iter_table_batches(path, batch_rows=2, columns=["station_id"]))
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert pd.concat(batches)["station_id"].tolist() == df["station_id"].tolist()
+
+    write_table(df, path, fmt="parquet")
+    batches = list(tables.iter_table_batches(path, batch_rows=2))
+    pd.testing.assert_frame_equal(pd.concat(batches, ignore_index=True), df)
+
+
+def test_write_csv_rejects_unknown_engine(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        write_csv(pd.DataFrame({"a": [1]}), tmp_path / "x.csv", engine="spark")
+
+
+def test_write_csv_polars_engine_matches_pandas_bytes(tmp_path: Path) -> None:
+    pytest.importorskip("polars")
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame(
+        {
+            "station_id": ["B1", "B2", None],
+            "ts": pd.to_datetime(["2026-01-01T08:00:00+08:00", None, "2026-01-01T09:00:00+08:00"]),
+            "available_bikes": [3, 5, 0],
+            "rent_proxy": [float("nan"), 1.0, 25.033],
+        }
+    )
+    assert tables._polars_csv_compatible(df)
+    path = write_csv(df, tmp_path / "bike_timeseries.csv", engine="polars")
+    assert path.read_text(encoding="utf-8") == df.to_csv(index=False)
+
+    # Empty strings and exponent-notation floats are written by pandas.
+    for odd in (df.assign(source=["", "tdx", "tdx"]), df.assign(rent_proxy=[1e-5, 1.0, 2.0])):
+        assert not tables._polars_csv_compatible(odd)
+        path = write_csv(odd, tmp_path / "odd.csv", engine="polars")
+        assert path.read_text(encoding="utf-8") == odd.to_csv(index=False)
@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import threading
 from typing import Any
 
 import pytest
 
-from metrobikeatlas.ingestion.tdx_base import TDXClient, TDXCredentials, TDXRequestError, _RateLimiter
+from metrobikeatlas.ingestion.tdx_base import (
+    TDXClient,
+    TDXCredentials,
+    TDXRequestError,
+    _RateLimiter,
+    _Token,
+)
 
 
 def test_rate_limiter_sleeps_to_enforce_min_interval() -> None:
@@ -26,6 +35,63 @@ def test_rate_limiter_sleeps_to_enforce_min_interval() -> None:
     assert slept == [1.0]
 
 
+def test_rate_limiter_reserves_slots_for_concurrent_callers() -> None:
+    slept: list[float] = []
+    limiter = _RateLimiter(
+        min_interval_s=1.0, jitter_s=0.0, now_fn=lambda: 0.0, sleep_fn=slept.append
+    )
+
+    # Three callers arriving at once (e.g. per-city worker threads) start 1s apart.
+    for _ in range(3):
+        limiter.wait()
+    assert slept == [1.0, 2.0]
+
+
+def test_rejected_token_is_refreshed_once() -> None:
+    client = TDXClient(
+        base_url="https://example.com",
+        token_url="https://example.com/token",
+        credentials=TDXCredentials(client_id="x", client_secret="y"),
+    )
+    fetched: list[str] = []
+
+    def fake_fetch_token() -> _Token:
+        fetched.append(f"t{len(fetched)}")
+        expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+        return _Token(access_token=fetched[-1], expires_at=expires_at)
+
+    client._fetch_token = fake_fetch_token  # type: ignore[method-assign]
+    assert client._get_token() == "t0"
+    # Two threads that both got a 401 with "t0": only the first one fetches a new token.
+    assert client._get_token(stale="t0") == "t1"
+    assert client._get_token(stale="t0") == "t1"
+    assert fetched == ["t0", "t1"]
+
+
+def test_concurrent_callers_share_one_token_fetch() -> None:
+    client = TDXClient(
+        base_url="https://example.com",
+        token_url="https://example.com/token",
+        credentials=TDXCredentials(client_id="x", client_secret="y"),
+    )
+    fetched: list[str] = []
+    release = threading.Event()
+
+    def slow_fetch_token() -> _Token:
+        release.wait(timeout=5)
+        fetched.append("t")
+        return _Token(access_token="t", expires_at=datetime.now(timezone.utc) + timedelta(hours=1))
+
+    client._fetch_token = slow_fetch_token  # type: ignore[method-assign]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(client._get_token) for _ in range(8)]
+        release.set()
+        assert [f.result() for f in futures] == ["t"] * 8
+    # Cached until it nears `expires_at`: later calls take the lock-free path.
+    assert client._get_token() == "t"
+    assert fetched == ["t"]
+
+
 def test_get_json_all_returns_list_unchanged() -> None:
     client = TDXClient(
         base_url="https://example.com",
@@ -81,3 +147,49 @@ def test_get_json_all_enforces_max_pages() -> None:
     client.get_json = fake_get_json  # type: ignore[method-assign]
     with pytest.raises(TDXRequestError):
         client.get_json_all("x", max_pages=2)
+
+
+def test_session_reuses_one_sized_connection_pool() -> None:
+    client = TDXClient(
+        base_url="https://example.com",
+        token_url="https://example.com/token",
+        credentials=TDXCredentials(client_id="x", client_secret="y"),
+        pool_maxsize=24,
+    )
+    adapter = client._session.get_adapter("https://example.com/api")
+    # Token and API calls share the adapter, so warm connections are reused for both.
+    assert client._session.get_adapter("https://example.com/token") is adapter
+    assert adapter._pool_maxsize == 24
+    client.close()
+
+
+def test_get_json_reuses_body_buffer_across_responses() -> None:
+    import io
+    import math
+
+    import requests
+
+    client = TDXClient(
+        base_url="https://example.com",
+        token_url="https://example.com/token",
+        credentials=TDXCredentials(client_id="x", client_secret="y"),
+    )
+    client._get_token = lambda stale=None: "t"  # type: ignore[method-assign]
+    bodies = [
+        '[{"StationUID": "TPE1", "StationName": "市府站"}, {"StationUID": "TPE2"}]',
+        '[{"StationUID": "TPE3"}]',
+        '[{"Lat": NaN}]',
+    ]
+
+    def fake_get(url: str, **kwargs: Any) -> requests.Response:
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.raw = io.BytesIO(bodies.pop(0).encode("utf-8"))
+        return resp
+
+    client._session.get = fake_get  # type: ignore[method-assign]
+    assert client.get_json("Bike/Availability/City/Taipei")[0]["StationName"] == "市府站"
+    # A shorter body parsed from the same (larger) buffer must not see stale bytes.
+    assert client.get_json("Bike/Availability/City/Taipei") == [{"StationUID": "TPE3"}]
+    # Non-standard tokens fall back to stdlib `json`, as `resp.json()` would.
+    assert math.isnan(client.get_json("Bike/Availability/City/Taipei")[0]["Lat"])
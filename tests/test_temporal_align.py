@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from metrobikeatlas.preprocessing.temporal_align import (
+    compute_rent_return_proxy,
+    parse_utc_timestamps,
+)
+
+
+def test_rent_return_proxy_is_per_station_and_leaves_input_untouched() -> None:
+    availability = pd.DataFrame(
+        [
+            {"station_id": "B2", "ts": "2026-01-01T00:10:00+00:00", "available_bikes": 10},
+            {"station_id": "B1", "ts": "2026-01-01T00:20:00+00:00", "available_bikes": 4},
+            {"station_id": "B1", "ts": "2026-01-01T00:10:00+00:00", "available_bikes": 5},
+            {"station_id": "B2", "ts": "2026-01-01T00:30:00+00:00", "available_bikes": 13},
+        ]
+    )
+    before = availability.copy()
+
+    out = compute_rent_return_proxy(availability)
+
+    pd.testing.assert_frame_equal(availability, before)
+    assert out["station_id"].tolist() == ["B1", "B1", "B2", "B2"]
+    # The first snapshot of each station has no previous value (no delta across stations).
+    assert out["rent_proxy"].isna().tolist() == [True, False, True, False]
+    assert out["rent_proxy"].tolist()[1::2] == [1.0, 0.0]
+    assert out["return_proxy"].tolist()[1::2] == [0.0, 3.0]
+
+
+def test_rent_return_proxy_polars_engine_matches_pandas() -> None:
+    pytest.importorskip("polars")
+    availability = pd.DataFrame(
+        {
+            "station_id": ["B2", "B1", "B1", "B2", "B1", "B1"],
+            "ts": pd.to_datetime(
+                [
+                    "2026-01-01T08:10:00+08:00",
+                    "2026-01-01T08:20:00+08:00",
+                    "2026-01-01T08:10:00+08:00",
+                    None,
+                    "2026-01-01T08:20:00+08:00",
+                    "2026-01-01T08:30:00+08:00",
+                ]
+            ),
+            "available_bikes": [10, 4, 5, 13, 6, 2],
+        }
+    )
+
+    expected = compute_rent_return_proxy(availability)
+    out = compute_rent_return_proxy(availability, engine="polars")
+    pd.testing.assert_frame_equal(out, expected)
+
+
+def test_rent_return_proxy_rejects_unknown_engine() -> None:
+    with pytest.raises(ValueError):
+        compute_rent_return_proxy(pd.DataFrame(columns=["station_id", "ts"]), engine="spark")
+
+
+def test_rent_return_proxy_matches_groupby_diff() -> None:
+    availability = pd.DataFrame(
+        {
+            "station_id": ["B2", None, "B1", "B1", None, "B2", "B3"],
+            "ts": pd.to_datetime(["2026-01-01T00:00:00+00:00"] * 7)
+            + pd.to_timedelta([3, 1, 2, 1, 2, 1, 1], unit="min"),
+            "available_bikes": [10, 4, 5, 13, 6, 2, 7],
+        }
+    )
+
+    out = compute_rent_return_proxy(availability)
+    expected = availability.sort_values(["station_id", "ts"])
+    delta = expected.groupby("station_id", sort=False)["available_bikes"].diff()
+    pd.testing.assert_series_equal(out["return_proxy"], delta.clip(lower=0), check_names=False)
+    pd.testing.assert_series_equal(out["rent_proxy"], (-delta).clip(lower=0), check_names=False)
+
+
+def test_parse_utc_timestamps_matches_to_datetime() -> None:
+    values = pd.Series(
+        [
+            "2026-01-01T08:00:00+08:00",
+            None,
+            "2026-01-01 01:00:00+00:00",
+            "bad",
+            "2026-01-01T08:00:00+08:00",
+        ],
+        index=[4, 3, 2, 1, 0],
+        name="ts",
+    )
+    expected = pd.to_datetime(values, utc=True, errors="coerce")
+    pd.testing.assert_series_equal(parse_utc_timestamps(values), expected)
+    pd.testing.assert_series_equal(parse_utc_timestamps(expected), expected)